@@ -94,6 +94,7 @@ from .expression_tree.operations.evaluate_python import JaxCooMatrix
 from .expression_tree.operations.jacobian import Jacobian
 from .expression_tree.operations.convert_to_casadi import CasadiConverter
 from .expression_tree.operations.unpack_symbols import SymbolUnpacker
+from .expression_tree.operations.post_order import process_post_order
 
 #
 # Model classes
@@ -203,6 +204,11 @@ from .spatial_methods.scikit_finite_element import ScikitFiniteElement
 #
 from .solvers.solution import Solution, EmptySolution, make_cycle_solution
 from .solvers.processed_variable import ProcessedVariable
+from .solvers.cycle_solution_store import CycleSolutionStore
+from .solvers.casadi_function_cache import (
+    CasadiFunctionCache,
+    casadi_function_cache,
+)
 from .solvers.base_solver import BaseSolver
 from .solvers.dummy_solver import DummySolver
 from .solvers.algebraic_solver import AlgebraicSolver
@@ -237,6 +243,7 @@ from .plotting.dynamic_plot import dynamic_plot
 # Simulation
 #
 from .simulation import Simulation, load_sim, is_notebook
+from .model_cache import ModelCache
 
 #
 # Batch Study
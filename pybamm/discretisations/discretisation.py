@@ -62,6 +62,8 @@ class Discretisation(object):
         self._bcs = {}
         self.y_slices = {}
         self._discretised_symbols = {}
+        self._variables_signature = None
+        self._boundary_conditions_signature = {}
 
     @property
     def mesh(self):
@@ -180,6 +182,7 @@ class Discretisation(object):
         pybamm.logger.verbose(
             "Discretise boundary conditions for {}".format(model.name)
         )
+        self._remove_discretised_symbols_for_changed_bcs(model)
         self._bcs = self.process_boundary_conditions(model)
         pybamm.logger.verbose(
             "Set internal boundary conditions for {}".format(model.name)
@@ -325,8 +328,54 @@ class Discretisation(object):
         # Also keep a record of bounds
         self.bounds = (np.array(lower_bounds), np.array(upper_bounds))
 
-        # reset discretised_symbols
-        self._discretised_symbols = {}
+        # reset discretised_symbols, unless the variables have the same slices,
+        # scales, references and bounds as before (e.g. when discretising a model
+        # again after updating some of its parameter values), in which case the
+        # discretised symbols are still valid
+        variables_signature = [
+            (
+                variable,
+                slices,
+                getattr(variable, "scale", None),
+                getattr(variable, "reference", None),
+                getattr(variable, "bounds", None),
+            )
+            for variable, slices in self.y_slices.items()
+        ]
+        if variables_signature != self._variables_signature:
+            self._discretised_symbols = {}
+        self._variables_signature = variables_signature
+
+    def _remove_discretised_symbols_for_changed_bcs(self, model):
+        """
+        Remove the discretised symbols that may depend on boundary conditions of the
+        model that have changed since the last model was discretised, keeping all
+        the others. The discretisation of a spatial operator depends on the boundary
+        conditions of its child, so the discretised symbols that contain a symbol
+        whose boundary conditions have changed are removed.
+        """
+        signature = {
+            var: {side: (bc[0], bc[1]) for side, bc in bcs.items()}
+            for var, bcs in model.boundary_conditions.items()
+        }
+        changed = {
+            var
+            for var in set(signature) | set(self._boundary_conditions_signature)
+            if signature.get(var) != self._boundary_conditions_signature.get(var)
+        }
+        self._boundary_conditions_signature = signature
+        if not changed or not self._discretised_symbols:
+            return
+
+        depends_on_changed = {}
+        for symbol in list(self._discretised_symbols):
+            if pybamm.process_post_order(
+                symbol,
+                depends_on_changed,
+                lambda node: node in changed
+                or any(depends_on_changed[child] for child in node.children),
+            ):
+                del self._discretised_symbols[symbol]
 
     def _get_variable_size(self, variable):
         """Helper function to determine what size a variable should be"""
@@ -720,37 +769,60 @@ class Discretisation(object):
         try:
             return self._discretised_symbols[symbol]
         except KeyError:
-            discretised_symbol = self._process_symbol(symbol)
-            self._discretised_symbols[symbol] = discretised_symbol
-            discretised_symbol.test_shape()
+            # Boundary conditions on tabs are checked against the outermost symbol
+            # first
+            self._check_tabs(symbol)
+            return pybamm.process_post_order(
+                symbol,
+                self._discretised_symbols,
+                self._discretise_symbol,
+                children=self._children_to_discretise,
+            )
 
-            # Assign mesh as an attribute to the processed variable
-            if symbol.domain != []:
-                discretised_symbol.mesh = self.mesh[symbol.domain]
-            else:
-                discretised_symbol.mesh = None
+    @staticmethod
+    def _children_to_discretise(symbol):
+        """
+        Nodes to discretise before `symbol`. Averages and concatenations of variables
+        discretise new symbols made from their children instead.
+        """
+        if isinstance(symbol, (pybamm._BaseAverage, pybamm.ConcatenationVariable)):
+            return []
+        return symbol.children
+
+    def _check_tabs(self, symbol):
+        """If boundary conditions are provided, check for boundary conditions on tabs"""
+        if symbol.domain != [] and self.bcs:
+            key_id = list(self.bcs.keys())[0]
+            if any("tab" in side for side in list(self.bcs[key_id].keys())):
+                self.bcs[key_id] = self.check_tab_conditions(symbol, self.bcs[key_id])
+
+    def _discretise_symbol(self, symbol):
+        """
+        Discretise a symbol whose children have already been discretised, see
+        :meth:`Discretisation.process_symbol()`.
+        """
+        discretised_symbol = self._process_symbol(symbol)
+        discretised_symbol.test_shape()
 
-            # Assign secondary mesh
-            if symbol.domains["secondary"] != []:
-                discretised_symbol.secondary_mesh = self.mesh[
-                    symbol.domains["secondary"]
-                ]
-            else:
-                discretised_symbol.secondary_mesh = None
-            return discretised_symbol
+        # Assign mesh as an attribute to the processed variable
+        if symbol.domain != []:
+            discretised_symbol.mesh = self.mesh[symbol.domain]
+        else:
+            discretised_symbol.mesh = None
+
+        # Assign secondary mesh
+        if symbol.domains["secondary"] != []:
+            discretised_symbol.secondary_mesh = self.mesh[symbol.domains["secondary"]]
+        else:
+            discretised_symbol.secondary_mesh = None
+        return discretised_symbol
 
     def _process_symbol(self, symbol):
         """See :meth:`Discretisation.process_symbol()`."""
 
         if symbol.domain != []:
             spatial_method = self.spatial_methods[symbol.domain[0]]
-            # If boundary conditions are provided, need to check for BCs on tabs
-            if self.bcs:
-                key_id = list(self.bcs.keys())[0]
-                if any("tab" in side for side in list(self.bcs[key_id].keys())):
-                    self.bcs[key_id] = self.check_tab_conditions(
-                        symbol, self.bcs[key_id]
-                    )
+            self._check_tabs(symbol)
 
         if isinstance(symbol, pybamm.BinaryOperator):
             # Pre-process children
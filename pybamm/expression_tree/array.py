@@ -119,6 +119,10 @@ class Array(pybamm.Symbol):
         """See :meth:`pybamm.Symbol._base_evaluate()`."""
         return self._entries
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        return self._entries.shape
+
     def is_constant(self):
         """See :meth:`pybamm.Symbol.is_constant()`."""
         return True
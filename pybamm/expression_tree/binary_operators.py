@@ -113,6 +113,18 @@ class BinaryOperator(pybamm.Symbol):
         right = self.children[1].evaluate_for_shape()
         return self._binary_evaluate(left, right)
 
+    def _static_shape(self, shape_of):
+        """
+        See :meth:`pybamm.Symbol._static_shape()`. By default, the shapes of the
+        children are broadcast together as in numpy.
+        """
+        left = shape_of(self.children[0])
+        right = shape_of(self.children[1])
+        try:
+            return np.broadcast_shapes(left, right)
+        except ValueError:
+            raise ValueError(f"inconsistent shapes {left} and {right}")
+
     def _binary_jac(self, left_jac, right_jac):
         """Calculate the Jacobian of a binary operator."""
         raise NotImplementedError
@@ -313,6 +325,16 @@ class MatrixMultiplication(BinaryOperator):
         """See :meth:`pybamm.BinaryOperator._binary_evaluate()`."""
         return left @ right
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        left = shape_of(self.children[0])
+        right = shape_of(self.children[1])
+        if len(left) != 2 or len(right) != 2:
+            return None
+        if left[1] != right[0]:
+            raise ValueError(f"dimension mismatch: {left} @ {right}")
+        return (left[0], right[1])
+
     def _sympy_operator(self, left, right):
         """Override :meth:`pybamm.BinaryOperator._sympy_operator`"""
         left = sympy.Matrix(left)
@@ -458,6 +480,11 @@ class Equality(BinaryOperator):
         """See :meth:`pybamm.BinaryOperator._binary_evaluate()`."""
         return int(left == right)
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        # The result is a number, but only if the children can be compared
+        return None
+
     def _binary_new_copy(self, left, right):
         """See :meth:`pybamm.BinaryOperator._binary_new_copy()`."""
         return pybamm.Equality(left, right)
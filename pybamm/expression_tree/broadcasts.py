@@ -146,6 +146,12 @@ class PrimaryBroadcast(Broadcast):
         vec = pybamm.evaluate_for_shape_using_domain(self.domains["primary"])
         return np.outer(child_eval, vec).reshape(-1, 1)
 
+    def _static_shape_for_testing(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape_for_testing()`."""
+        child_size = int(np.prod(shape_of(self.children[0])))
+        vec_size = pybamm.shape_using_domain(self.domains["primary"])[0]
+        return (child_size * vec_size, 1)
+
     def reduce_one_dimension(self):
         """Reduce the broadcast by one dimension."""
         return self.orphans[0]
@@ -270,6 +276,12 @@ class SecondaryBroadcast(Broadcast):
         vec = pybamm.evaluate_for_shape_using_domain(self.domains["secondary"])
         return np.outer(vec, child_eval).reshape(-1, 1)
 
+    def _static_shape_for_testing(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape_for_testing()`."""
+        child_size = int(np.prod(shape_of(self.children[0])))
+        vec_size = pybamm.shape_using_domain(self.domains["secondary"])[0]
+        return (child_size * vec_size, 1)
+
     def reduce_one_dimension(self):
         """Reduce the broadcast by one dimension."""
         return self.orphans[0]
@@ -379,6 +391,12 @@ class TertiaryBroadcast(Broadcast):
         vec = pybamm.evaluate_for_shape_using_domain(self.domains["tertiary"])
         return np.outer(vec, child_eval).reshape(-1, 1)
 
+    def _static_shape_for_testing(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape_for_testing()`."""
+        child_size = int(np.prod(shape_of(self.children[0])))
+        vec_size = pybamm.shape_using_domain(self.domains["tertiary"])[0]
+        return (child_size * vec_size, 1)
+
     def reduce_one_dimension(self):
         """Reduce the broadcast by one dimension."""
         raise NotImplementedError
@@ -450,6 +468,12 @@ class FullBroadcast(Broadcast):
 
         return child_eval * vec
 
+    def _static_shape_for_testing(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape_for_testing()`."""
+        return np.broadcast_shapes(
+            shape_of(self.children[0]), pybamm.shape_using_domain(self.domains)
+        )
+
     def reduce_one_dimension(self):
         """Reduce the broadcast by one dimension."""
         if self.domains["secondary"] == []:
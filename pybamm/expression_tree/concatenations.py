@@ -129,6 +129,18 @@ class Concatenation(pybamm.Symbol):
                 [child.evaluate_for_shape() for child in self.children]
             )
 
+    def _static_shape(self, shape_of):
+        """
+        See :meth:`pybamm.Symbol._static_shape()`. The children are stacked along their
+        first dimension.
+        """
+        if len(self.children) == 0:
+            return (0,)
+        shapes = [shape_of(child) for child in self.children]
+        if any(len(shape) != 2 or shape[1] != shapes[0][1] for shape in shapes):
+            return None
+        return (sum(shape[0] for shape in shapes), shapes[0][1])
+
     def is_constant(self):
         """See :meth:`pybamm.Symbol.is_constant()`."""
         return all(child.is_constant() for child in self.children)
@@ -248,6 +248,13 @@ class SpecificFunction(Function):
         """See :meth:`pybamm.Function._function_new_copy()`"""
         return pybamm.simplify_if_constant(self.__class__(*children))
 
+    def _static_shape(self, shape_of):
+        """
+        See :meth:`pybamm.Symbol._static_shape()`. Specific functions are applied
+        elementwise, so have the same shape as their child.
+        """
+        return shape_of(self.children[0])
+
     def _sympy_operator(self, child):
         """Apply appropriate SymPy operators."""
         class_name = self.__class__.__name__.lower()
@@ -405,6 +412,10 @@ class Max(SpecificFunction):
         # Max will always return a scalar
         return np.nan * np.ones((1, 1))
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        return None
+
 
 def max(child):
     """
@@ -425,6 +436,10 @@ class Min(SpecificFunction):
         # Min will always return a scalar
         return np.nan * np.ones((1, 1))
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        return None
+
 
 def min(child):
     """
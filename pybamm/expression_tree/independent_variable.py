@@ -75,6 +75,10 @@ class Time(IndependentVariable):
         """
         return 0
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        return ()
+
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
         return sympy.Symbol("t")
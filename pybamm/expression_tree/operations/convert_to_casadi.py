@@ -4,10 +4,17 @@
 import pybamm
 import casadi
 import numpy as np
+from collections import OrderedDict
 from scipy import special
 
 
 class CasadiConverter(object):
+    # CasADi lookup tables for interpolants, shared between all the converters and
+    # keyed by the interpolator and the data, so that the tables for large data sets
+    # (e.g. drive cycles) and their spline coefficients are only set up once
+    _lookup_tables = OrderedDict()
+    _max_lookup_tables = 64
+
     def __init__(self, casadi_symbols=None):
         self._casadi_symbols = casadi_symbols or {}
 
@@ -15,8 +22,8 @@ class CasadiConverter(object):
 
     def convert(self, symbol, t, y, y_dot, inputs):
         """
-        This function recurses down the tree, converting the PyBaMM expression tree to
-        a CasADi expression tree
+        This function goes down the tree (see :func:`pybamm.process_post_order`),
+        converting the PyBaMM expression tree to a CasADi expression tree
 
         Parameters
         ----------
@@ -41,10 +48,11 @@ class CasadiConverter(object):
         except KeyError:
             # Change inputs to empty dictionary if it's None
             inputs = inputs or {}
-            casadi_symbol = self._convert(symbol, t, y, y_dot, inputs)
-            self._casadi_symbols[symbol] = casadi_symbol
-
-            return casadi_symbol
+            return pybamm.process_post_order(
+                symbol,
+                self._casadi_symbols,
+                lambda node: self._convert(node, t, y, y_dot, inputs),
+            )
 
     def _convert(self, symbol, t, y, y_dot, inputs):
         """See :meth:`CasadiConverter.convert()`."""
@@ -147,14 +155,10 @@ class CasadiConverter(object):
                         "Unknown interpolator: {0}".format(symbol.interpolator)
                     )
 
+                LUT = self._lookup_table(symbol, solver)
                 if len(converted_children) == 1:
-                    return casadi.interpolant(
-                        "LUT", solver, symbol.x, symbol.y.flatten()
-                    )(*converted_children)
+                    return LUT(*converted_children)
                 elif len(converted_children) in [2, 3]:
-                    LUT = casadi.interpolant(
-                        "LUT", solver, symbol.x, symbol.y.ravel(order="F")
-                    )
                     res = LUT(casadi.hcat(converted_children).T).T
                     return res
                 else:  # pragma: no cover
@@ -215,3 +219,42 @@ class CasadiConverter(object):
                     type(symbol)
                 )
             )
+
+    def _lookup_table(self, symbol, solver):
+        """
+        Get the CasADi lookup table for an interpolant, creating it if there is no
+        table for the same interpolator and data yet. Uniform grids are looked up by
+        floored division (O(1)) rather than by searching the grid.
+        """
+        key = (solver, symbol.entries_string)
+        if key in self._lookup_tables:
+            self._lookup_tables.move_to_end(key)
+            return self._lookup_tables[key]
+
+        if len(symbol.x) == 1:
+            y = symbol.y.flatten()
+        else:
+            y = symbol.y.ravel(order="F")
+        LUT = None
+        if solver == "linear" and any(_is_uniform(x) for x in symbol.x):
+            lookup_mode = ["exact" if _is_uniform(x) else "auto" for x in symbol.x]
+            try:
+                LUT = casadi.interpolant(
+                    "LUT", solver, symbol.x, y, {"lookup_mode": lookup_mode}
+                )
+            except RuntimeError:
+                # CasADi's check that the grid is uniform is stricter than ours
+                pass
+        if LUT is None:
+            LUT = casadi.interpolant("LUT", solver, symbol.x, y)
+
+        self._lookup_tables[key] = LUT
+        if len(self._lookup_tables) > self._max_lookup_tables:
+            self._lookup_tables.popitem(last=False)
+        return LUT
+
+
+def _is_uniform(x):
+    """Whether the points of a grid are equally spaced"""
+    dx = np.diff(x)
+    return len(dx) > 1 and np.allclose(dx, dx[0], rtol=1e-10, atol=0)
@@ -24,7 +24,8 @@ class Jacobian(object):
 
     def jac(self, symbol, variable):
         """
-        This function recurses down the tree, computing the Jacobian using
+        This function goes down the tree (see :func:`pybamm.process_post_order`),
+        computing the Jacobian using
         the Jacobians defined in classes derived from pybamm.Symbol. E.g. the
         Jacobian of a 'pybamm.Multiplication' is computed via the product rule.
         If the Jacobian of a symbol has already been calculated, the stored value
@@ -48,9 +49,27 @@ class Jacobian(object):
         try:
             return self._known_jacs[symbol]
         except KeyError:
-            jac = self._jac(symbol, variable)
-            self._known_jacs[symbol] = jac
-            return jac
+            return pybamm.process_post_order(
+                symbol,
+                self._known_jacs,
+                lambda node: self._jac(node, variable),
+                children=self._children_to_differentiate,
+            )
+
+    @staticmethod
+    def _children_to_differentiate(symbol):
+        """Nodes whose Jacobian is needed to calculate the Jacobian of `symbol`."""
+        if isinstance(
+            symbol,
+            (
+                pybamm.BinaryOperator,
+                pybamm.UnaryOperator,
+                pybamm.Function,
+                pybamm.Concatenation,
+            ),
+        ):
+            return symbol.children
+        return []
 
     def _jac(self, symbol, variable):
         """See :meth:`Jacobian.jac()`."""
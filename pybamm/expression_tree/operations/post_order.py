@@ -0,0 +1,70 @@
+#
+# Process an expression tree in post-order, without recursion
+#
+import pybamm
+
+
+def process_post_order(symbol, memo, process, children=None):
+    """
+    Process a symbol and the nodes below it in post-order (i.e. the children of a node
+    are processed before the node itself), using an explicit stack instead of
+    recursion so that deep expression trees do not reach Python's recursion limit.
+
+    This is the traversal shared by the passes over expression trees (e.g.
+    :meth:`pybamm.ParameterValues.process_symbol`,
+    :meth:`pybamm.Discretisation.process_symbol`,
+    :meth:`pybamm.CasadiConverter.convert`, :meth:`pybamm.Jacobian.jac` and
+    :meth:`pybamm.SymbolUnpacker.unpack_symbol`). When a node is processed, the
+    results for its children are already in `memo`, so the pass can look them up
+    through its usual (memoised) entry point without recursing any further.
+
+    Parameters
+    ----------
+    symbol : :class:`pybamm.Symbol`
+        The symbol to process
+    memo : dict
+        The results of the pass so far, keyed by node. Nodes that are already in
+        `memo` are not processed again, and neither are the nodes below them. The
+        result for each newly processed node is added to `memo`.
+    process : callable
+        Function that takes a node, whose children (see `children`) have already
+        been processed, and returns the result for that node
+    children : callable, optional
+        Function that takes a node and returns the nodes that should be processed
+        before it. Default is the children of the node. Nodes for which the pass
+        decides whether (or how) to process the children itself should return an
+        empty list.
+
+    Returns
+    -------
+    object
+        The result for `symbol`
+    """
+    if children is None:
+        children = _children
+
+    # Each entry is a node and whether the nodes below it have been added to the
+    # stack already
+    stack = [(symbol, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node in memo:
+            # e.g. a node that appears more than once in the tree
+            continue
+        if expanded:
+            memo[node] = process(node)
+        else:
+            stack.append((node, True))
+            # Add the children in reverse order so that they are processed from
+            # left to right, as they would be when recursing
+            for child in reversed(children(node)):
+                if child not in memo:
+                    stack.append((child, False))
+
+    return memo[symbol]
+
+
+def _children(symbol):
+    if isinstance(symbol, pybamm.Symbol):
+        return symbol.children
+    return []
@@ -1,6 +1,7 @@
 #
 # Helper function to unpack a symbol
 #
+import pybamm
 
 
 class SymbolUnpacker(object):
@@ -43,8 +44,9 @@ class SymbolUnpacker(object):
 
     def unpack_symbol(self, symbol):
         """
-        This function recurses down the tree, unpacking the symbols and saving the ones
-        that have a class in `self.classes_to_find`.
+        This function goes down the tree (see :func:`pybamm.process_post_order`),
+        unpacking the symbols and saving the ones that have a class in
+        `self.classes_to_find`.
 
         Parameters
         ----------
@@ -60,9 +62,18 @@ class SymbolUnpacker(object):
         try:
             return self._unpacked_symbols[symbol]
         except KeyError:
-            unpacked = self._unpack(symbol)
-            self._unpacked_symbols[symbol] = unpacked
-            return unpacked
+            return pybamm.process_post_order(
+                symbol,
+                self._unpacked_symbols,
+                self._unpack,
+                children=self._children_to_unpack,
+            )
+
+    def _children_to_unpack(self, symbol):
+        """Nodes to unpack before `symbol`."""
+        if isinstance(symbol, self.classes_to_find):
+            return []
+        return symbol.children
 
     def _unpack(self, symbol):
         """See :meth:`SymbolUnpacker.unpack()`."""
@@ -79,7 +90,7 @@ class SymbolUnpacker(object):
             # iterate over all children
             found_vars = set()
             for child in children:
-                # call back unpack_symbol to cache values
+                # call back unpack_symbol to get the cached values
                 child_vars = self.unpack_symbol(child)
                 found_vars.update(child_vars)
             return found_vars
@@ -194,6 +194,10 @@ class StateVectorBase(pybamm.Symbol):
         """
         return np.nan * np.ones((self.size, 1))
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        return (self.size, 1)
+
 
 class StateVector(StateVectorBase):
     """
@@ -2,6 +2,8 @@
 # Base Symbol Class for the expression tree
 #
 import numbers
+import weakref
+from operator import attrgetter
 
 import anytree
 import numpy as np
@@ -16,6 +18,10 @@ from pybamm.expression_tree.printing.print_name import prettify_print_name
 DOMAIN_LEVELS = ["primary", "secondary", "tertiary", "quaternary"]
 EMPTY_DOMAINS = {k: [] for k in DOMAIN_LEVELS}
 
+# Nodes that have been used as children while `pybamm.settings.intern_symbols` is
+# True, keyed by `_intern_key`. Nodes are removed once nothing else refers to them
+_interned_symbols = weakref.WeakValueDictionary()
+
 
 def domain_size(domain):
     """
@@ -58,11 +64,111 @@ def evaluate_for_shape_using_domain(domains, typ="vector"):
     Return a vector of the appropriate shape, based on the domains.
     Domain 'sizes' can clash, but are unlikely to, and won't cause failures if they do.
     """
+    return create_object_of_size(_domains_size(domains), typ)
+
+
+def shape_using_domain(domains, typ="vector"):
+    """
+    Return the shape of the object given by :func:`evaluate_for_shape_using_domain`,
+    without creating it.
+    """
+    size = _domains_size(domains)
+    if typ == "vector":
+        return (size, 1)
+    elif typ == "matrix":
+        return (size, size)
+
+
+def _domains_size(domains):
     if isinstance(domains, dict):
-        _domain_sizes = int(np.prod([domain_size(dom) for dom in domains.values()]))
+        return int(np.prod([domain_size(dom) for dom in domains.values()]))
     else:
-        _domain_sizes = domain_size(domains)
-    return create_object_of_size(_domain_sizes, typ)
+        return domain_size(domains)
+
+
+def _intern(symbol):
+    """
+    Return the interned node that is identical to `symbol`, or intern `symbol` if there
+    is none (see :attr:`pybamm.Settings.intern_symbols`)
+    """
+    # Discretised variables carry their mesh, which is not part of the id, so they
+    # are kept as they are
+    if not isinstance(symbol, Symbol) or hasattr(symbol, "mesh"):
+        return symbol
+    key = _intern_key(symbol)
+    interned = _interned_symbols.get(key)
+    # The interned node may have been modified since it was interned, in which case
+    # it is replaced
+    if (
+        interned is not None
+        and type(interned) is type(symbol)
+        and _intern_key(interned) == key
+    ):
+        return interned
+    _interned_symbols[key] = symbol
+    return symbol
+
+
+def _intern_key(symbol):
+    """
+    A hash of `symbol` which, unlike its id, also depends on the attributes that are
+    changed without changing the id (e.g. the scale of variables when parameters are
+    processed, or the expected size of input parameters when they are discretised)
+    """
+    key = _cached_intern_key(symbol)
+    if key is not None:
+        return key
+    # The keys of the nodes below `symbol` are built first, without recursing, so that
+    # deep trees do not reach the recursion limit. The key of each node is cached on
+    # the node, which also serves as the memo of the traversal
+    return pybamm.process_post_order(
+        symbol, _InternKeyMemo(), _build_intern_key, _intern_key_dependencies
+    )
+
+
+def _cached_intern_key(symbol):
+    cached = symbol.__dict__.get("_intern_key")
+    if cached is not None and cached[0] == symbol.id:
+        return cached[1]
+
+
+def _intern_key_dependencies(symbol):
+    dependencies = list(symbol.children)
+    if isinstance(symbol, pybamm.VariableBase):
+        dependencies += [symbol.scale, symbol.reference]
+    elif isinstance(symbol, pybamm.SizeAverage):
+        dependencies.append(symbol.f_a_dist)
+    return dependencies
+
+
+def _build_intern_key(symbol):
+    state = [symbol.id] + [
+        _cached_intern_key(dependency)
+        for dependency in _intern_key_dependencies(symbol)
+    ]
+    if isinstance(symbol, pybamm.InputParameter):
+        state.append(symbol._expected_size)
+    key = hash(tuple(state))
+    symbol._intern_key = (symbol.id, key)
+    return key
+
+
+class _InternKeyMemo:
+    """
+    Memo for :func:`pybamm.process_post_order` that looks up the key cached on each
+    node, rather than keying nodes by their id (which nodes with different intern
+    keys can share)
+    """
+
+    def __contains__(self, symbol):
+        return _cached_intern_key(symbol) is not None
+
+    def __getitem__(self, symbol):
+        return _cached_intern_key(symbol)
+
+    def __setitem__(self, symbol, key):
+        # already cached on the node by `_build_intern_key`
+        pass
 
 
 def is_constant(symbol):
@@ -213,6 +319,8 @@ class Symbol:
 
         if children is None:
             children = []
+        elif pybamm.settings.intern_symbols:
+            children = [_intern(child) for child in children]
 
         self._children = children
         # Keep a separate "oprhans" attribute for backwards compatibility
@@ -903,8 +1011,14 @@ class Symbol:
     @cached_property
     def shape(self):
         """
-        Shape of an object, found by evaluating it with appropriate t and y.
+        Shape of an object, found from the shapes of its children if its class has a
+        rule for it (see :meth:`Symbol._static_shape`), and otherwise by evaluating it
+        with appropriate t and y.
         """
+        static_shape = self._static_shape(attrgetter("shape"))
+        if static_shape is not None:
+            return static_shape
+
         # Default behaviour is to try to evaluate the object directly
         # Try with some large y, to avoid having to unpack (slow)
         try:
@@ -939,11 +1053,47 @@ class Symbol:
         cannot be evaluated directly (e.g. it is a `Variable` or `Parameter`), it is
         instead given an arbitrary domain-dependent shape.
         """
-        evaluated_self = self.evaluate_for_shape()
-        if isinstance(evaluated_self, numbers.Number):
-            return ()
-        else:
-            return evaluated_self.shape
+        try:
+            return self._saved_shape_for_testing
+        except AttributeError:
+            pass
+
+        shape = self._static_shape_for_testing(attrgetter("shape_for_testing"))
+        if shape is None:
+            evaluated_self = self.evaluate_for_shape()
+            if isinstance(evaluated_self, numbers.Number):
+                shape = ()
+            else:
+                shape = evaluated_self.shape
+        self._saved_shape_for_testing = shape
+        return shape
+
+    def _static_shape(self, shape_of):
+        """
+        Shape of the node, found from the shapes of its children using the rules of
+        its operator instead of evaluating it. Returns None if the class has no such
+        rule, in which case the shape is found by evaluation.
+
+        Parameters
+        ----------
+        shape_of : callable
+            Returns the shape of a child (either its `shape` or its
+            `shape_for_testing`)
+
+        Raises
+        ------
+        ValueError
+            If the shapes of the children are not compatible
+        """
+        return None
+
+    def _static_shape_for_testing(self, shape_of):
+        """
+        Same as :meth:`Symbol._static_shape`, but for :attr:`shape_for_testing`, i.e.
+        also for symbols that cannot be evaluated directly. Default behaviour is to use
+        :meth:`Symbol._static_shape`.
+        """
+        return self._static_shape(shape_of)
 
     @property
     def ndim_for_testing(self):
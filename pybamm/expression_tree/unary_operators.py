@@ -69,6 +69,13 @@ class UnaryOperator(pybamm.Symbol):
         """
         return self.children[0].evaluate_for_shape()
 
+    def _static_shape(self, shape_of):
+        """
+        See :meth:`pybamm.Symbol._static_shape()`. By default, a unary operator has the
+        same shape as its child.
+        """
+        return shape_of(self.children[0])
+
     def _evaluates_on_edges(self, dimension):
         """See :meth:`pybamm.Symbol._evaluates_on_edges()`."""
         return self.child.evaluates_on_edges(dimension)
@@ -312,6 +319,14 @@ class Index(UnaryOperator):
     def _evaluate_for_shape(self):
         return self._unary_evaluate(self.children[0].evaluate_for_shape())
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        child_shape = shape_of(self.children[0])
+        if len(child_shape) == 0:
+            return None
+        n_rows = len(range(*self.slice.indices(child_shape[0])))
+        return (n_rows,) + child_shape[1:]
+
     def _evaluates_on_edges(self, dimension):
         """See :meth:`pybamm.Symbol._evaluates_on_edges()`."""
         return False
@@ -344,6 +359,11 @@ class SpatialOperator(UnaryOperator):
         # We shouldn't need this
         raise NotImplementedError
 
+    def _static_shape(self, shape_of):
+        """See :meth:`pybamm.Symbol._static_shape()`."""
+        # Spatial operators change shape when they are discretised
+        return None
+
 
 class Gradient(SpatialOperator):
     """
@@ -921,6 +941,10 @@ class ExplicitTimeIntegral(UnaryOperator):
     def _unary_new_copy(self, child):
         return self.__class__(child, self.initial_condition)
 
+    def _static_shape(self, shape_of):
+        # Explicit time integrals cannot be evaluated directly
+        return None
+
     def is_constant(self):
         return False
 
@@ -0,0 +1,287 @@
+#
+# On-disk cache of built models
+#
+import functools
+import hashlib
+import inspect
+import numbers
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+import pybamm
+
+
+class ModelCache:
+    """
+    A content-addressed on-disk cache of built (parameterised and discretised)
+    models, which can be passed to :class:`pybamm.Simulation` to avoid processing
+    parameters and discretising the model again in every new process.
+
+    The key of each entry is a hash of the model, the parameter values, geometry,
+    submesh types, number of points, spatial methods, the experiment (if any),
+    PyBaMM settings that affect the model (e.g. smoothing) and the PyBaMM version.
+    Parameters that are :class:`pybamm.InputParameter` only contribute their name,
+    so the cached model can be solved for any value of the inputs. The model is
+    described by its class, submodels and options as well as its equations, initial
+    and boundary conditions, variables and events, so that custom models and models
+    that are changed after they have been created get their own key.
+
+    Once the total size of the cache exceeds `max_size`, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory in which to store the cache. Default is
+        "~/.cache/pybamm/models".
+    max_size : int, optional
+        The maximum size of the cache, in bytes. Default is 1 GB.
+    """
+
+    def __init__(self, directory=None, max_size=int(1e9)):
+        self.directory = directory or os.path.join(
+            os.path.expanduser("~"), ".cache", "pybamm", "models"
+        )
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(self, model, parameter_values, **kwargs):
+        """
+        Get the key of a built model in the cache.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The unprocessed model
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values used to process the model
+        **kwargs
+            Anything else that determines the built model (e.g. geometry, submesh
+            types, number of points, spatial methods)
+
+        Returns
+        -------
+        str or None
+            The key (a hexadecimal hash), or None if the contents cannot be
+            represented stably (e.g. a function parameter that is a closure over an
+            arbitrary object), in which case the model is not cached
+        """
+        model_class = type(model)
+        model_description = {
+            "class": f"{model_class.__module__}.{model_class.__qualname__}",
+            "name": model.name,
+            "options": getattr(model, "options", None),
+            "submodels": {
+                name: type(submodel) for name, submodel in model.submodels.items()
+            },
+            "rhs": model.rhs,
+            "algebraic": model.algebraic,
+            "initial conditions": model.initial_conditions,
+            "boundary conditions": model.boundary_conditions,
+            "variables": model.variables,
+            "events": [
+                [event.name, event.expression, event.event_type.name]
+                for event in model.events
+            ],
+        }
+        settings = {
+            "simplify": pybamm.settings.simplify,
+            "min_smoothing": pybamm.settings.min_smoothing,
+            "max_smoothing": pybamm.settings.max_smoothing,
+            "heaviside_smoothing": pybamm.settings.heaviside_smoothing,
+            "abs_smoothing": pybamm.settings.abs_smoothing,
+        }
+        contents = {
+            "version": pybamm.__version__,
+            "settings": settings,
+            "model": model_description,
+            "parameter values": dict(parameter_values.items()),
+            **kwargs,
+        }
+        try:
+            contents_repr = _stable_repr(contents, {})
+        except (_UnstableReprError, RecursionError) as e:
+            pybamm.logger.info(f"Model will not be cached: {e}")
+            return None
+        return hashlib.sha256(contents_repr.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, key):
+        """
+        Load an entry from the cache.
+
+        Parameters
+        ----------
+        key : str or None
+            The key of the entry. If None, nothing is loaded.
+
+        Returns
+        -------
+        object or None
+            The cached entry, or None if the key is not in the cache
+        """
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt or incompatible entry is treated as a miss
+            pybamm.logger.warning(f"Could not load cached model {key}: {e}")
+            return None
+        # Mark the entry as recently used
+        os.utime(path)
+        pybamm.logger.info(f"Loaded cached model {key}")
+        return entry
+
+    def save(self, key, entry):
+        """
+        Save an entry to the cache, then evict the least recently used entries if
+        the cache is too large.
+
+        Parameters
+        ----------
+        key : str or None
+            The key of the entry. If None, nothing is saved.
+        entry : object
+            The entry to save, which must be pickle-able
+        """
+        if key is None:
+            return
+        # Write to a temporary file first, so that other processes never see a
+        # partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            os.remove(tmp_path)
+            pybamm.logger.warning(f"Could not cache model {key}: {e}")
+            return
+        pybamm.logger.info(f"Cached model {key}")
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the total size of the cache is
+        at most `max_size`.
+        """
+        entries = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".pkl"):
+                path = os.path.join(self.directory, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:  # pragma: no cover
+                    # removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # pragma: no cover
+                pass
+            total_size -= size
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".pkl"):
+                os.remove(os.path.join(self.directory, filename))
+
+
+def _stable_repr(obj, memo=None):
+    """
+    A string representation of `obj` that is the same across processes (unlike
+    `hash` or :meth:`pybamm.Symbol.id`), used to create cache keys. `memo` holds
+    the representations of the symbols processed so far (see
+    :func:`_stable_repr_symbol`).
+    """
+    if obj is None or isinstance(obj, (str, bool, numbers.Number)):
+        return repr(obj)
+    elif isinstance(obj, dict):
+        items = sorted(
+            (_stable_repr(key, memo), _stable_repr(value, memo))
+            for key, value in obj.items()
+        )
+        return "{" + ", ".join(f"{key}: {value}" for key, value in items) + "}"
+    elif isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(x, memo) for x in obj) + "]"
+    elif isinstance(obj, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return f"array({obj.dtype}, {obj.shape}, {digest})"
+    elif isinstance(obj, pybamm.Symbol):
+        return _stable_repr_symbol(obj, memo)
+    elif inspect.isclass(obj):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    elif isinstance(obj, functools.partial):
+        return "partial" + _stable_repr([obj.func, obj.args, obj.keywords], memo)
+    elif inspect.ismethod(obj):
+        return _stable_repr([obj.__self__, obj.__func__], memo)
+    elif callable(obj) and hasattr(obj, "__code__"):
+        # functions are identified by their source code, if available, and the
+        # values they depend on other than their arguments
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = obj.__code__.co_code.hex()
+        closure = []
+        for cell in obj.__closure__ or []:
+            try:
+                closure.append(cell.cell_contents)
+            except ValueError:  # pragma: no cover
+                # empty cell
+                closure.append("<empty>")
+        values = _stable_repr([obj.__defaults__, obj.__kwdefaults__, closure], memo)
+        return f"{obj.__module__}.{obj.__qualname__}({source}, {values})"
+    elif hasattr(obj, "__dict__"):
+        # e.g. mesh generators and spatial methods
+        return _stable_repr(type(obj)) + _stable_repr(vars(obj), memo)
+    else:
+        obj_repr = repr(obj)
+        if " at 0x" in obj_repr:
+            # the default representation depends on the memory address
+            raise _UnstableReprError(f"{obj_repr} cannot be represented stably")
+        return obj_repr
+
+
+class _UnstableReprError(Exception):
+    pass
+
+
+def _stable_repr_symbol(symbol, memo=None):
+    """
+    A hash of the expression tree of `symbol`, built from the type, name, domains
+    and values of each node and the hashes of its children. `memo` holds the hashes
+    of the nodes processed so far, so that subtrees shared between expressions are
+    only processed once.
+    """
+    if memo is None:
+        memo = {}
+
+    def process(node):
+        node_repr = [type(node).__name__, node.name, node.domains]
+        if isinstance(node, pybamm.Interpolant):
+            node_repr += [node.x, node.y, node.interpolator, node.extrapolate]
+        elif isinstance(node, pybamm.Array):
+            node_repr.append(node.evaluate())
+        elif isinstance(node, pybamm.Scalar):
+            node_repr.append(node.value)
+        elif isinstance(node, pybamm.FunctionParameter):
+            node_repr.append(node.input_names)
+        node_repr.append([memo[child] for child in node.children])
+        return hashlib.sha256(_stable_repr(node_repr).encode()).hexdigest()
+
+    return pybamm.process_post_order(symbol, memo, process)
@@ -2,6 +2,7 @@
 # A model to calculate electrode-specific SOH
 #
 import pybamm
+import casadi
 import numpy as np
 from functools import lru_cache
 import warnings
@@ -141,6 +142,12 @@ class ElectrodeSOHSolver:
     """
     Class used to check if the electrode SOH model is feasible, and solve it if it is.
 
+    The electrode SOH model is first solved with a CasADi Newton solver, which is
+    set up once and warm-started from the previous solution (e.g. the previous
+    cycle of an experiment). If that fails, the model is solved with a
+    :class:`pybamm.Simulation` instead, which also checks whether the model is
+    feasible.
+
     Parameters
     ----------
     parameter_values : :class:`pybamm.ParameterValues.Parameters`
@@ -154,6 +161,9 @@ class ElectrodeSOHSolver:
 
     """
 
+    # Number of points used to calculate the maximum theoretical energy
+    _energy_points = 100
+
     def __init__(
         self, parameter_values, param=None, known_value="cyclable lithium capacity"
     ):
@@ -184,6 +194,8 @@ class ElectrodeSOHSolver:
 
         self.lims_ocp = (x0_min, x100_max, y100_min, y0_max)
         self.OCV_function = None
+        # Initial guess for the Newton solver, updated after each solve
+        self._y_guess = None
 
     @lru_cache
     def _get_electrode_soh_sims_full(self):
@@ -203,6 +215,24 @@ class ElectrodeSOHSolver:
         return [x100_sim, x0_sim]
 
     def solve(self, inputs):
+        """
+        Solve the electrode SOH model.
+
+        Parameters
+        ----------
+        inputs : dict
+            The electrode capacities "Q_n" and "Q_p", and either the cyclable lithium
+            capacity "Q_Li" or the cell capacity "Q" (depending on `known_value`).
+            Each input can be a float, or an array to solve for several sets of
+            inputs at once (e.g. the last state of several cycles), in which case all
+            arrays must have the same length.
+
+        Returns
+        -------
+        dict
+            The electrode SOH variables, including the maximum theoretical energy.
+            Each variable is a float, or an array if the inputs are arrays.
+        """
         if "n_Li" in inputs:
             warnings.warn(
                 "Input 'n_Li' has been replaced by 'Q_Li', which is 'n_Li * F / 3600'. "
@@ -230,6 +260,138 @@ class ElectrodeSOHSolver:
                 "The 'Upper voltage cut-off [V]' parameter is now used automatically.",
                 DeprecationWarning,
             )
+        n_inputs = max(np.size(value) for value in inputs.values())
+        try:
+            return self._solve_newton(inputs, n_inputs)
+        except pybamm.SolverError:
+            pybamm.logger.debug("eSOH Newton solver failed, solving with simulation")
+            # start the next Newton solve from the simulation's solution instead
+            self._y_guess = None
+        if all(np.ndim(value) == 0 for value in inputs.values()):
+            return self._solve_simulation(inputs)
+        # Solve for each set of inputs in turn, and stack the results
+        sol_dicts = [
+            self._solve_simulation(
+                {
+                    key: np.broadcast_to(value, (n_inputs,))[i]
+                    for key, value in inputs.items()
+                }
+            )
+            for i in range(n_inputs)
+        ]
+        return {key: np.array([sol[key] for sol in sol_dicts]) for key in sol_dicts[0]}
+
+    @lru_cache
+    def _get_newton_functions(self):
+        """
+        Set up the CasADi functions used to solve the electrode SOH model: the Newton
+        solver, the variables, and the open-circuit voltage (for the theoretical
+        energy)
+        """
+        sim = self._get_electrode_soh_sims_full()
+        sim.build()
+        model = sim.built_model
+        input_names = [p.name for p in model.input_parameters]
+
+        t = casadi.MX.sym("t")
+        y = casadi.MX.sym("y", model.concatenated_algebraic.size)
+        p = casadi.MX.sym("p", len(input_names))
+        inputs = {name: p[i] for i, name in enumerate(input_names)}
+
+        alg = model.concatenated_algebraic.to_casadi(t, y, inputs=inputs)
+        rootfinder = casadi.rootfinder(
+            "esoh",
+            "newton",
+            {"x": y, "p": p, "g": casadi.substitute(alg, t, 0)},
+            {"error_on_fail": True},
+        )
+        variable_names = list(model.variables.keys())
+        variables = casadi.vertcat(
+            *[
+                model.variables[name].to_casadi(t, y, inputs=inputs)
+                for name in variable_names
+            ]
+        )
+
+        # Open-circuit voltage, as in `theoretical_energy_integral`
+        param = pybamm.LithiumIonParameters()
+        ocv = _get_ocv_function(self.parameter_values, param, param.T_amb(0))
+
+        return {
+            "input names": input_names,
+            # Slices of the unknowns in y, for the initial guess
+            "y slices": {
+                var.name: model.variables[var.name].y_slices[0]
+                for var in model.algebraic.keys()
+            },
+            "variable names": variable_names,
+            "rootfinder": rootfinder,
+            "variables": casadi.Function("esoh_variables", [y, p], [variables]),
+            "ocv": ocv.map(self._energy_points),
+            "Q_p": self.parameter_values.evaluate(param.p.prim.Q_init),
+        }
+
+    @lru_cache
+    def _get_mapped_newton_functions(self, n_inputs):
+        """
+        Map the Newton solver, variables and open-circuit voltage functions over
+        `n_inputs` sets of inputs
+        """
+        functions = self._get_newton_functions()
+        return [
+            functions[name].map(n_inputs) for name in ["rootfinder", "variables", "ocv"]
+        ]
+
+    def _solve_newton(self, inputs, n_inputs):
+        """
+        Solve the electrode SOH model with the Newton solver, starting from the
+        previous solution
+        """
+        functions = self._get_newton_functions()
+        rootfinder, variables, ocv = self._get_mapped_newton_functions(n_inputs)
+
+        p = np.vstack(
+            [
+                np.broadcast_to(inputs[name], (n_inputs,))
+                for name in functions["input names"]
+            ]
+        )
+        if self._y_guess is None:
+            ics = self._set_up_solve(dict(zip(functions["input names"], p[:, 0])))
+            self._y_guess = np.zeros(functions["rootfinder"].size1_in(0))
+            for name, y_slice in functions["y slices"].items():
+                self._y_guess[y_slice] = np.ravel(ics[name])[0]
+        y0 = np.tile(self._y_guess[:, np.newaxis], (1, n_inputs))
+
+        try:
+            y_sol = rootfinder(y0, p)
+        except RuntimeError as error:
+            raise pybamm.SolverError(error.args[0])
+        sol_dict = dict(zip(functions["variable names"], variables(y_sol, p).full()))
+        # Newton may converge to a nonphysical root if the initial guess is poor
+        stoichiometries = np.vstack(
+            [sol_dict[name] for name in ["x_0", "x_100", "y_100", "y_0"]]
+        )
+        if not (np.all(stoichiometries > 0) and np.all(stoichiometries < 1)):
+            raise pybamm.SolverError("Stoichiometries are outside [0, 1]")
+        self._y_guess = y_sol.full()[:, -1]
+
+        # Calculate theoretical energy, evaluating the open-circuit voltage at all
+        # the stoichiometries at once
+        points = self._energy_points
+        x_vals = np.linspace(sol_dict["x_100"], sol_dict["x_0"], points)
+        y_vals = np.linspace(sol_dict["y_100"], sol_dict["y_0"], points)
+        Vs = ocv(x_vals.T.reshape(1, -1), y_vals.T.reshape(1, -1)).full()
+        Vs = Vs.reshape(n_inputs, points)
+        dQ = functions["Q_p"] * (sol_dict["y_0"] - sol_dict["y_100"]) / (points - 1)
+        sol_dict["Maximum theoretical energy [W.h]"] = np.trapz(Vs, axis=1) * dQ
+
+        if all(np.ndim(value) == 0 for value in inputs.values()):
+            sol_dict = {key: value[0] for key, value in sol_dict.items()}
+        return sol_dict
+
+    def _solve_simulation(self, inputs):
+        """Solve the electrode SOH model with a simulation"""
         ics = self._set_up_solve(inputs)
         try:
             sol = self._solve_full(inputs, ics)
@@ -422,7 +584,7 @@ class ElectrodeSOHSolver:
                 )
             )
 
-    def get_initial_stoichiometries(self, initial_value):
+    def get_initial_stoichiometries(self, initial_value, inputs=None):
         """
         Calculate initial stoichiometries to start off the simulation at a particular
         state of charge, given voltage limits, open-circuit potentials, etc defined by
@@ -430,11 +592,17 @@ class ElectrodeSOHSolver:
 
         Parameters
         ----------
-        initial_value : float
+        initial_value : float or array-like
             Target initial value.
-            If integer, interpreted as SOC, must be between 0 and 1.
+            If a number (or an array of numbers), interpreted as SOC, must be between
+            0 and 1.
             If string e.g. "4 V", interpreted as voltage,
             must be between V_min and V_max.
+        inputs : dict, optional
+            The electrode capacities, and the cyclable lithium capacity or cell
+            capacity (see :meth:`solve`), as floats or arrays to calculate the
+            stoichiometries for several cells at once. Default is None, in which case
+            the capacities are calculated from the parameter values.
 
         Returns
         -------
@@ -443,7 +611,7 @@ class ElectrodeSOHSolver:
         """
         parameter_values = self.parameter_values
         param = self.param
-        x_0, x_100, y_100, y_0 = self.get_min_max_stoichiometries()
+        x_0, x_100, y_100, y_0 = self.get_min_max_stoichiometries(inputs)
 
         if isinstance(initial_value, str) and initial_value.endswith("V"):
             V_init = float(initial_value[:-1])
@@ -456,27 +624,27 @@ class ElectrodeSOHSolver:
                     f"({V_min}, {V_max})"
                 )
 
-            # Solve simple model for initial soc based on target voltage
-            soc_model = pybamm.BaseModel()
-            soc = pybamm.Variable("soc")
-            Up = param.p.prim.U
-            Un = param.n.prim.U
-            T_ref = parameter_values["Reference temperature [K]"]
-            x = x_0 + soc * (x_100 - x_0)
-            y = y_0 - soc * (y_0 - y_100)
-
-            soc_model.algebraic[soc] = Up(y, T_ref) - Un(x, T_ref) - V_init
+            # Solve for initial soc based on target voltage, for all the min/max
+            # stoichiometries at once
+            stoichiometries = np.vstack(np.broadcast_arrays(x_0, x_100, y_100, y_0))
+            n_inputs = stoichiometries.shape[1]
             # initial guess for soc linearly interpolates between 0 and 1
             # based on V linearly interpolating between V_max and V_min
-            soc_model.initial_conditions[soc] = (V_init - V_min) / (V_max - V_min)
-            soc_model.variables["soc"] = soc
-            parameter_values.process_model(soc_model)
-            initial_soc = pybamm.AlgebraicSolver().solve(soc_model, [0])["soc"].data[0]
-        elif isinstance(initial_value, (int, float)):
-            initial_soc = initial_value
-            if not 0 <= initial_soc <= 1:
+            soc_init = np.full((1, n_inputs), (V_init - V_min) / (V_max - V_min))
+            p = np.vstack([stoichiometries, np.full((1, n_inputs), V_init)])
+            try:
+                initial_soc = self._get_soc_rootfinder(n_inputs)(soc_init, p)
+            except RuntimeError as error:
+                raise pybamm.SolverError(
+                    "Could not find acceptable solution: {}".format(error.args[0])
+                )
+            initial_soc = initial_soc.full().reshape(np.shape(x_0))
+        elif np.issubdtype(np.asarray(initial_value).dtype, np.number):
+            initial_soc = np.asarray(initial_value)
+            if not np.all((0 <= initial_soc) & (initial_soc <= 1)):
                 raise ValueError("Initial SOC should be between 0 and 1")
-
+            if initial_soc.ndim == 0:
+                initial_soc = initial_value
         else:
             raise ValueError(
                 "Initial value must be a float between 0 and 1, "
@@ -488,11 +656,42 @@ class ElectrodeSOHSolver:
 
         return x, y
 
-    def get_min_max_stoichiometries(self):
+    @lru_cache
+    def _get_soc_rootfinder(self, n_inputs):
+        """
+        CasADi Newton solver for the soc at which the open-circuit voltage is equal
+        to a target voltage, given the min/max stoichiometries and the target voltage
+        as parameters, mapped over `n_inputs` sets of parameters
+        """
+        if n_inputs > 1:
+            return self._get_soc_rootfinder(1).map(n_inputs)
+        param = self.param
+        ocv = _get_ocv_function(self.parameter_values, param, param.T_ref)
+        soc = casadi.MX.sym("soc")
+        p = casadi.MX.sym("p", 5)
+        x_0, x_100, y_100, y_0, V_init = casadi.vertsplit(p)
+        x = x_0 + soc * (x_100 - x_0)
+        y = y_0 - soc * (y_0 - y_100)
+        return casadi.rootfinder(
+            "soc",
+            "newton",
+            {"x": soc, "p": p, "g": ocv(x, y) - V_init},
+            {"error_on_fail": True},
+        )
+
+    def get_min_max_stoichiometries(self, inputs=None):
         """
         Calculate min/max stoichiometries
         given voltage limits, open-circuit potentials, etc defined by parameter_values
 
+        Parameters
+        ----------
+        inputs : dict, optional
+            The electrode capacities, and the cyclable lithium capacity or cell
+            capacity (see :meth:`solve`), as floats or arrays to calculate the
+            stoichiometries for several cells at once. Default is None, in which case
+            the capacities are calculated from the parameter values.
+
         Returns
         -------
         x_0, x_100, y_100, y_0
@@ -501,22 +700,27 @@ class ElectrodeSOHSolver:
         parameter_values = self.parameter_values
         param = self.param
 
-        Q_n = parameter_values.evaluate(param.n.Q_init)
-        Q_p = parameter_values.evaluate(param.p.Q_init)
+        if inputs is None:
+            Q_n = parameter_values.evaluate(param.n.Q_init)
+            Q_p = parameter_values.evaluate(param.p.Q_init)
 
-        if self.known_value == "cyclable lithium capacity":
-            Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
-            inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
-        elif self.known_value == "cell capacity":
-            Q = parameter_values.evaluate(param.Q / param.n_electrodes_parallel)
-            inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q": Q}
+            if self.known_value == "cyclable lithium capacity":
+                Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+                inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
+            elif self.known_value == "cell capacity":
+                Q = parameter_values.evaluate(param.Q / param.n_electrodes_parallel)
+                inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q": Q}
         # Solve the model and check outputs
-        sol = self.solve(inputs)
+        sol = self.solve(dict(inputs))
         return [sol["x_0"], sol["x_100"], sol["y_100"], sol["y_0"]]
 
 
 def get_initial_stoichiometries(
-    initial_value, parameter_values, param=None, known_value="cyclable lithium capacity"
+    initial_value,
+    parameter_values,
+    param=None,
+    known_value="cyclable lithium capacity",
+    inputs=None,
 ):
     """
     Calculate initial stoichiometries to start off the simulation at a particular
@@ -525,9 +729,10 @@ def get_initial_stoichiometries(
 
     Parameters
     ----------
-    initial_value : float
+    initial_value : float or array-like
         Target initial value.
-        If integer, interpreted as SOC, must be between 0 and 1.
+        If a number (or an array of numbers), interpreted as SOC, must be between 0
+        and 1.
         If string e.g. "4 V", interpreted as voltage, must be between V_min and V_max.
     parameter_values : :class:`pybamm.ParameterValues`
         The parameter values class that will be used for the simulation. Required for
@@ -535,6 +740,14 @@ def get_initial_stoichiometries(
     param : :class:`pybamm.LithiumIonParameters`, optional
         The symbolic parameter set to use for the simulation.
         If not provided, the default parameter set will be used.
+    known_value : str, optional
+        The known value needed to complete the electrode SOH model.
+        Can be "cyclable lithium capacity" (default) or "cell capacity".
+    inputs : dict, optional
+        Arrays of electrode capacities "Q_n" and "Q_p", and cyclable lithium
+        capacities "Q_Li" (or cell capacities "Q"), to calculate the stoichiometries
+        of several cells with a single batched solve. Default is None, in which case
+        the capacities are calculated from the parameter values.
 
     Returns
     -------
@@ -542,11 +755,11 @@ def get_initial_stoichiometries(
         The initial stoichiometries that give the desired initial state of charge
     """
     esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value)
-    return esoh_solver.get_initial_stoichiometries(initial_value)
+    return esoh_solver.get_initial_stoichiometries(initial_value, inputs)
 
 
 def get_min_max_stoichiometries(
-    parameter_values, param=None, known_value="cyclable lithium capacity"
+    parameter_values, param=None, known_value="cyclable lithium capacity", inputs=None
 ):
     """
     Calculate min/max stoichiometries
@@ -560,6 +773,14 @@ def get_min_max_stoichiometries(
     param : :class:`pybamm.LithiumIonParameters`, optional
         The symbolic parameter set to use for the simulation.
         If not provided, the default parameter set will be used.
+    known_value : str, optional
+        The known value needed to complete the electrode SOH model.
+        Can be "cyclable lithium capacity" (default) or "cell capacity".
+    inputs : dict, optional
+        Arrays of electrode capacities "Q_n" and "Q_p", and cyclable lithium
+        capacities "Q_Li" (or cell capacities "Q"), to calculate the stoichiometries
+        of several cells with a single batched solve. Default is None, in which case
+        the capacities are calculated from the parameter values.
 
     Returns
     -------
@@ -567,7 +788,24 @@ def get_min_max_stoichiometries(
         The min/max stoichiometries
     """
     esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value)
-    return esoh_solver.get_min_max_stoichiometries()
+    return esoh_solver.get_min_max_stoichiometries(inputs)
+
+
+def _get_ocv_function(parameter_values, param, T):
+    """
+    CasADi function of the negative and positive stoichiometries giving the
+    open-circuit voltage at temperature T
+    """
+    x = pybamm.InputParameter("x")
+    y = pybamm.InputParameter("y")
+    ocv = parameter_values.process_symbol(param.p.prim.U(y, T) - param.n.prim.U(x, T))
+    x_casadi = casadi.MX.sym("x")
+    y_casadi = casadi.MX.sym("y")
+    return casadi.Function(
+        "ocv",
+        [x_casadi, y_casadi],
+        [ocv.to_casadi(inputs={"x": x_casadi, "y": y_casadi})],
+    )
 
 
 def theoretical_energy_integral(parameter_values, n_i, n_f, p_i, p_f, points=100):
@@ -592,14 +830,10 @@ def theoretical_energy_integral(parameter_values, n_i, n_f, p_i, p_f, points=100
     """
     n_vals = np.linspace(n_i, n_f, num=points)
     p_vals = np.linspace(p_i, p_f, num=points)
-    # Calculate OCV at each stoichiometry
+    # Calculate OCV at all stoichiometries at once
     param = pybamm.LithiumIonParameters()
-    T = param.T_amb(0)
-    Vs = np.empty(n_vals.shape)
-    for i in range(n_vals.size):
-        Vs[i] = parameter_values.evaluate(
-            param.p.prim.U(p_vals[i], T)
-        ) - parameter_values.evaluate(param.n.prim.U(n_vals[i], T))
+    ocv = _get_ocv_function(parameter_values, param, param.T_amb(0)).map(points)
+    Vs = ocv(n_vals, p_vals).full().flatten()
     # Calculate dQ
     Q_p = parameter_values.evaluate(param.p.prim.Q_init) * (p_f - p_i)
     dQ = Q_p / (points - 1)
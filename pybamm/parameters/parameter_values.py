@@ -50,6 +50,13 @@ class ParameterValues:
                 "as the single argument, e.g. `ParameterValues('Chen2020')`.",
             )
 
+        # Initialise empty _processed_symbols dict (for caching), and the names of
+        # the parameters that each processed symbol depends on, so that updating a
+        # parameter only removes the processed symbols that depend on it
+        self._processed_symbols = {}
+        self._parameter_dependencies = {}
+        self._dependency_frames = []
+
         # add physical constants as default values
         self._dict_items = pybamm.FuzzyDict(
             {
@@ -85,9 +92,6 @@ class ParameterValues:
                 values = self.read_parameters_csv(file_path)
                 self.update(values, check_already_exists=False, path=path)
 
-        # Initialise empty _processed_symbols dict (for caching)
-        self._processed_symbols = {}
-
         # save citations
         citations = []
         if hasattr(self, "citations"):
@@ -342,8 +346,19 @@ class ParameterValues:
                 self._dict_items[name] = (func_name, data)
             else:
                 self._dict_items[name] = value
-        # reset processed symbols
-        self._processed_symbols = {}
+        # reset the processed symbols that depend on the updated parameters
+        self._remove_processed_symbols(values.keys())
+
+    def _remove_processed_symbols(self, names):
+        """
+        Remove the processed symbols that depend on any of the parameters in `names`
+        from the cache, keeping all the others.
+        """
+        names = set(names)
+        for symbol, dependencies in list(self._parameter_dependencies.items()):
+            if not names.isdisjoint(dependencies):
+                del self._parameter_dependencies[symbol]
+                self._processed_symbols.pop(symbol, None)
 
     def set_initial_stoichiometries(
         self,
@@ -598,12 +613,49 @@ class ParameterValues:
 
         """
         try:
-            return self._processed_symbols[symbol]
+            processed_symbol = self._processed_symbols[symbol]
         except KeyError:
+            processed_symbol = pybamm.process_post_order(
+                symbol,
+                self._processed_symbols,
+                self._process_and_track_symbol,
+                children=self._children_to_process,
+            )
+        # The symbol being processed (if any) depends on the same parameters
+        if self._dependency_frames:
+            self._dependency_frames[-1].update(
+                self._parameter_dependencies.get(symbol, ())
+            )
+        return processed_symbol
+
+    def _process_and_track_symbol(self, symbol):
+        """
+        Process a symbol (see :meth:`ParameterValues._process_symbol()`), recording
+        the names of the parameters it depends on. These are the parameters in the
+        symbol itself and in everything processed to process it.
+        """
+        self._dependency_frames.append(set())
+        try:
             processed_symbol = self._process_symbol(symbol)
-            self._processed_symbols[symbol] = processed_symbol
+        finally:
+            dependencies = self._dependency_frames.pop()
+        if isinstance(symbol, (pybamm.Parameter, pybamm.FunctionParameter)):
+            dependencies.add(symbol.name)
+        self._parameter_dependencies[symbol] = frozenset(dependencies)
+        return processed_symbol
 
-            return processed_symbol
+    @staticmethod
+    def _children_to_process(symbol):
+        """
+        Nodes to process before `symbol`. The children of a function parameter are
+        only processed if the function needs them.
+        """
+        if isinstance(symbol, pybamm.FunctionParameter):
+            return []
+        elif isinstance(symbol, pybamm.Symbol):
+            return symbol.children
+        else:
+            return []
 
     def _process_symbol(self, symbol):
         """See :meth:`ParameterValues.process_symbol()`."""
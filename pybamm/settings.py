@@ -6,6 +6,7 @@
 class Settings(object):
     _debug_mode = False
     _simplify = True
+    _intern_symbols = False
     _min_smoothing = "exact"
     _max_smoothing = "exact"
     _heaviside_smoothing = "exact"
@@ -42,6 +43,24 @@ class Settings(object):
         assert isinstance(value, bool)
         self._simplify = value
 
+    @property
+    def intern_symbols(self):
+        """
+        Whether to share identical subexpressions between expression trees. If True,
+        when a node is created, each of its children is replaced by a previously
+        created node with the same id (if that node still exists), so that each unique
+        subexpression is only stored (and processed, e.g. by
+        :meth:`pybamm.ParameterValues.process_symbol`, and evaluated for shape) once.
+        Nodes must not be modified after being used as the child of another node.
+        Default is False.
+        """
+        return self._intern_symbols
+
+    @intern_symbols.setter
+    def intern_symbols(self, value):
+        assert isinstance(value, bool)
+        self._intern_symbols = value
+
     def set_smoothing_parameters(self, k):
         "Helper function to set all smoothing parameters"
         self.min_smoothing = k
@@ -1,6 +1,7 @@
 #
 # Simulation class
 #
+import numbers
 import pickle
 import pybamm
 import numpy as np
@@ -54,6 +55,19 @@ class Simulation:
         A list of variables to plot automatically
     C_rate: float (optional)
         The C-rate at which you would like to run a constant current (dis)charge.
+    model_cache: :class:`pybamm.ModelCache` (optional)
+        An on-disk cache of built models. If given, the built model is loaded from
+        the cache if it has been built before with the same model, parameter values,
+        geometry, mesh and spatial methods (possibly in another process), and saved
+        to the cache otherwise.
+    share_experiment_models : bool (optional)
+        Whether operating conditions of the experiment that only differ in the value
+        of the current, voltage or power (e.g. "Discharge at 1C until 3 V" and
+        "Discharge at 2C until 3 V") should share a single built model and solver, in
+        which the value of the control is an input parameter. This reduces the number
+        of models that must be processed, discretised and set up by the solver.
+        Default is False, in which case a model is built for each distinct operating
+        condition.
     """
 
     def __init__(
@@ -68,6 +82,8 @@ class Simulation:
         solver=None,
         output_variables=None,
         C_rate=None,
+        model_cache=None,
+        share_experiment_models=False,
     ):
         self.parameter_values = parameter_values or model.default_parameter_values
         self._unprocessed_parameter_values = self.parameter_values
@@ -110,6 +126,8 @@ class Simulation:
         self.spatial_methods = spatial_methods or self.model.default_spatial_methods
         self.solver = solver or self.model.default_solver
         self.output_variables = output_variables
+        self.model_cache = model_cache
+        self.share_experiment_models = share_experiment_models
 
         # Initialize empty built states
         self._model_with_set_params = None
@@ -120,6 +138,8 @@ class Simulation:
         self._mesh = None
         self._disc = None
         self._solution = None
+        self._sweep_simulations = {}
+        self._sweep_initial_condition_parameters = {}
         self.quick_plot = None
 
         # ignore runtime warnings in notebooks
@@ -128,7 +148,7 @@ class Simulation:
 
             warnings.filterwarnings("ignore")
 
-    def set_up_and_parameterise_experiment(self):
+    def set_up_experiment(self):
         """
         Set up a simulation to run with an experiment. This creates a dictionary of
         inputs (current/voltage/power, running time, stopping condition) for each
@@ -195,19 +215,28 @@ class Simulation:
                     dt = 24 * 3600  # seconds
             op_conds["time"] = dt
 
-        # Set up model for experiment
+    def set_up_and_parameterise_experiment(self):
+        """
+        Set up the operating conditions of the experiment (see
+        :meth:`Simulation.set_up_experiment`) and a parameterised model for each of
+        them (see :meth:`Simulation.set_up_and_parameterise_model_for_experiment`).
+        """
+        self.set_up_experiment()
         self.set_up_and_parameterise_model_for_experiment()
 
     def set_up_and_parameterise_model_for_experiment(self):
         """
         Set up self.model to be able to run the experiment (new version).
-        In this version, a new model is created for each step.
+        In this version, a new model is created for each step (or, if
+        `share_experiment_models` is True, for each group of steps that only differ in
+        the value of the control, see :meth:`Simulation.get_experiment_model_key`).
 
         This increases set-up time since several models to be processed, but
         reduces simulation time since the model formulation is efficient.
         """
         self.op_type_to_model = {}
         self.op_string_to_model = {}
+        op_key_to_model = {}
         for op_number, op in enumerate(self.experiment.operating_conditions):
             # Create model for this operating condition type (current/voltage/power)
             # if it has not already been seen before
@@ -246,7 +275,10 @@ class Simulation:
 
                 self.op_type_to_model[op["type"]] = (new_model, submodel)
 
-            if op["string"] not in self.op_string_to_model:
+            if op["string"] in self.op_string_to_model:
+                continue
+            op_key = self.get_experiment_model_key(op, op_number)
+            if op_key not in op_key_to_model:
                 model, submodel = self.op_type_to_model[op["type"]]
                 # Create a new model for this operating condition, since we will update
                 # the events differently (based on parameter values and inputs) for
@@ -259,7 +291,7 @@ class Simulation:
                     "Ambient temperature [K]"
                 ]
                 experiment_parameter_values = self.get_experiment_parameter_values(
-                    op, op_number
+                    op, op_number, control_as_input=op_key != op["string"]
                 )
                 new_parameter_values.update(
                     experiment_parameter_values, check_already_exists=False
@@ -269,10 +301,60 @@ class Simulation:
                     new_parameter_values["Current function [A]"] = submodel.variables[
                         "Current [A]"
                     ]
-                parameterised_model = new_parameter_values.process_model(
+                op_key_to_model[op_key] = new_parameter_values.process_model(
                     new_model, inplace=False
                 )
-                self.op_string_to_model[op["string"]] = parameterised_model
+            self.op_string_to_model[op["string"]] = op_key_to_model[op_key]
+
+    def get_experiment_model_key(self, op, op_number):
+        """
+        Get the key that identifies the model for an operating condition of the
+        experiment. Operating conditions with the same key share a model.
+
+        If `share_experiment_models` is False, this is the string of the operating
+        condition. Otherwise, operating conditions whose models are identical except
+        for the value of the current, voltage or power (which is then an input
+        parameter) have the same key: the control type, the cut-offs, the direction
+        of the voltage cut-off and the temperature must be the same. Operating
+        conditions where the control is not a number (e.g. drive cycles) are never
+        shared.
+
+        Parameters
+        ----------
+        op : dict
+            The operating condition
+        op_number : int
+            The index of the operating condition in the experiment
+
+        Returns
+        -------
+        str or tuple
+            The key
+        """
+        if not self.share_experiment_models:
+            return op["string"]
+        controls = ["Current input [A]", "Voltage input [V]", "Power input [W]"]
+        if not all(
+            isinstance(op[name], numbers.Number) for name in controls if name in op
+        ):
+            return op["string"]
+        # The sign of the voltage cut-off event depends on the sign of the control
+        # (see `update_new_model_events`)
+        if "Voltage cut-off [V]" in op:
+            if op["type"] == "power":
+                sign = np.sign(op["Power input [W]"])
+            else:
+                sign = np.sign(op["Current input [A]"])
+        else:
+            sign = None
+        return (
+            op["type"],
+            tuple(sorted(name for name in op if "cut-off" in name)),
+            sign,
+            op["temperature"],
+            # the initial temperature is set by the first operating condition
+            op_number == 0 and op["temperature"] is not None,
+        )
 
     def update_new_model_events(self, new_model, op):
         if "Current cut-off [A]" in op:
@@ -344,23 +426,30 @@ class Simulation:
                     event.name, event.expression + 1, event.event_type
                 )
 
-    def get_experiment_parameter_values(self, op, op_number):
+    def get_experiment_parameter_values(self, op, op_number, control_as_input=False):
+        def control(name):
+            # If the model is shared between operating conditions, the value of the
+            # control is passed as an input when solving
+            if control_as_input:
+                return pybamm.InputParameter(name)
+            return op[name]
+
         experiment_parameter_values = {}
         if op["type"] == "current":
             experiment_parameter_values.update(
-                {"Current function [A]": op["Current input [A]"]}
+                {"Current function [A]": control("Current input [A]")}
             )
         if op["type"] == "CCCV":
             experiment_parameter_values.update(
-                {"CCCV current function [A]": op["Current input [A]"]}
+                {"CCCV current function [A]": control("Current input [A]")}
             )
         if op["type"] in ["voltage", "CCCV"]:
             experiment_parameter_values.update(
-                {"Voltage function [V]": op["Voltage input [V]"]}
+                {"Voltage function [V]": control("Voltage input [V]")}
             )
         if op["type"] == "power":
             experiment_parameter_values.update(
-                {"Power function [W]": op["Power input [W]"]}
+                {"Power function [W]": control("Power input [W]")}
             )
 
         if op["temperature"] is not None:
@@ -415,6 +504,57 @@ class Simulation:
         # Save solved initial SOC in case we need to re-build the model
         self._built_initial_soc = initial_soc
 
+    def update_parameters(self, values):
+        """
+        Update some of the parameter values of the simulation. If the model has
+        already been built, only the parts of the model that depend on the updated
+        parameters are processed and discretised again, and the rest of the built
+        model (and the CasADi functions created by the solver for it) is reused. This
+        makes it possible to vary parameters (e.g. when fitting a model to data)
+        without making them input parameters.
+
+        Parameters
+        ----------
+        values : dict
+            The new parameter values
+        """
+        if self.operating_mode == "with experiment":
+            raise NotImplementedError(
+                "Updating parameters is not implemented for simulations with an "
+                "experiment, create a new simulation instead"
+            )
+        if self._unprocessed_model.is_discretised:
+            raise NotImplementedError(
+                "Cannot update the parameters of a model that is already discretised"
+            )
+        if self._mesh is not None and not self._geometry_parameters.isdisjoint(values):
+            raise ValueError(
+                "Cannot update parameters that define the geometry after the model "
+                "has been built, create a new simulation instead"
+            )
+
+        self._parameter_values.update(values)
+        self._sweep_simulations = {}
+        self._sweep_initial_condition_parameters = {}
+        if self._unprocessed_parameter_values is not self._parameter_values:
+            # Also update the parameter values used to set the initial SOC
+            self._unprocessed_parameter_values.update(values)
+
+        if self._model_with_set_params is None:
+            # Only the built model from the model cache (if any) is out of date
+            self._built_model = None
+            return
+        rebuild = self._built_model is not None
+        self._model_with_set_params = None
+        self._built_model = None
+        self.set_parameters()
+        if rebuild:
+            self._built_model = self._disc.process_model(
+                self._model_with_set_params, inplace=False
+            )
+            # rebuilt model so clear solver setup
+            self._solver._model_set_up = {}
+
     def build(self, check_model=True, initial_soc=None):
         """
         A method to build the model into a system of matrices and vectors suitable for
@@ -442,12 +582,34 @@ class Simulation:
             self._model_with_set_params = self.model
             self._built_model = self.model
         else:
-            self.set_parameters()
-            self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
-            self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
-            self._built_model = self._disc.process_model(
-                self._model_with_set_params, inplace=False, check_model=check_model
-            )
+            if self.model_cache is not None:
+                # The geometry is processed in place, so the key must be computed
+                # before setting the parameters
+                key = self._get_model_cache_key()
+                cached = self.model_cache.load(key)
+            else:
+                cached = None
+            if cached is not None:
+                self._parameter_values.process_geometry(self._geometry)
+                self._mesh = cached["mesh"]
+                self._built_model = cached["model"]
+            else:
+                self.set_parameters()
+                self._mesh = pybamm.Mesh(
+                    self._geometry, self._submesh_types, self._var_pts
+                )
+                # Keep the discretisation, so that the model can be discretised again
+                # reusing the discretised symbols (see `update_parameters`)
+                self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
+                self._built_model = self._disc.process_model(
+                    self._model_with_set_params, inplace=False, check_model=check_model
+                )
+                if self.model_cache is not None:
+                    self.model_cache.save(
+                        key, {"model": self._built_model, "mesh": self._mesh}
+                    )
+            if self._disc is None:
+                self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
             # rebuilt model so clear solver setup
             self._solver._model_set_up = {}
 
@@ -462,26 +624,77 @@ class Simulation:
         if self.op_conds_to_built_models:
             return
         else:
-            self.set_up_and_parameterise_experiment()
-
-            # Can process geometry with default parameter values (only electrical
-            # parameters change between parameter values)
-            self._parameter_values.process_geometry(self._geometry)
-            # Only needs to set up mesh and discretisation once
-            self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
-            self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
-            # Process all the different models
-            self.op_conds_to_built_models = {}
-            self.op_conds_to_built_solvers = {}
-            for op_cond, model_with_set_params in self.op_string_to_model.items():
-                # It's ok to modify the model with set parameters in place as it's
-                # not returned anywhere
-                built_model = self._disc.process_model(
-                    model_with_set_params, inplace=True, check_model=check_model
+            self.set_up_experiment()
+            if self.model_cache is not None:
+                key = self._get_model_cache_key(
+                    experiment=self.experiment.operating_conditions,
+                    share_experiment_models=self.share_experiment_models,
                 )
-                solver = self.solver.copy()
-                self.op_conds_to_built_solvers[op_cond] = solver
-                self.op_conds_to_built_models[op_cond] = built_model
+                cached = self.model_cache.load(key)
+            else:
+                cached = None
+
+            if cached is not None:
+                self._parameter_values.process_geometry(self._geometry)
+                self._mesh = cached["mesh"]
+                self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
+                self.op_conds_to_built_models = cached["models"]
+            else:
+                self.set_up_and_parameterise_model_for_experiment()
+
+                # Can process geometry with default parameter values (only electrical
+                # parameters change between parameter values)
+                self._parameter_values.process_geometry(self._geometry)
+                # Only needs to set up mesh and discretisation once
+                self._mesh = pybamm.Mesh(
+                    self._geometry, self._submesh_types, self._var_pts
+                )
+                self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
+                # Process all the different models
+                self.op_conds_to_built_models = {}
+                for op_cond, model_with_set_params in self.op_string_to_model.items():
+                    # Models shared between operating conditions are only processed
+                    # once
+                    if not model_with_set_params.is_discretised:
+                        # It's ok to modify the model with set parameters in place as
+                        # it's not returned anywhere
+                        self._disc.process_model(
+                            model_with_set_params, inplace=True, check_model=check_model
+                        )
+                    self.op_conds_to_built_models[op_cond] = model_with_set_params
+                if self.model_cache is not None:
+                    self.model_cache.save(
+                        key,
+                        {"models": self.op_conds_to_built_models, "mesh": self._mesh},
+                    )
+
+            # Create a solver for each distinct model
+            model_id_to_solver = {}
+            self.op_conds_to_built_solvers = {}
+            for op_cond, built_model in self.op_conds_to_built_models.items():
+                if id(built_model) not in model_id_to_solver:
+                    model_id_to_solver[id(built_model)] = self.solver.copy()
+                self.op_conds_to_built_solvers[op_cond] = model_id_to_solver[
+                    id(built_model)
+                ]
+
+    def _get_model_cache_key(self, **kwargs):
+        """
+        Get the key of the built model(s) of this simulation in the model cache.
+        """
+        spatial_methods = {
+            domain: (type(method), method.options)
+            for domain, method in self._spatial_methods.items()
+        }
+        return self.model_cache.get_key(
+            self._unprocessed_model,
+            self._parameter_values,
+            geometry=self._geometry,
+            submesh_types=self._submesh_types,
+            var_pts=self._var_pts,
+            spatial_methods=spatial_methods,
+            **kwargs,
+        )
 
     def solve(
         self,
@@ -493,6 +706,8 @@ class Simulation:
         starting_solution=None,
         initial_soc=None,
         callbacks=None,
+        cycle_store=None,
+        lazy_summary_variables=False,
         **kwargs,
     ):
         """
@@ -540,6 +755,24 @@ class Simulation:
         callbacks : list of callbacks, optional
             A list of callbacks to be called at each time step. Each callback must
             implement all the methods defined in :class:`pybamm.callbacks.BaseCallback`.
+        cycle_store : :class:`pybamm.CycleSolutionStore`, optional
+            If given, each completed cycle is written to the store and dropped from
+            memory, and the cycles of the returned solution (`solution.cycles`) are
+            loaded from the store when they are accessed. The returned solution then
+            only contains the last cycle, rather than all the saved cycles.
+            The cycles of `starting_solution` are copied to the store, unless it is
+            the store that `starting_solution` was solved with (i.e.
+            `cycle_store=starting_solution.cycles`), in which case the new cycles
+            are added to it in place. Must be given if `starting_solution` was
+            solved with a store. Can only be used if simulating an Experiment.
+        lazy_summary_variables : bool, optional
+            If True, the eSOH summary variables of each cycle are only calculated
+            when they are first accessed (e.g. through `solution.summary_variables`,
+            which solves the eSOH model for all the cycles at once), rather than at
+            the end of each cycle. The other summary variables are still calculated
+            at the end of each cycle. A capacity stopping condition needs the
+            capacity of each cycle, which is an eSOH variable, so the eSOH variables
+            are then still calculated at the end of each cycle. Default is False.
         **kwargs
             Additional key-word arguments passed to `solver.solve`.
             See :meth:`pybamm.BaseSolver.solve`.
@@ -562,6 +795,10 @@ class Simulation:
                 raise ValueError(
                     "starting_solution can only be provided if simulating an Experiment"
                 )
+            if cycle_store is not None:
+                raise ValueError(
+                    "cycle_store can only be provided if simulating an Experiment"
+                )
             if (
                 self.operating_mode == "without experiment"
                 or self.model.name == "ElectrodeSOH model"
@@ -655,12 +892,28 @@ class Simulation:
                     starting_solution.steps,
                     esoh_solver=esoh_solver,
                     save_this_cycle=True,
+                    lazy_summary_variables=lazy_summary_variables,
                 )
                 starting_solution_cycles = [cycle_solution]
                 starting_solution_summary_variables = [cycle_sum_vars]
                 starting_solution_first_states = [cycle_first_state]
             else:
-                starting_solution_cycles = starting_solution.cycles.copy()
+                starting_solution_cycles = starting_solution.cycles
+                # Copy the cycles so that the starting solution is not modified. If
+                # a store is given, the cycles are copied to it below (unless it is
+                # the store of the starting solution, which is then added to).
+                # Stored cycles are not loaded back into memory, so a store must be
+                # given for them
+                if isinstance(starting_solution_cycles, pybamm.CycleSolutionStore):
+                    if cycle_store is None:
+                        raise ValueError(
+                            "starting_solution was solved with a cycle_store, so a "
+                            "cycle_store must also be given: either "
+                            "starting_solution.cycles, to add the new cycles to the "
+                            "same store, or a new store to copy the cycles to"
+                        )
+                elif cycle_store is None:
+                    starting_solution_cycles = starting_solution_cycles.copy()
                 starting_solution_summary_variables = (
                     starting_solution.all_summary_variables.copy()
                 )
@@ -669,7 +922,12 @@ class Simulation:
                 )
 
             cycle_offset = len(starting_solution_cycles)
+            if cycle_store is not None and cycle_store is not starting_solution_cycles:
+                for cycle in starting_solution_cycles:
+                    cycle_store.append(cycle)
+                starting_solution_cycles = cycle_store
             all_cycle_solutions = starting_solution_cycles
+            stream_cycles = isinstance(all_cycle_solutions, pybamm.CycleSolutionStore)
             all_summary_variables = starting_solution_summary_variables
             all_first_states = starting_solution_first_states
             current_solution = starting_solution or pybamm.EmptySolution()
@@ -779,7 +1037,11 @@ class Simulation:
                     # Increment index for next iteration
                     idx += 1
 
-                if save_this_cycle or feasible is False:
+                if stream_cycles:
+                    # Only keep the current cycle in memory, previous cycles are in
+                    # the store
+                    self._solution = cycle_solution
+                elif save_this_cycle or feasible is False:
                     self._solution = self._solution + cycle_solution
 
                 # At the final step of the inner loop we save the cycle
@@ -807,7 +1069,10 @@ class Simulation:
                                 "due to exceeded bounds at initial conditions."
                             )
                     cycle_sol = pybamm.make_cycle_solution(
-                        steps, esoh_solver=esoh_solver, save_this_cycle=save_this_cycle
+                        steps,
+                        esoh_solver=esoh_solver,
+                        save_this_cycle=save_this_cycle,
+                        lazy_summary_variables=lazy_summary_variables,
                     )
                     cycle_solution, cycle_sum_vars, cycle_first_state = cycle_sol
                     all_cycle_solutions.append(cycle_solution)
@@ -900,6 +1165,129 @@ class Simulation:
 
         return self.solution
 
+    def sweep(self, values, t_eval=None, **kwargs):
+        """
+        Solve the model for several values of some of its parameters, building the
+        model only once. The swept parameters are replaced by input parameters (see
+        :class:`pybamm.InputParameter`), the model is built with them, and all the
+        variants are solved together by passing their values to the solver as a list
+        of inputs (see :meth:`pybamm.BaseSolver.solve`). The built model for each set
+        of swept parameters is kept, so sweeping the same parameters again does not
+        build the model again.
+
+        Since the solver uses the same initial conditions for all the inputs, swept
+        parameters that set the initial conditions (e.g. initial concentrations) are
+        not replaced by input parameters. Instead, the model is built and solved
+        separately for each of their values.
+
+        Parameters
+        ----------
+        values : dict
+            The values of the swept parameters, as a dictionary
+            {parameter name: list of values}. All the lists must have the same
+            length, and the n-th variant uses the n-th value in each list.
+        t_eval : numeric type, optional
+            The times (in seconds) at which to compute the solution. See
+            :meth:`Simulation.solve`.
+        **kwargs
+            Additional key-word arguments passed to :meth:`Simulation.solve`. Any
+            `inputs` given are passed to every variant.
+
+        Returns
+        -------
+        list of :class:`pybamm.Solution`
+            The solution for each variant
+        """
+        if self.operating_mode == "with experiment":
+            raise NotImplementedError(
+                "Sweeping parameters is not implemented for simulations with an "
+                "experiment"
+            )
+        names = tuple(sorted(values.keys()))
+        n_variants = {len(values[name]) for name in names}
+        if len(n_variants) > 1:
+            raise ValueError(
+                "All the swept parameters must be given the same number of values"
+            )
+        if not self._geometry_parameters.isdisjoint(names):
+            raise ValueError("Cannot sweep parameters that define the geometry")
+
+        # The solver uses the same initial conditions for all the inputs, so the
+        # variants are grouped by the values of the swept parameters that set the
+        # initial conditions, and each group is built and solved separately
+        if names not in self._sweep_initial_condition_parameters:
+            self._sweep_initial_condition_parameters[
+                names
+            ] = self._get_initial_condition_parameters(names)
+        ic_names = self._sweep_initial_condition_parameters[names]
+        input_names = tuple(name for name in names if name not in ic_names)
+
+        user_inputs = kwargs.pop("inputs", {})
+        variants = [
+            dict(zip(names, variant))
+            for variant in zip(*[values[name] for name in names])
+        ]
+        groups = {}
+        for i, variant in enumerate(variants):
+            ic_values = tuple((name, variant[name]) for name in ic_names)
+            groups.setdefault(ic_values, []).append(i)
+
+        solutions = [None] * len(variants)
+        for ic_values, indices in groups.items():
+            sim = self._get_sweep_simulation(input_names, ic_values)
+            inputs = [
+                {**user_inputs, **{name: variants[i][name] for name in input_names}}
+                for i in indices
+            ]
+            group_solutions = sim.solve(t_eval, inputs=inputs, **kwargs)
+            # A single variant is not returned as a list by the solver
+            if not isinstance(group_solutions, list):
+                group_solutions = [group_solutions]
+            for i, solution in zip(indices, group_solutions):
+                solutions[i] = solution
+        return solutions
+
+    def _get_initial_condition_parameters(self, names):
+        """
+        Find which of the parameters `names` appear in the initial conditions of the
+        model, once the parameter values have been set
+        """
+        parameter_values = self._parameter_values.copy()
+        parameter_values.update({name: "[input]" for name in names})
+        ic_names = set()
+        for initial_condition in self._unprocessed_model.initial_conditions.values():
+            processed = parameter_values.process_symbol(initial_condition)
+            ic_names.update(
+                node.name
+                for node in processed.pre_order()
+                if isinstance(node, pybamm.InputParameter)
+            )
+        return tuple(name for name in names if name in ic_names)
+
+    def _get_sweep_simulation(self, input_names, fixed_values):
+        """
+        Get the simulation, built with the parameters `input_names` as input
+        parameters and the parameters in `fixed_values` set to the given values,
+        that solves a group of variants of a sweep
+        """
+        key = (input_names, fixed_values) if fixed_values else input_names
+        if key not in self._sweep_simulations:
+            parameter_values = self._parameter_values.copy()
+            parameter_values.update({name: "[input]" for name in input_names})
+            parameter_values.update(dict(fixed_values))
+            self._sweep_simulations[key] = Simulation(
+                self._unprocessed_model,
+                geometry=self._geometry,
+                parameter_values=parameter_values,
+                submesh_types=self._submesh_types,
+                var_pts=self._var_pts,
+                spatial_methods=self._spatial_methods,
+                solver=self._solver.copy(),
+                output_variables=self.output_variables,
+                model_cache=self.model_cache,
+            )
+        return self._sweep_simulations[key]
+
     @lru_cache
     def get_esoh_solver(self, calc_esoh):
         if (
@@ -991,6 +1379,20 @@ class Simulation:
     @geometry.setter
     def geometry(self, geometry):
         self._geometry = geometry.copy()
+        # Keep a record of the parameters in the geometry, since the geometry is
+        # processed in place
+        self._geometry_parameters = set()
+        limits = list(self._geometry.values())
+        while limits:
+            limit = limits.pop()
+            if isinstance(limit, dict):
+                limits.extend(limit.values())
+            elif isinstance(limit, pybamm.Symbol):
+                self._geometry_parameters.update(
+                    node.name
+                    for node in limit.pre_order()
+                    if isinstance(node, (pybamm.Parameter, pybamm.FunctionParameter))
+                )
 
     @property
     def parameter_values(self):
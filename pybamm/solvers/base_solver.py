@@ -8,6 +8,7 @@ import multiprocessing as mp
 import numbers
 import sys
 import warnings
+import weakref
 
 import casadi
 import numpy as np
@@ -15,6 +16,59 @@ import numpy as np
 import pybamm
 from pybamm.expression_tree.binary_operators import _Heaviside
 
+# Solver and model held by each worker of a persistent pool (see
+# `BaseSolver.get_pool`), so that they only need to be sent to each worker once
+_pool_worker_solver = None
+_pool_worker_model = None
+
+
+def _init_pool_worker(solver, model):
+    global _pool_worker_solver, _pool_worker_model
+    _pool_worker_solver = solver
+    _pool_worker_model = model
+
+
+def _integrate_in_pool_worker(t_eval, inputs, y0):
+    model = _pool_worker_model
+    model.y0 = y0
+    solution = _pool_worker_solver._integrate(model, t_eval, inputs)
+    # The parent process already holds the model, so only send back the arrays.
+    # The model is attached again in `BaseSolver.solve`
+    _set_solution_model(solution, None)
+    return solution
+
+
+def _set_solution_model(solution, model):
+    for sol in [solution, *solution.sub_solutions]:
+        sol.all_models = [model] * len(sol.all_models)
+
+
+# Returned by `_copy_setting` for attributes that are not settings
+_NOT_A_SETTING = object()
+
+
+def _copy_setting(value):
+    """
+    A copy of a solver attribute if it is a setting (a number, string, boolean or
+    None, a list or dictionary of settings, or another solver), so that later
+    changes to the attribute (including changes made in place) can be detected
+    """
+    if value is None or isinstance(value, (str, bool, numbers.Number)):
+        return value
+    elif isinstance(value, BaseSolver):
+        return type(value), value._get_settings()
+    elif isinstance(value, (list, tuple)):
+        items = [_copy_setting(item) for item in value]
+        if any(item is _NOT_A_SETTING for item in items):
+            return _NOT_A_SETTING
+        return tuple(items)
+    elif isinstance(value, dict):
+        items = {key: _copy_setting(item) for key, item in value.items()}
+        if any(item is _NOT_A_SETTING for item in items.values()):
+            return _NOT_A_SETTING
+        return items
+    return _NOT_A_SETTING
+
 
 class BaseSolver(object):
     """Solve a discretised model.
@@ -56,6 +110,9 @@ class BaseSolver(object):
         self.root_method = root_method
         self.extrap_tol = extrap_tol or -1e-10
         self._model_set_up = {}
+        self._pool = None
+        self._pool_key = None
+        self._pool_finalizer = None
 
         # Defaults, can be overwritten by specific solver
         self.name = "Base solver"
@@ -88,8 +145,84 @@ class BaseSolver(object):
         new_solver = copy.copy(self)
         # clear _model_set_up
         new_solver._model_set_up = {}
+        # the worker pool holds a copy of the old solver, so don't share it
+        new_solver._pool = None
+        new_solver._pool_key = None
+        new_solver._pool_finalizer = None
         return new_solver
 
+    def __getstate__(self):
+        # worker pools cannot be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_key"] = None
+        state["_pool_finalizer"] = None
+        return state
+
+    # Attributes that hold the state of the solver rather than its settings
+    _state_attributes = ("_model_set_up", "_pool", "_pool_key", "_pool_finalizer")
+
+    def _get_settings(self):
+        """
+        Copies of the settings of the solver (e.g. method, tolerances and options),
+        i.e. of the attributes that are plain values or other solvers
+        """
+        settings = {}
+        for name, value in vars(self).items():
+            if name in self._state_attributes:
+                continue
+            value = _copy_setting(value)
+            if value is not _NOT_A_SETTING:
+                settings[name] = value
+        return settings
+
+    def get_pool(self, model, nproc=None):
+        """
+        Return a persistent pool of worker processes for solving `model` with several
+        sets of inputs. The solver and model are sent to each worker once, when the
+        pool is created, after which only inputs and solutions are passed between
+        processes. The pool is reused by subsequent calls to :meth:`solve` with the
+        same model, number of processes and solver settings (e.g. tolerances), and is
+        recreated whenever any of them change or the model is set up again.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model to solve, which must already have been set up by this solver
+        nproc : int, optional
+            Number of worker processes. Defaults to value returned by "os.cpu_count()".
+
+        Returns
+        -------
+        :class:`multiprocessing.pool.Pool`
+            The worker pool
+        """
+        key = (model, nproc, self._get_settings())
+        if self._pool is None or self._pool_key != key:
+            self.close_pool()
+            self._pool = mp.Pool(
+                processes=nproc,
+                initializer=_init_pool_worker,
+                initargs=(self, model),
+            )
+            self._pool_key = key
+            # make sure the workers are stopped when the solver is garbage collected
+            # or the interpreter exits
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close_pool(self):
+        """
+        Terminate the persistent worker pool, if any.
+        """
+        if self._pool is not None:
+            # calling the finalizer terminates the pool
+            self._pool_finalizer()
+            self._pool.join()
+        self._pool = None
+        self._pool_key = None
+        self._pool_finalizer = None
+
     def set_up(self, model, inputs=None, t_eval=None, ics_only=False):
         """Unpack model, perform checks, and calculate jacobian.
 
@@ -227,6 +360,13 @@ class BaseSolver(object):
                 model.casadi_rhs = casadi.Function(
                     "rhs", [t_casadi, y_and_S, p_casadi_stacked], [explicit_rhs]
                 )
+                # Fuse the rhs, algebraic and switch events into a single function,
+                # so that the terms they share are only evaluated once per call
+                model.casadi_rhs_algebraic_events = fuse_casadi_functions(
+                    "rhs_algebraic_events",
+                    [model.casadi_rhs, algebraic, *casadi_switch_events],
+                    [t_casadi, y_and_S, p_casadi_stacked],
+                )
             model.casadi_switch_events = casadi_switch_events
             model.casadi_algebraic = algebraic
             model.casadi_sensitivities = jacp_rhs_algebraic
@@ -651,7 +791,8 @@ class BaseSolver(object):
             of size `len(model.rhs) + len(model.algebraic)`.
         nproc : int, optional
             Number of processes to use when solving for more than one set of input
-            parameters. Defaults to value returned by "os.cpu_count()".
+            parameters. Defaults to value returned by "os.cpu_count()". The worker
+            processes are kept alive between calls, see :meth:`get_pool`.
         calculate_sensitivites : list of str or bool
             If true, solver calculates sensitivities of all input parameters.
             If only a subset of sensitivities are required, can also pass a
@@ -744,6 +885,7 @@ class BaseSolver(object):
             # CasadiSolver caches its integrators using model, so delete this too
             if isinstance(self, pybamm.CasadiSolver):
                 self.integrators.pop(model, None)
+                self.integrator_specs.pop(model, None)
 
         # save sensitivity parameters so we can identify them later on
         # (FYI: this is used in the Solution class)
@@ -765,6 +907,8 @@ class BaseSolver(object):
             # is passed to `set_up`.
             # See https://github.com/pybamm-team/PyBaMM/pull/1261
             self.set_up(model, model_inputs_list[0], t_eval)
+            # Any existing worker pool holds a model that has not been set up
+            self.close_pool()
             self._model_set_up.update(
                 {model: {"initial conditions": model.concatenated_initial_conditions}}
             )
@@ -781,6 +925,7 @@ class BaseSolver(object):
                     # If the new initial conditions are different
                     # and cannot be evaluated directly, set up again
                     self.set_up(model, model_inputs_list[0], t_eval, ics_only=True)
+                    self.close_pool()
                 self._model_set_up[model][
                     "initial conditions"
                 ] = model.concatenated_initial_conditions
@@ -843,17 +988,9 @@ class BaseSolver(object):
                 )
                 new_solutions = [new_solution]
             else:
-                with mp.Pool(processes=nproc) as p:
-                    new_solutions = p.starmap(
-                        self._integrate,
-                        zip(
-                            [model] * ninputs,
-                            [t_eval[start_index:end_index]] * ninputs,
-                            model_inputs_list,
-                        ),
-                    )
-                    p.close()
-                    p.join()
+                new_solutions = self._integrate_batch(
+                    model, t_eval[start_index:end_index], model_inputs_list, nproc
+                )
             # Setting the solve time for each segment.
             # pybamm.Solution.__add__ assumes attribute solve_time.
             solve_time = timer.time()
@@ -939,6 +1076,39 @@ class BaseSolver(object):
         else:
             return solutions
 
+    def _integrate_batch(self, model, t_eval, inputs_list, nproc=None):
+        """
+        Solve a model for several sets of inputs, using the persistent pool of
+        worker processes (see :meth:`get_pool`). Solvers that can integrate several
+        sets of inputs at once can override this method.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose solution to calculate.
+        t_eval : numeric type
+            The times at which to compute the solution
+        inputs_list : list of dict
+            The sets of input parameters to pass to the model when solving
+        nproc : int, optional
+            Number of processes to use. Defaults to value returned by
+            "os.cpu_count()".
+
+        Returns
+        -------
+        list of :class:`pybamm.Solution`
+            The solution for each set of inputs
+        """
+        ninputs = len(inputs_list)
+        pool = self.get_pool(model, nproc)
+        solutions = pool.starmap(
+            _integrate_in_pool_worker,
+            zip([t_eval] * ninputs, inputs_list, [model.y0] * ninputs),
+        )
+        for sol in solutions:
+            _set_solution_model(sol, model)
+        return solutions
+
     def _get_discontinuity_start_end_indices(self, model, inputs, t_eval):
         if model.discontinuity_events_eval == []:
             pybamm.logger.verbose("No discontinuity events found")
@@ -1464,6 +1634,23 @@ def process(symbol, name, vars_for_processing, use_jacobian=None):
         calculate_sensitivities_explicit = vars_for_processing[
             "calculate_sensitivities_explicit"
         ]
+        # Reuse the functions if this expression has already been converted with
+        # the same inputs, sensitivities and sizes (e.g. by another solver)
+        cache_key = (
+            name,
+            use_jacobian,
+            tuple((pname, p.shape) for pname, p in p_casadi.items()),
+            tuple(model.calculate_sensitivities),
+            calculate_sensitivities_explicit,
+            model.len_rhs,
+            model.len_alg,
+            model.len_rhs_sens,
+            model.len_alg_sens,
+        )
+        cached = pybamm.casadi_function_cache.get(symbol, cache_key)
+        if cached is not None:
+            report(f"Using cached CasADi functions for {name}")
+            return cached
         # Process with CasADi
         report(f"Converting {name} to CasADi")
         casadi_expression = symbol.to_casadi(t_casadi, y_casadi, inputs=p_casadi)
@@ -1571,5 +1758,40 @@ def process(symbol, name, vars_for_processing, use_jacobian=None):
         func = casadi.Function(
             name, [t_casadi, y_and_S, p_casadi_stacked], [casadi_expression]
         )
+        pybamm.casadi_function_cache.set(
+            symbol, cache_key, (func, jac, jacp, jac_action)
+        )
 
     return func, jac, jacp, jac_action
+
+
+def fuse_casadi_functions(name, functions, args):
+    """
+    Combine CasADi functions that take the same arguments into a single function
+    that returns all of their outputs. The functions are inlined and common
+    subexpressions are eliminated, so that terms shared between the functions (e.g.
+    the same exchange-current density appearing in the rhs and algebraic equations)
+    are only evaluated once per call. Common subexpression elimination needs CasADi
+    3.6 or later; with older versions the outputs are combined as they are.
+
+    Parameters
+    ----------
+    name : str
+        The name of the fused function
+    functions : list of :class:`casadi.Function`
+        The functions to fuse, each taking `args` as inputs
+    args : list of :class:`casadi.MX`
+        The symbolic inputs of the fused function
+
+    Returns
+    -------
+    :class:`casadi.Function`
+        Function whose outputs are the outputs of each function in `functions`, in
+        order
+    """
+    outputs = []
+    for func in functions:
+        outputs.extend(func.call(args, True, False))
+    if hasattr(casadi, "cse"):
+        outputs = casadi.cse(outputs)
+    return casadi.Function(name, args, outputs)
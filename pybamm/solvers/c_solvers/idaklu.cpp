@@ -50,6 +50,24 @@ PYBIND11_MODULE(idaklu, m)
         py::arg("atol"), py::arg("rtol"), py::arg("inputs"), py::arg("options"),
         py::return_value_policy::take_ownership);
 
+  py::class_<CasadiSolverGroup>(m, "CasadiSolverGroup")
+      .def("solve", &CasadiSolverGroup::solve,
+           "perform a solve for each row of inputs, in parallel", py::arg("t"),
+           py::arg("y0"), py::arg("yp0"), py::arg("inputs"),
+           py::return_value_policy::take_ownership);
+
+  m.def("create_casadi_solver_group", &create_casadi_solver_group,
+        "Create a group of casadi idaklu solver objects, one per thread",
+        py::arg("number_of_threads"), py::arg("number_of_states"),
+        py::arg("number_of_parameters"), py::arg("rhs_alg"),
+        py::arg("jac_times_cjmass"), py::arg("jac_times_cjmass_colptrs"),
+        py::arg("jac_times_cjmass_rowvals"), py::arg("jac_times_cjmass_nnz"),
+        py::arg("jac_bandwidth_lower"), py::arg("jac_bandwidth_upper"),
+        py::arg("jac_action"), py::arg("mass_action"), py::arg("sens"),
+        py::arg("events"), py::arg("number_of_events"), py::arg("rhs_alg_id"),
+        py::arg("atol"), py::arg("rtol"), py::arg("inputs"), py::arg("options"),
+        py::return_value_policy::take_ownership);
+
   m.def("generate_function", &generate_function, "Generate a casadi function",
         py::arg("string"), py::return_value_policy::take_ownership);
 
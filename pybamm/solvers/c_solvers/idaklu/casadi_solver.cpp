@@ -1,7 +1,10 @@
 #include "casadi_solver.hpp"
 #include "casadi_sundials_functions.hpp"
 #include "common.hpp"
+#include <algorithm>
+#include <atomic>
 #include <memory>
+#include <thread>
 
 CasadiSolver *
 create_casadi_solver(int number_of_states, int number_of_parameters,
@@ -29,6 +32,35 @@ create_casadi_solver(int number_of_states, int number_of_parameters,
                           std::move(functions), options_cpp);
 }
 
+CasadiSolverGroup *
+create_casadi_solver_group(int number_of_threads,
+                           int number_of_states, int number_of_parameters,
+                           const Function &rhs_alg, const Function &jac_times_cjmass,
+                           const np_array_int &jac_times_cjmass_colptrs,
+                           const np_array_int &jac_times_cjmass_rowvals,
+                           const int jac_times_cjmass_nnz,
+                           const int jac_bandwidth_lower, const int jac_bandwidth_upper,
+                           const Function &jac_action,
+                           const Function &mass_action, const Function &sens,
+                           const Function &events, const int number_of_events,
+                           np_array rhs_alg_id, np_array atol_np, double rel_tol,
+                           int inputs_length, py::dict options)
+{
+  // each solver has its own IDA memory, linear solver and casadi work arrays,
+  // the casadi functions themselves are shared
+  std::vector<std::unique_ptr<CasadiSolver>> solvers;
+  for (int i = 0; i < number_of_threads; i++)
+  {
+    solvers.emplace_back(create_casadi_solver(
+        number_of_states, number_of_parameters, rhs_alg, jac_times_cjmass,
+        jac_times_cjmass_colptrs, jac_times_cjmass_rowvals,
+        jac_times_cjmass_nnz, jac_bandwidth_lower, jac_bandwidth_upper,
+        jac_action, mass_action, sens, events, number_of_events, rhs_alg_id,
+        atol_np, rel_tol, inputs_length, options));
+  }
+  return new CasadiSolverGroup(std::move(solvers));
+}
+
 CasadiSolver::CasadiSolver(np_array atol_np, double rel_tol,
                            np_array rhs_alg_id, int number_of_parameters,
                            int number_of_events, int jac_times_cjmass_nnz,
@@ -291,39 +323,22 @@ Solution CasadiSolver::solve(np_array t_np, np_array y0_np, np_array yp0_np,
   DEBUG("CasadiSolver::solve");
   int number_of_timesteps = t_np.request().size;
 
-  // set inputs
-  auto p_inputs = inputs.unchecked<2>();
-  for (int i = 0; i < functions->inputs.size(); i++)
+  auto t_unchecked = t_np.unchecked<1>();
+  std::vector<realtype> t(number_of_timesteps);
+  for (int i = 0; i < number_of_timesteps; i++)
   {
-    functions->inputs[i] = p_inputs(i, 0);
+    t[i] = t_unchecked(i);
   }
-
-  realtype *yval = N_VGetArrayPointer(yy);
-  realtype *ypval = N_VGetArrayPointer(yp);
-  std::vector<realtype *> ySval(number_of_parameters);
-  for (int is = 0 ; is < number_of_parameters; is++) {
-    ySval[is] = N_VGetArrayPointer(yyS[is]);
-    N_VConst(RCONST(0.0), yyS[is]);
-    N_VConst(RCONST(0.0), ypS[is]);
-  }
-
-  auto t = t_np.unchecked<1>();
-  auto y0 = y0_np.unchecked<1>();
-  auto yp0 = yp0_np.unchecked<1>();
+  auto y0_unchecked = y0_np.unchecked<1>();
+  auto yp0_unchecked = yp0_np.unchecked<1>();
+  std::vector<realtype> y0(number_of_states);
+  std::vector<realtype> yp0(number_of_states);
   for (int i = 0; i < number_of_states; i++)
   {
-    yval[i] = y0[i];
-    ypval[i] = yp0[i];
+    y0[i] = y0_unchecked[i];
+    yp0[i] = yp0_unchecked[i];
   }
 
-  realtype t0 = RCONST(t(0));
-  IDAReInit(ida_mem, t0, yy, yp);
-
-  int t_i = 1;
-  realtype tret;
-  realtype t_next;
-  realtype t_final = t(number_of_timesteps - 1);
-
   // set return vectors
   realtype *t_return = new realtype[number_of_timesteps];
   realtype *y_return = new realtype[number_of_timesteps * number_of_states];
@@ -352,7 +367,66 @@ Solution CasadiSolver::solve(np_array t_np, np_array y0_np, np_array yp0_np,
                                   delete[] vect;
                                 });
 
-  t_return[0] = t(0);
+  int t_i;
+  int retval = solve_into(t.data(), number_of_timesteps, y0.data(),
+                          yp0.data(), inputs.data(), t_return, y_return,
+                          yS_return, t_i);
+
+  np_array t_ret = np_array(t_i, &t_return[0], free_t_when_done);
+  np_array y_ret =
+      np_array(t_i * number_of_states, &y_return[0], free_y_when_done);
+  np_array yS_ret = np_array(
+      std::vector<ptrdiff_t>{number_of_parameters, number_of_timesteps, number_of_states},
+      &yS_return[0], free_yS_when_done);
+
+  Solution sol(retval, t_ret, y_ret, yS_ret);
+
+  if (options.print_stats)
+  {
+    print_stats();
+  }
+
+  return sol;
+}
+
+int CasadiSolver::solve_into(const realtype *t, int number_of_timesteps,
+                             const realtype *y0, const realtype *yp0,
+                             const realtype *inputs, realtype *t_return,
+                             realtype *y_return, realtype *yS_return,
+                             int &number_of_returned_timesteps)
+{
+  DEBUG("CasadiSolver::solve_into");
+
+  // set inputs
+  for (int i = 0; i < functions->inputs.size(); i++)
+  {
+    functions->inputs[i] = inputs[i];
+  }
+
+  realtype *yval = N_VGetArrayPointer(yy);
+  realtype *ypval = N_VGetArrayPointer(yp);
+  std::vector<realtype *> ySval(number_of_parameters);
+  for (int is = 0 ; is < number_of_parameters; is++) {
+    ySval[is] = N_VGetArrayPointer(yyS[is]);
+    N_VConst(RCONST(0.0), yyS[is]);
+    N_VConst(RCONST(0.0), ypS[is]);
+  }
+
+  for (int i = 0; i < number_of_states; i++)
+  {
+    yval[i] = y0[i];
+    ypval[i] = yp0[i];
+  }
+
+  realtype t0 = RCONST(t[0]);
+  IDAReInit(ida_mem, t0, yy, yp);
+
+  int t_i = 1;
+  realtype tret;
+  realtype t_next;
+  realtype t_final = t[number_of_timesteps - 1];
+
+  t_return[0] = t[0];
   for (int j = 0; j < number_of_states; j++)
   {
     y_return[j] = yval[j];
@@ -368,12 +442,12 @@ Solution CasadiSolver::solve(np_array t_np, np_array y0_np, np_array yp0_np,
 
   // calculate consistent initial conditions
   DEBUG("IDACalcIC");
-  IDACalcIC(ida_mem, IDA_YA_YDP_INIT, t(1));
+  IDACalcIC(ida_mem, IDA_YA_YDP_INIT, t[1]);
 
   int retval;
   while (true)
   {
-    t_next = t(t_i);
+    t_next = t[t_i];
     IDASetStopTime(ida_mem, t_next);
     DEBUG("IDASolve");
     retval = IDASolve(ida_mem, t_final, &tret, yy, yp, IDA_NORMAL);
@@ -405,6 +479,14 @@ Solution CasadiSolver::solve(np_array t_np, np_array y0_np, np_array yp0_np,
       {
         break;
       }
+      if (t_i == number_of_timesteps)
+      {
+        // the last stop time is the final time, which newer versions of
+        // SUNDIALS report as IDA_TSTOP_RETURN rather than IDA_SUCCESS. Never
+        // write past the end of the return arrays
+        retval = IDA_SUCCESS;
+        break;
+      }
     }
     else
     {
@@ -413,49 +495,159 @@ Solution CasadiSolver::solve(np_array t_np, np_array y0_np, np_array yp0_np,
     }
   }
 
-  np_array t_ret = np_array(t_i, &t_return[0], free_t_when_done);
-  np_array y_ret =
-      np_array(t_i * number_of_states, &y_return[0], free_y_when_done);
-  np_array yS_ret = np_array(
-      std::vector<ptrdiff_t>{number_of_parameters, number_of_timesteps, number_of_states},
-      &yS_return[0], free_yS_when_done);
+  number_of_returned_timesteps = t_i;
+  return retval;
+}
 
-  Solution sol(retval, t_ret, y_ret, yS_ret);
+void CasadiSolver::print_stats()
+{
+  long nsteps, nrevals, nlinsetups, netfails;
+  int klast, kcur;
+  realtype hinused, hlast, hcur, tcur;
 
-  if (options.print_stats)
+  IDAGetIntegratorStats(ida_mem, &nsteps, &nrevals, &nlinsetups, &netfails,
+                        &klast, &kcur, &hinused, &hlast, &hcur, &tcur);
+
+  long nniters, nncfails;
+  IDAGetNonlinSolvStats(ida_mem, &nniters, &nncfails);
+
+  long int ngevalsBBDP = 0;
+  if (options.using_iterative_solver)
   {
-    long nsteps, nrevals, nlinsetups, netfails;
-    int klast, kcur;
-    realtype hinused, hlast, hcur, tcur;
+    IDABBDPrecGetNumGfnEvals(ida_mem, &ngevalsBBDP);
+  }
+
+  py::print("Solver Stats:");
+  py::print("\tNumber of steps =", nsteps);
+  py::print("\tNumber of calls to residual function =", nrevals);
+  py::print("\tNumber of calls to residual function in preconditioner =",
+            ngevalsBBDP);
+  py::print("\tNumber of linear solver setup calls =", nlinsetups);
+  py::print("\tNumber of error test failures =", netfails);
+  py::print("\tMethod order used on last step =", klast);
+  py::print("\tMethod order used on next step =", kcur);
+  py::print("\tInitial step size =", hinused);
+  py::print("\tStep size on last step =", hlast);
+  py::print("\tStep size on next step =", hcur);
+  py::print("\tCurrent internal time reached =", tcur);
+  py::print("\tNumber of nonlinear iterations performed =", nniters);
+  py::print("\tNumber of nonlinear convergence failures =", nncfails);
+}
 
-    IDAGetIntegratorStats(ida_mem, &nsteps, &nrevals, &nlinsetups, &netfails,
-                          &klast, &kcur, &hinused, &hlast, &hcur, &tcur);
+CasadiSolverGroup::CasadiSolverGroup(
+    std::vector<std::unique_ptr<CasadiSolver>> solvers)
+    : solvers(std::move(solvers))
+{
+}
 
-    long nniters, nncfails;
-    IDAGetNonlinSolvStats(ida_mem, &nniters, &nncfails);
+std::vector<Solution> CasadiSolverGroup::solve(np_array t_np,
+                                               np_array_dense y0_np,
+                                               np_array_dense yp0_np,
+                                               np_array_dense inputs)
+{
+  DEBUG("CasadiSolverGroup::solve");
+  // y0, yp0 and inputs have one row for each set of inputs
+  const int number_of_sets = y0_np.shape(0);
+  const int number_of_timesteps = t_np.request().size;
+  const int number_of_states = solvers[0]->number_of_states;
+  const int number_of_parameters = solvers[0]->number_of_parameters;
+  const int inputs_length = inputs.ndim() == 2 ? inputs.shape(1) : 0;
+
+  auto t_unchecked = t_np.unchecked<1>();
+  std::vector<realtype> t(number_of_timesteps);
+  for (int i = 0; i < number_of_timesteps; i++)
+  {
+    t[i] = t_unchecked(i);
+  }
+  const realtype *y0 = y0_np.data();
+  const realtype *yp0 = yp0_np.data();
+  const realtype *p_inputs = inputs.data();
+
+  // the results for all sets of inputs are stacked in the same arrays
+  const int t_size = number_of_timesteps;
+  const int y_size = number_of_timesteps * number_of_states;
+  const int yS_size = number_of_parameters * y_size;
+  realtype *t_return = new realtype[number_of_sets * t_size];
+  realtype *y_return = new realtype[number_of_sets * y_size];
+  realtype *yS_return = new realtype[number_of_sets * yS_size];
 
-    long int ngevalsBBDP = 0;
-    if (options.using_iterative_solver)
+  py::capsule free_t_when_done(t_return,
+                               [](void *f)
+                               {
+                                 realtype *vect =
+                                     reinterpret_cast<realtype *>(f);
+                                 delete[] vect;
+                               });
+  py::capsule free_y_when_done(y_return,
+                               [](void *f)
+                               {
+                                 realtype *vect =
+                                     reinterpret_cast<realtype *>(f);
+                                 delete[] vect;
+                               });
+  py::capsule free_yS_when_done(yS_return,
+                                [](void *f)
+                                {
+                                  realtype *vect =
+                                      reinterpret_cast<realtype *>(f);
+                                  delete[] vect;
+                                });
+
+  std::vector<int> retvals(number_of_sets);
+  std::vector<int> lengths(number_of_sets);
+  {
+    // the solvers don't touch any python objects, so other python threads can
+    // run while we integrate
+    py::gil_scoped_release release;
+
+    // each thread takes the next set of inputs until there are none left
+    std::atomic<int> next_set(0);
+    auto work = [&](CasadiSolver *solver)
+    {
+      for (int i = next_set++; i < number_of_sets; i = next_set++)
+      {
+        retvals[i] = solver->solve_into(
+            t.data(), number_of_timesteps, &y0[i * number_of_states],
+            &yp0[i * number_of_states], &p_inputs[i * inputs_length],
+            &t_return[i * t_size], &y_return[i * y_size],
+            &yS_return[i * yS_size], lengths[i]);
+      }
+    };
+
+    const int number_of_threads =
+        std::min(static_cast<int>(solvers.size()), number_of_sets);
+    std::vector<std::thread> threads;
+    for (int i = 0; i < number_of_threads; i++)
+    {
+      threads.emplace_back(work, solvers[i].get());
+    }
+    for (auto &thread : threads)
     {
-      IDABBDPrecGetNumGfnEvals(ida_mem, &ngevalsBBDP);
+      thread.join();
     }
+  }
 
-    py::print("Solver Stats:");
-    py::print("\tNumber of steps =", nsteps);
-    py::print("\tNumber of calls to residual function =", nrevals);
-    py::print("\tNumber of calls to residual function in preconditioner =",
-              ngevalsBBDP);
-    py::print("\tNumber of linear solver setup calls =", nlinsetups);
-    py::print("\tNumber of error test failures =", netfails);
-    py::print("\tMethod order used on last step =", klast);
-    py::print("\tMethod order used on next step =", kcur);
-    py::print("\tInitial step size =", hinused);
-    py::print("\tStep size on last step =", hlast);
-    py::print("\tStep size on next step =", hcur);
-    py::print("\tCurrent internal time reached =", tcur);
-    py::print("\tNumber of nonlinear iterations performed =", nniters);
-    py::print("\tNumber of nonlinear convergence failures =", nncfails);
+  // each solution is a view into the stacked arrays
+  std::vector<Solution> sols;
+  for (int i = 0; i < number_of_sets; i++)
+  {
+    np_array t_ret =
+        np_array(lengths[i], &t_return[i * t_size], free_t_when_done);
+    np_array y_ret = np_array(lengths[i] * number_of_states,
+                              &y_return[i * y_size], free_y_when_done);
+    np_array yS_ret = np_array(
+        std::vector<ptrdiff_t>{number_of_parameters, number_of_timesteps, number_of_states},
+        &yS_return[i * yS_size], free_yS_when_done);
+    sols.emplace_back(retvals[i], t_ret, y_ret, yS_ret);
   }
 
-  return sol;
+  if (solvers[0]->options.print_stats)
+  {
+    for (auto &solver : solvers)
+    {
+      solver->print_stats();
+    }
+  }
+
+  return sols;
 }
@@ -41,6 +41,32 @@ public:
 
   Solution solve(np_array t_np, np_array y0_np, np_array yp0_np,
                  np_array_dense inputs);
+
+  // Integrate into preallocated return arrays. This does not touch any python
+  // object, so can be called with the GIL released
+  int solve_into(const realtype *t, int number_of_timesteps,
+                 const realtype *y0, const realtype *yp0,
+                 const realtype *inputs, realtype *t_return,
+                 realtype *y_return, realtype *yS_return,
+                 int &number_of_returned_timesteps);
+
+  void print_stats();
+};
+
+// A group of solvers for the same model, each with their own IDA memory and
+// linear solver workspace, used to solve several sets of inputs in parallel
+class CasadiSolverGroup
+{
+public:
+  explicit CasadiSolverGroup(std::vector<std::unique_ptr<CasadiSolver>> solvers);
+  // The solvers own their IDA memory, so the group cannot be copied
+  CasadiSolverGroup(const CasadiSolverGroup &) = delete;
+  CasadiSolverGroup &operator=(const CasadiSolverGroup &) = delete;
+
+  std::vector<std::unique_ptr<CasadiSolver>> solvers;
+
+  std::vector<Solution> solve(np_array t_np, np_array_dense y0_np,
+                              np_array_dense yp0_np, np_array_dense inputs);
 };
 
 CasadiSolver *
@@ -56,4 +82,18 @@ create_casadi_solver(int number_of_states, int number_of_parameters,
                      np_array rhs_alg_id, np_array atol_np,
                      double rel_tol, int inputs_length, py::dict options);
 
+CasadiSolverGroup *
+create_casadi_solver_group(int number_of_threads,
+                           int number_of_states, int number_of_parameters,
+                           const Function &rhs_alg, const Function &jac_times_cjmass,
+                           const np_array_int &jac_times_cjmass_colptrs,
+                           const np_array_int &jac_times_cjmass_rowvals,
+                           const int jac_times_cjmass_nnz,
+                           const int jac_bandwidth_lower, const int jac_bandwidth_upper,
+                           const Function &jac_action,
+                           const Function &mass_action, const Function &sens,
+                           const Function &event, const int number_of_events,
+                           np_array rhs_alg_id, np_array atol_np,
+                           double rel_tol, int inputs_length, py::dict options);
+
 #endif // PYBAMM_IDAKLU_CASADI_SOLVER_HPP
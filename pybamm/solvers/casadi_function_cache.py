@@ -0,0 +1,142 @@
+#
+# Cache of CasADi functions created during solver set-up
+#
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+import casadi
+
+import pybamm
+from pybamm.model_cache import _stable_repr
+
+
+class CasadiFunctionCache:
+    """
+    A cache of the CasADi functions (and their Jacobians and sensitivities) created
+    when a solver is set up for a model in CasADi format. Entries are keyed by the
+    :meth:`pybamm.Symbol.id` of the discretised expression and by everything else
+    that determines the function (the inputs, sensitivities and sizes of the
+    model), so a new solver for the same model (e.g. the solvers created for each
+    operating condition of an experiment) reuses the functions instead of
+    converting the expression tree to CasADi again.
+
+    Entries are kept in memory, and the least recently used entries are dropped
+    once there are more than `maxsize` entries. If `directory` is given, entries are
+    also serialized to disk so that they can be reused by other processes. Since
+    :meth:`pybamm.Symbol.id` changes between processes, entries on disk are keyed
+    by a hash of the full expression tree instead.
+
+    The global instance used by the solvers is `pybamm.casadi_function_cache`.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries kept in memory. Default is 256. If 0, the
+        cache is disabled.
+    directory : str, optional
+        The directory in which to store entries on disk. Default is None, in which
+        case entries are only kept in memory.
+    """
+
+    def __init__(self, maxsize=256, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @directory.setter
+    def directory(self, directory):
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+
+    def get(self, symbol, key):
+        """
+        Get the functions for an expression, or None if they are not in the cache.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The discretised expression
+        key : tuple
+            Everything other than the expression that determines the functions
+        """
+        if self.maxsize == 0:
+            return None
+        memory_key = (symbol.id, key)
+        if memory_key in self._entries:
+            self._entries.move_to_end(memory_key)
+            self.hits += 1
+            return self._entries[memory_key]
+        if self.directory is not None:
+            try:
+                with open(self._path(symbol, key), "rb") as f:
+                    entry = pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                # A corrupt or incompatible entry is treated as a miss
+                pybamm.logger.warning(f"Could not load cached CasADi function: {e}")
+            else:
+                self._add(memory_key, entry)
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def set(self, symbol, key, entry):
+        """
+        Add the functions for an expression to the cache.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The discretised expression
+        key : tuple
+            Everything other than the expression that determines the functions
+        entry : tuple
+            The functions
+        """
+        if self.maxsize == 0:
+            return
+        self._add((symbol.id, key), entry)
+        if self.directory is not None:
+            # Write to a temporary file first, so that other processes never see a
+            # partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(symbol, key))
+
+    def clear(self):
+        """Remove all entries from memory (entries on disk are kept)"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _add(self, memory_key, entry):
+        self._entries[memory_key] = entry
+        self._entries.move_to_end(memory_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, symbol, key):
+        stable_repr = (
+            _stable_repr(symbol)
+            + _stable_repr(key)
+            + casadi.__version__
+            + pybamm.__version__
+        )
+        digest = hashlib.sha256(stable_repr.encode()).hexdigest()
+        return os.path.join(self.directory, digest + ".casadi")
+
+
+casadi_function_cache = CasadiFunctionCache()
@@ -2,9 +2,11 @@
 # CasADi Solver class
 #
 import casadi
+import os
 import pybamm
 import numpy as np
 import warnings
+from collections import OrderedDict
 from scipy.interpolate import interp1d
 
 
@@ -67,6 +69,18 @@ class CasadiSolver(pybamm.BaseSolver):
         Whether to perturb algebraic initial conditions to avoid a singularity. This
         can sometimes slow down the solver, but is kept True as default for "safe" mode
         as it seems to be more robust (False by default for other modes).
+    batch_inputs : bool, optional
+        Whether to solve a list of inputs with a single call to a mapped CasADi
+        integrator (see `casadi.Function.map`), evaluated on a pool of threads,
+        instead of integrating each set of inputs in a separate process. Only used
+        in "fast" and "fast with events" modes, or for models without events.
+        Default is False.
+    max_integrators : int, optional
+        The maximum number of CasADi integrators kept in memory (one integrator is
+        created for each model and grid). Once there are more integrators, those of
+        the least recently used model are dropped, least recently used first.
+        Default is 100. The number of integrators found in and missing from memory
+        are counted by the `integrator_hits` and `integrator_misses` attributes.
     """
 
     def __init__(
@@ -83,6 +97,8 @@ class CasadiSolver(pybamm.BaseSolver):
         extra_options_call=None,
         return_solution_if_failed_early=False,
         perturb_algebraic_initial_conditions=None,
+        batch_inputs=False,
+        max_integrators=100,
     ):
         super().__init__(
             "problem dependent",
@@ -106,6 +122,10 @@ class CasadiSolver(pybamm.BaseSolver):
         self.extra_options_setup = extra_options_setup or {}
         self.extra_options_call = extra_options_call or {}
         self.return_solution_if_failed_early = return_solution_if_failed_early
+        self.batch_inputs = batch_inputs
+        if max_integrators < 1:
+            raise ValueError("max_integrators must be at least 1")
+        self.max_integrators = max_integrators
 
         self._on_extrapolation = "error"
 
@@ -123,12 +143,22 @@ class CasadiSolver(pybamm.BaseSolver):
         self.name = "CasADi solver with '{}' mode".format(mode)
 
         # Initialize
-        self.integrators = {}
+        self.integrators = OrderedDict()
         self.integrator_specs = {}
         self.y_sols = {}
+        self.integrator_hits = 0
+        self.integrator_misses = 0
 
         pybamm.citations.register("Andersson2019")
 
+    _state_attributes = pybamm.BaseSolver._state_attributes + (
+        "integrators",
+        "integrator_specs",
+        "y_sols",
+        "integrator_hits",
+        "integrator_misses",
+    )
+
     def _integrate(self, model, t_eval, inputs_dict=None):
         """
         Solve a DAE model defined by residuals with initial conditions y0.
@@ -307,6 +337,36 @@ class CasadiSolver(pybamm.BaseSolver):
             solution.check_ys_are_not_too_large()
             return solution
 
+    def _integrate_batch(self, model, t_eval, inputs_list, nproc=None):
+        """
+        Solve a model for several sets of inputs. If `batch_inputs` is True and no
+        step-and-check integration is needed, all sets of inputs are integrated by a
+        single call to a mapped integrator. Otherwise, see
+        :meth:`pybamm.BaseSolver._integrate_batch`.
+        """
+        if not self.batch_inputs or (
+            self.mode in ["safe", "safe without grid"] and model.events
+        ):
+            return super()._integrate_batch(model, t_eval, inputs_list, nproc)
+
+        inputs = [casadi.vertcat(*x.values()) for x in inputs_list]
+        # Create an integrator with the grid, and map it over the inputs
+        self.create_integrator(
+            model,
+            inputs[0],
+            t_eval,
+            use_event_switch=self.mode == "fast with events",
+        )
+        solutions = self._run_integrator_batch(
+            model, model.y0, inputs_list, inputs, t_eval, nproc
+        )
+        for i, solution in enumerate(solutions):
+            # Check if the sign of an event changes, if so find an accurate
+            # termination point and exit
+            solutions[i] = self._solve_for_event(solution)
+            solutions[i].check_ys_are_not_too_large()
+        return solutions
+
     def _solve_for_event(self, coarse_solution):
         """
         Check if the sign of an event changes, if so find an accurate
@@ -487,33 +547,31 @@ class CasadiSolver(pybamm.BaseSolver):
     def create_integrator(self, model, inputs, t_eval=None, use_event_switch=False):
         """
         Method to create a casadi integrator object.
-        If t_eval is provided, the integrator uses t_eval to make the grid.
-        Otherwise, the integrator has grid [0,1].
+        If t_eval is provided, the integrator uses t_eval to make the grid (see
+        :meth:`_get_integrator_grid`). Otherwise, the integrator has grid [0,1].
         """
         pybamm.logger.debug("Creating CasADi integrator")
 
         # Use grid if t_eval is given
         use_grid = t_eval is not None
         if use_grid is True:
-            t_eval_shifted = t_eval - t_eval[0]
-            t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
+            grid, rescale_time = self._get_integrator_grid(model, t_eval)
+            grid_rounded = np.round(grid, decimals=12).tobytes()
+            key = grid_rounded
+        else:
+            rescale_time = True
+            key = "no grid"
+        # We don't need to create a new integrator if reusing the same grid
+        integrator = self._get_cached_integrator(model, key)
+        if integrator is not None:
+            return integrator
         # Only set up problem once
-        if model in self.integrators:
-            # If we're not using the grid, we don't need to change the integrator
-            if use_grid is False:
-                return self.integrators[model]["no grid"]
-            # Otherwise, create new integrator with an updated grid
-            # We don't need to update the grid if reusing the same t_eval
-            # (up to a shift by a constant)
-            else:
-                if t_eval_shifted_rounded in self.integrators[model]:
-                    return self.integrators[model][t_eval_shifted_rounded]
-                else:
-                    method, problem, options = self.integrator_specs[model]
-                    options["grid"] = t_eval_shifted
-                    integrator = casadi.integrator("F", method, problem, options)
-                    self.integrators[model][t_eval_shifted_rounded] = integrator
-                    return integrator
+        if model in self.integrator_specs:
+            # Create new integrator with an updated grid
+            method, problem, options = self.integrator_specs[model]
+            if use_grid is True:
+                options["grid"] = grid
+            integrator = casadi.integrator("F", method, problem, options)
         else:
             rhs = model.casadi_rhs
             algebraic = model.casadi_algebraic
@@ -534,7 +592,9 @@ class CasadiSolver(pybamm.BaseSolver):
             y_alg = casadi.MX.sym("y_alg", algebraic(0, y0, p).shape[0])
             y_full = casadi.vertcat(y_diff, y_alg)
 
-            if use_grid is False:
+            if use_grid is True:
+                options.update({"grid": grid, "output_t0": True})
+            if rescale_time is True:
                 # rescale time
                 t_min = casadi.MX.sym("t_min")
                 t_max = casadi.MX.sym("t_max")
@@ -543,7 +603,6 @@ class CasadiSolver(pybamm.BaseSolver):
                 # add time limits as inputs
                 p_with_tlims = casadi.vertcat(p, t_min, t_max)
             else:
-                options.update({"grid": t_eval_shifted, "output_t0": True})
                 # rescale time
                 t_min = casadi.MX.sym("t_min")
                 # Set dummy parameters for consistency with rescaled time
@@ -551,19 +610,26 @@ class CasadiSolver(pybamm.BaseSolver):
                 t_scaled = t_min + t
                 p_with_tlims = casadi.vertcat(p, t_min)
 
+            # evaluate the rhs, algebraic equations and switch events with a single
+            # call to the fused function, so that the terms they share are only
+            # evaluated once
+            rhs_eval, alg_eval, *switch_events_eval = model.casadi_rhs_algebraic_events(
+                t_scaled, y_full, p
+            )
+
             # define the event switch as the point when an event is crossed
             # we don't do this for ODE models
             # see #1082
             event_switch = 1
             if use_event_switch is True and not algebraic(0, y0, p).is_empty():
-                for event in model.casadi_switch_events:
-                    event_switch *= event(t_scaled, y_full, p)
+                for event_eval in switch_events_eval:
+                    event_switch *= event_eval
 
             problem = {
                 "t": t,
                 "x": y_diff,
                 # rescale rhs by (t_max - t_min)
-                "ode": (t_max_minus_t_min) * rhs(t_scaled, y_full, p) * event_switch,
+                "ode": (t_max_minus_t_min) * rhs_eval * event_switch,
                 "p": p_with_tlims,
             }
             if algebraic(0, y0, p).is_empty():
@@ -573,17 +639,67 @@ class CasadiSolver(pybamm.BaseSolver):
                 problem.update(
                     {
                         "z": y_alg,
-                        "alg": algebraic(t_scaled, y_full, p),
+                        "alg": alg_eval,
                     }
                 )
             integrator = casadi.integrator("F", method, problem, options)
             self.integrator_specs[model] = method, problem, options
-            if use_grid is False:
-                self.integrators[model] = {"no grid": integrator}
-            else:
-                self.integrators[model] = {t_eval_shifted_rounded: integrator}
+        self._cache_integrator(model, key, integrator)
+        return integrator
 
-            return integrator
+    def _get_cached_integrator(self, model, key):
+        """
+        Get an integrator from memory, or None if it is not in memory, and mark it
+        as the most recently used integrator
+        """
+        try:
+            integrator = self.integrators[model][key]
+        except KeyError:
+            self.integrator_misses += 1
+            return None
+        self.integrators.move_to_end(model)
+        self.integrators[model].move_to_end(key)
+        self.integrator_hits += 1
+        return integrator
+
+    def _cache_integrator(self, model, key, integrator):
+        """
+        Keep an integrator in memory, dropping the least recently used integrators
+        if there are more than `max_integrators`
+        """
+        if model not in self.integrators:
+            self.integrators[model] = OrderedDict()
+        self.integrators.move_to_end(model)
+        self.integrators[model][key] = integrator
+        n_integrators = sum(len(x) for x in self.integrators.values())
+        while n_integrators > self.max_integrators:
+            lru_model, lru_integrators = next(iter(self.integrators.items()))
+            lru_integrators.popitem(last=False)
+            if len(lru_integrators) == 0:
+                # also drop the problem set up for the model
+                del self.integrators[lru_model]
+                self.integrator_specs.pop(lru_model, None)
+            n_integrators -= 1
+
+    def _get_integrator_grid(self, model, t_eval):
+        """
+        Get the grid of the integrator used to integrate over t_eval, and whether
+        that integrator rescales time to (0,1).
+
+        For step-and-check integration in "safe" mode, time is rescaled so that all
+        windows that are the same up to a shift and a rescaling (e.g. all windows of
+        n equally spaced times) share a single integrator, instead of creating a new
+        integrator for each window. Otherwise, the grid is t_eval shifted to start
+        at zero.
+        """
+        if self.mode == "safe" and model.events:
+            dt = np.diff(t_eval)
+            if np.allclose(dt, dt[0], rtol=1e-10, atol=0):
+                grid = np.linspace(0, 1, len(t_eval))
+            else:
+                grid = (t_eval - t_eval[0]) / (t_eval[-1] - t_eval[0])
+            return grid, True
+        return t_eval - t_eval[0], False
 
     def _run_integrator(
         self,
@@ -630,38 +746,25 @@ class CasadiSolver(pybamm.BaseSolver):
             extract_sensitivities_in_solution = explicit_sensitivities
 
         if use_grid is True:
-            pybamm.logger.spam("Calculating t_eval_shifted")
-            t_eval_shifted = t_eval - t_eval[0]
-            t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
-            pybamm.logger.spam("Finished calculating t_eval_shifted")
-            integrator = self.integrators[model][t_eval_shifted_rounded]
+            pybamm.logger.spam("Calculating grid")
+            grid, rescale_time = self._get_integrator_grid(model, t_eval)
+            grid_rounded = np.round(grid, decimals=12).tobytes()
+            pybamm.logger.spam("Finished calculating grid")
+            integrator = self.integrators[model][grid_rounded]
         else:
             integrator = self.integrators[model]["no grid"]
 
-        len_rhs = model.concatenated_rhs.size
-        len_alg = model.concatenated_algebraic.size
-
-        # Check y0 to see if it includes sensitivities
-        if explicit_sensitivities:
-            num_parameters = model.len_rhs_sens // model.len_rhs
-            len_rhs = len_rhs * (num_parameters + 1)
-            len_alg = len_alg * (num_parameters + 1)
-
-        y0_diff = y0[:len_rhs]
-        y0_alg = y0[len_rhs:]
-        if self.perturb_algebraic_initial_conditions and len_alg > 0:
-            # Add a tiny perturbation to the algebraic initial conditions
-            # For some reason this helps with convergence
-            # The actual value of the initial conditions for the algebraic variables
-            # doesn't matter
-            y0_alg = y0_alg * (1 + 1e-6 * casadi.DM(np.random.rand(len_alg)))
+        y0_diff, y0_alg = self._split_y0(model, y0)
         pybamm.logger.spam("Finished preliminary setup for integrator run")
 
         # Solve
         # Try solving
         if use_grid is True:
             t_min = t_eval[0]
-            inputs_with_tmin = casadi.vertcat(inputs, t_min)
+            if rescale_time is True:
+                inputs_with_tmin = casadi.vertcat(inputs, t_min, t_eval[-1])
+            else:
+                inputs_with_tmin = casadi.vertcat(inputs, t_min)
             # Call the integrator once, with the grid
             timer = pybamm.Timer()
             pybamm.logger.debug("Calling casadi integrator")
@@ -726,3 +829,100 @@ class CasadiSolver(pybamm.BaseSolver):
             )
             sol.integration_time = integration_time
             return sol
+
+    def _run_integrator_batch(
+        self, model, y0, inputs_dicts, inputs, t_eval, nproc=None
+    ):
+        """
+        Run the integrator with the grid for several sets of inputs at once, by
+        mapping it over the inputs.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose solution to calculate.
+        y0:
+            casadi vector of initial conditions, shared by all sets of inputs
+        inputs_dicts : list of dict
+            The input parameters to pass to the model when solving
+        inputs: list
+            Casadi vector of inputs for each set of inputs
+        t_eval : numeric type
+            The times at which to compute the solution
+        nproc : int, optional
+            Number of threads used to evaluate the mapped integrator. Defaults to
+            value returned by "os.cpu_count()".
+        """
+        pybamm.logger.debug("Running mapped CasADi integrator")
+
+        ninputs = len(inputs)
+        nproc = nproc or os.cpu_count()
+        t_eval_shifted = t_eval - t_eval[0]
+        t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
+        # Only map the integrator once for each grid and number of inputs
+        key = (t_eval_shifted_rounded, ninputs, nproc)
+        mapped_integrator = self._get_cached_integrator(model, key)
+        if mapped_integrator is None:
+            integrator = self.integrators[model][t_eval_shifted_rounded]
+            mapped_integrator = integrator.map(ninputs, "thread", nproc)
+            self._cache_integrator(model, key, mapped_integrator)
+
+        y0_diff, y0_alg = self._split_y0(model, y0)
+        inputs_with_tmin = casadi.horzcat(
+            *[casadi.vertcat(inp, t_eval[0]) for inp in inputs]
+        )
+        timer = pybamm.Timer()
+        try:
+            casadi_sol = mapped_integrator(
+                x0=casadi.repmat(y0_diff, 1, ninputs),
+                z0=casadi.repmat(y0_alg, 1, ninputs),
+                p=inputs_with_tmin,
+                **self.extra_options_call,
+            )
+        except RuntimeError as error:
+            # If it doesn't work raise error
+            pybamm.logger.debug(f"Casadi integrator failed with error {error}")
+            raise pybamm.SolverError(error.args[0])
+        integration_time = timer.time()
+
+        # The outputs for each set of inputs are concatenated horizontally
+        y_sol = casadi.vertcat(casadi_sol["xf"], casadi_sol["zf"])
+        n_t = len(t_eval)
+        solutions = []
+        for i, inputs_dict in enumerate(inputs_dicts):
+            sol = pybamm.Solution(
+                t_eval,
+                y_sol[:, i * n_t : (i + 1) * n_t],
+                model,
+                inputs_dict,
+                sensitivities=bool(model.calculate_sensitivities),
+                check_solution=False,
+            )
+            # all solutions share the same integrator call
+            sol.integration_time = integration_time
+            solutions.append(sol)
+        return solutions
+
+    def _split_y0(self, model, y0):
+        """
+        Split the initial conditions into differential and algebraic parts, adding a
+        tiny perturbation to the algebraic part if required
+        """
+        len_rhs = model.concatenated_rhs.size
+        len_alg = model.concatenated_algebraic.size
+
+        # Check y0 to see if it includes sensitivities
+        if model.calculate_sensitivities:
+            num_parameters = model.len_rhs_sens // model.len_rhs
+            len_rhs = len_rhs * (num_parameters + 1)
+            len_alg = len_alg * (num_parameters + 1)
+
+        y0_diff = y0[:len_rhs]
+        y0_alg = y0[len_rhs:]
+        if self.perturb_algebraic_initial_conditions and len_alg > 0:
+            # Add a tiny perturbation to the algebraic initial conditions
+            # For some reason this helps with convergence
+            # The actual value of the initial conditions for the algebraic variables
+            # doesn't matter
+            y0_alg = y0_alg * (1 + 1e-6 * casadi.DM(np.random.rand(len_alg)))
+        return y0_diff, y0_alg
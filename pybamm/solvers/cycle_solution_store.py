@@ -0,0 +1,189 @@
+#
+# Append-only on-disk store of cycle solutions
+#
+import json
+import numbers
+import os
+import tempfile
+
+import casadi
+import numpy as np
+
+import pybamm
+from pybamm.solvers.solution import NumpyEncoder, _make_cycle_solution_from_steps
+
+
+class CycleSolutionStore:
+    """
+    An append-only on-disk store of the cycle solutions of an experiment, which can be
+    passed to :meth:`pybamm.Simulation.solve` (`cycle_store=...`) so that long
+    experiments (e.g. ageing studies with thousands of cycles) do not keep all the
+    cycle solutions in memory.
+
+    Each completed cycle is written to its own `.npz` file in `directory`, containing
+    the times, states and inputs of each of its steps as well as the cycle summary
+    variables, and is then dropped from memory. The store behaves like the list of
+    cycles of a solution: indexing it (e.g. `solution.cycles[i]`) loads that cycle
+    from disk again. Only references to the (shared) models are kept in memory.
+    Explicit sensitivities are not stored.
+
+    Parameters
+    ----------
+    directory : str
+        The directory in which to store the cycles. It is created if it does not
+        exist.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # For each cycle: None if the cycle was not saved, otherwise the models of
+        # each step (one per sub-solution, None for empty steps)
+        self._cycle_models = []
+
+    def __len__(self):
+        return len(self._cycle_models)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("cycle index out of range")
+        if self._cycle_models[index] is None:
+            return None
+        return self._load(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _path(self, index):
+        return os.path.join(self.directory, f"cycle_{index:06d}.npz")
+
+    def append(self, cycle_solution):
+        """
+        Write a cycle solution to disk.
+
+        Parameters
+        ----------
+        cycle_solution : :class:`pybamm.Solution` or None
+            The solution of the cycle, with attributes `steps` and
+            `cycle_summary_variables` (see :func:`pybamm.make_cycle_solution`), or
+            None if the cycle was not saved
+        """
+        if cycle_solution is None:
+            self._cycle_models.append(None)
+            return
+
+        arrays = {}
+        steps_metadata = []
+        steps_models = []
+        for step in cycle_solution.steps:
+            if isinstance(step, pybamm.EmptySolution):
+                steps_metadata.append(
+                    {"empty": True, "termination": step.termination, "t": step.t}
+                )
+                steps_models.append(None)
+                continue
+            i = len(steps_metadata)
+            for j, (ts, ys) in enumerate(zip(step.all_ts, step.all_ys)):
+                if isinstance(ys, casadi.DM):
+                    ys = ys.full()
+                arrays[f"t_{i}_{j}"] = ts
+                arrays[f"y_{i}_{j}"] = ys
+            for name in ["t_event", "y_event"]:
+                value = getattr(step, name)
+                if value is not None:
+                    arrays[f"{name}_{i}"] = np.asarray(value)
+            steps_metadata.append(
+                {
+                    "empty": False,
+                    "termination": step.termination,
+                    "inputs": step.all_inputs,
+                    "closest_event_idx": None
+                    if step.closest_event_idx is None
+                    else int(step.closest_event_idx),
+                    "times": [
+                        _time_to_float(step.solve_time),
+                        _time_to_float(step.integration_time),
+                        _time_to_float(step.set_up_time),
+                    ],
+                }
+            )
+            steps_models.append(step.all_models)
+
+        summary_variables = {
+            name: float(value) if isinstance(value, numbers.Number) else value
+            for name, value in cycle_solution.cycle_summary_variables.items()
+        }
+        metadata = {"steps": steps_metadata, "summary variables": summary_variables}
+        arrays["metadata"] = np.array(json.dumps(metadata, cls=NumpyEncoder))
+
+        # Write to a temporary file first, so that a partially written cycle is never
+        # read
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, self._path(len(self)))
+        self._cycle_models.append(steps_models)
+
+    def _load(self, index):
+        steps_models = self._cycle_models[index]
+        with np.load(self._path(index)) as data:
+            metadata = json.loads(data["metadata"].item())
+            steps = []
+            for i, (step_metadata, models) in enumerate(
+                zip(metadata["steps"], steps_models)
+            ):
+                if step_metadata["empty"]:
+                    steps.append(
+                        pybamm.EmptySolution(
+                            step_metadata["termination"], np.array(step_metadata["t"])
+                        )
+                    )
+                    continue
+                all_ts = [data[f"t_{i}_{j}"] for j in range(len(models))]
+                all_ys = [data[f"y_{i}_{j}"] for j in range(len(models))]
+                all_inputs = [
+                    {name: np.array(value) for name, value in inputs.items()}
+                    for inputs in step_metadata["inputs"]
+                ]
+                t_event = data[f"t_event_{i}"] if f"t_event_{i}" in data else None
+                y_event = data[f"y_event_{i}"] if f"y_event_{i}" in data else None
+                step = pybamm.Solution(
+                    all_ts,
+                    all_ys,
+                    models,
+                    all_inputs,
+                    t_event,
+                    y_event,
+                    step_metadata["termination"],
+                    check_solution=False,
+                )
+                step.closest_event_idx = step_metadata["closest_event_idx"]
+                (
+                    step.solve_time,
+                    step.integration_time,
+                    step.set_up_time,
+                ) = [_float_to_time(time) for time in step_metadata["times"]]
+                steps.append(step)
+
+        cycle_solution = _make_cycle_solution_from_steps(steps)
+        cycle_solution.cycle_summary_variables = pybamm.FuzzyDict(
+            metadata["summary variables"]
+        )
+        return cycle_solution
+
+
+def _time_to_float(time):
+    if isinstance(time, pybamm.TimerTime):
+        return time.value
+    return time
+
+
+def _float_to_time(time):
+    if time is None:
+        return None
+    return pybamm.TimerTime(time)
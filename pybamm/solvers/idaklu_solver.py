@@ -5,6 +5,7 @@ import casadi
 import pybamm
 import numpy as np
 import numbers
+import os
 import scipy.sparse as sparse
 
 import importlib
@@ -415,7 +416,9 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 "number_of_sensitivity_parameters": number_of_sensitivity_parameters,
             }
 
-            solver = idaklu.create_casadi_solver(
+            # arguments to create a solver, also used to create groups of solvers
+            # for solving several sets of inputs in parallel
+            self._setup["solver_args"] = [
                 len(y0),
                 self._setup["number_of_sensitivity_parameters"],
                 self._setup["rhs_algebraic"],
@@ -435,9 +438,11 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 rtol,
                 len(inputs),
                 self._options,
-            )
+            ]
+            solver = idaklu.create_casadi_solver(*self._setup["solver_args"])
 
             self._setup["solver"] = solver
+            self._setup["solver_group"] = None
         else:
             self._setup = {
                 "resfn": resfn,
@@ -522,13 +527,69 @@ class IDAKLUSolver(pybamm.BaseSolver):
             )
         integration_time = timer.time()
 
+        return self._post_process_solution(sol, model, inputs_dict, integration_time)
+
+    def _integrate_batch(self, model, t_eval, inputs_list, nproc=None):
+        """
+        Solve a model for several sets of inputs. For models in casadi format, all
+        sets of inputs are solved by a single call to the IDAKLU extension, which
+        solves them in parallel on a pool of native threads (each with its own
+        solver memory). Otherwise, see :meth:`pybamm.BaseSolver._integrate_batch`.
+        """
+        if model.convert_to_format != "casadi":
+            return super()._integrate_batch(model, t_eval, inputs_list, nproc)
+
+        # Create a group of solvers, one for each thread
+        nproc = nproc or os.cpu_count()
+        solver_group = self._setup["solver_group"]
+        if solver_group is None or solver_group[0] != nproc:
+            solver_group = (
+                nproc,
+                idaklu.create_casadi_solver_group(nproc, *self._setup["solver_args"]),
+            )
+            self._setup["solver_group"] = solver_group
+
+        # stack inputs, with one row for each set of inputs
+        inputs = np.vstack(
+            [
+                np.concatenate(
+                    [np.array(x).reshape(-1) for x in inputs_dict.values()]
+                    or [np.array([])]
+                )
+                for inputs_dict in inputs_list
+            ]
+        )
+
+        # all sets of inputs start from the same initial conditions
+        y0 = model.y0
+        if isinstance(y0, casadi.DM):
+            y0 = y0.full()
+        y0 = np.tile(y0.flatten(), (len(inputs_list), 1))
+
+        # solver works with ydot0 set to zero
+        ydot0 = np.zeros_like(y0)
+
+        timer = pybamm.Timer()
+        sols = solver_group[1].solve(t_eval, y0, ydot0, inputs)
+        integration_time = timer.time()
+
+        return [
+            self._post_process_solution(sol, model, inputs_dict, integration_time)
+            for sol, inputs_dict in zip(sols, inputs_list)
+        ]
+
+    def _post_process_solution(self, sol, model, inputs_dict, integration_time):
+        """
+        Convert a solution returned by the IDAKLU extension into a
+        :class:`pybamm.Solution`
+        """
         number_of_sensitivity_parameters = self._setup[
             "number_of_sensitivity_parameters"
         ]
         sensitivity_names = self._setup["sensitivity_names"]
         t = sol.t
         number_of_timesteps = t.size
-        number_of_states = y0.size
+        number_of_states = sol.y.size // number_of_timesteps
         y_out = sol.y.reshape((number_of_timesteps, number_of_states))
 
         # return sensitivity solution, we need to flatten yS to
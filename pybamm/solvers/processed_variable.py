@@ -47,6 +47,7 @@ class ProcessedVariable(object):
 
         self.all_ts = solution.all_ts
         self.all_ys = solution.all_ys
+        self.all_models = solution.all_models
         self.all_inputs = solution.all_inputs
         self.all_inputs_casadi = solution.all_inputs_casadi
 
@@ -63,18 +64,28 @@ class ProcessedVariable(object):
         # Store time
         self.t_pts = solution.t
 
-        # Evaluate base variable at initial time
-        self.base_eval = self.base_variables_casadi[0](
-            self.all_ts[0][0], self.all_ys[0][:, 0], self.all_inputs_casadi[0]
+        # Evaluate base variable at initial time. If the solution has no time points,
+        # evaluate it at zero states instead, which is only used to find its shape
+        for i, ts in enumerate(self.all_ts):
+            if len(ts) > 0:
+                t_0, y_0 = ts[0], self.all_ys[i][:, 0]
+                break
+        else:
+            i, t_0, y_0 = 0, 0, np.zeros(self.all_ys[0].shape[0])
+        self.base_eval = self.base_variables_casadi[i](
+            t_0, y_0, self.all_inputs_casadi[i]
         ).full()
 
+        # Find the shape of the variable. The variable is only evaluated at all the
+        # time points of the solution when its entries (or anything that depends on
+        # them) are first needed, see __getattr__
         # handle 2D (in space) finite element variables differently
         if (
             self.mesh
             and "current collector" in self.domain
             and isinstance(self.mesh, pybamm.ScikitSubMesh2D)
         ):
-            self.initialise_2D_scikit_fem()
+            self._initialise = "initialise_2D_scikit_fem"
 
         # check variable shape
         else:
@@ -83,13 +94,13 @@ class ProcessedVariable(object):
                 or len(self.base_eval.shape) == 0
                 or self.base_eval.shape[0] == 1
             ):
-                self.initialise_0D()
+                self._initialise = "initialise_0D"
             else:
                 n = self.mesh.npts
                 base_shape = self.base_eval.shape[0]
                 # Try some shapes that could make the variable a 1D variable
                 if base_shape in [n, n + 1]:
-                    self.initialise_1D()
+                    self._initialise = "initialise_1D"
                 else:
                     # Try some shapes that could make the variable a 2D variable
                     first_dim_nodes = self.mesh.nodes
@@ -99,7 +110,7 @@ class ProcessedVariable(object):
                         len(first_dim_nodes),
                         len(first_dim_edges),
                     ]:
-                        self.initialise_2D()
+                        self._initialise = "initialise_2D"
                     else:
                         # Raise error for 3D variable
                         raise NotImplementedError(
@@ -107,31 +118,167 @@ class ProcessedVariable(object):
                             + "(note processing of 3D variables is not yet implemented)"
                         )
 
-    def initialise_0D(self):
-        # initialise empty array of the correct size
-        entries = np.empty(len(self.t_pts))
-        idx = 0
+    def __getattr__(self, name):
+        # Only called for attributes that have not been set yet. The attributes that
+        # depend on the entries of the variable (entries, dimensions, interpolation
+        # function, spatial points, ...) are set on first access
+        initialise = self.__dict__.get("_initialise")
+        if initialise is None or self.__dict__.get("_initialising"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        # The variable is only marked as initialised once the initialiser succeeds.
+        # An AttributeError from inside the initialiser is re-raised with a message
+        # that says so, keeping the original error as its cause, so that it is not
+        # mistaken for the requested attribute not existing (while `hasattr` and
+        # `getattr` with a default still work)
+        self._initialising = True
+        try:
+            getattr(self, initialise)()
+        except AttributeError as error:
+            raise AttributeError(
+                f"Failed to initialise the processed variable while getting '{name}': "
+                f"{error}"
+            ) from error
+        finally:
+            self._initialising = False
+        self._initialise = None
+        return getattr(self, name)
+
+    def at(self, t):
+        """
+        Evaluate the variable at some times, or restrict it to a time window, only
+        evaluating the base variables at the time points of the solution that are
+        needed (rather than at all of them, as :attr:`entries` does).
+
+        Parameters
+        ----------
+        t : slice, float or array-like
+            If a slice, `slice(t_start, t_stop)` (either of which can be None), the
+            variable restricted to the time points of the solution between `t_start`
+            and `t_stop` (inclusive) is returned, as a new
+            :class:`pybamm.ProcessedVariable`. Sensitivities are not available for
+            the restricted variable. Otherwise, the times (in seconds) at which to
+            evaluate the variable, by linear interpolation between the two time
+            points of the solution either side of each time.
+
+        Returns
+        -------
+        :class:`pybamm.ProcessedVariable` or :class:`numpy.ndarray`
+            The restricted variable if `t` is a slice, otherwise the values of the
+            variable, of shape (spatial shape of the entries) + shape of `t`. Values
+            outside the time range of the solution are 'nan'.
+        """
+        if isinstance(t, slice):
+            if t.step is not None:
+                raise ValueError("Time slices with a step are not supported")
+            start = 0 if t.start is None else np.searchsorted(self.t_pts, t.start)
+            stop = (
+                len(self.t_pts)
+                if t.stop is None
+                else np.searchsorted(self.t_pts, t.stop, side="right")
+            )
+            if start >= stop:
+                raise ValueError(
+                    f"No time points of the solution between {t.start} and {t.stop}"
+                )
+            return self._restrict(np.arange(start, stop))
+
+        t = np.asarray(t, dtype=float)
+        t_flat = t.ravel()
+        n_t = len(self.t_pts)
+        upper = np.clip(np.searchsorted(self.t_pts, t_flat), 1, max(n_t - 1, 1))
+        lower = np.minimum(upper - 1, n_t - 1)
+        upper = np.minimum(upper, n_t - 1)
+        columns = np.unique(np.concatenate([lower, upper]))
+        if "entries" in self.__dict__ or self.cumtrapz_ic is not None:
+            entries = self.entries[..., columns]
+        else:
+            entries = self._restrict(columns).entries
+        lower_entries = entries[..., np.searchsorted(columns, lower)]
+        upper_entries = entries[..., np.searchsorted(columns, upper)]
+        dt = self.t_pts[upper] - self.t_pts[lower]
+        weights = np.divide(
+            t_flat - self.t_pts[lower], dt, out=np.zeros_like(t_flat), where=dt != 0
+        )
+        out = lower_entries + weights * (upper_entries - lower_entries)
+        out[..., (t_flat < self.t_pts[0]) | (t_flat > self.t_pts[-1])] = np.nan
+        return np.reshape(out, entries.shape[:-1] + t.shape)
+
+    def _restrict(self, columns):
+        """
+        The variable restricted to some time points (sorted indices of `t_pts`),
+        evaluating the base variables only at those time points
+        """
+        all_ts, all_ys, all_models, all_inputs = [], [], [], []
+        base_variables, base_variables_casadi = [], []
+        start = 0
+        for i, ts in enumerate(self.all_ts):
+            end = start + len(ts)
+            local_columns = columns[(columns >= start) & (columns < end)] - start
+            if len(local_columns) > 0:
+                all_ts.append(ts[local_columns])
+                all_ys.append(self.all_ys[i][:, local_columns])
+                all_models.append(self.all_models[i])
+                all_inputs.append(self.all_inputs[i])
+                base_variables.append(self.base_variables[i])
+                base_variables_casadi.append(self.base_variables_casadi[i])
+            start = end
+        solution = pybamm.Solution(
+            all_ts, all_ys, all_models, all_inputs, check_solution=False
+        )
+        restricted = ProcessedVariable(
+            base_variables,
+            base_variables_casadi,
+            solution,
+            warn=self.warn,
+            cumtrapz_ic=self.cumtrapz_ic,
+        )
+        if self.cumtrapz_ic is not None:
+            # integrals depend on all the time points before the requested ones, so
+            # take the entries of the full variable
+            restricted._initialise = None
+            restricted.initialise_0D(self.entries[columns])
+        return restricted
 
-        entries = np.empty(len(self.t_pts))
-        idx = 0
-        # Evaluate the base_variable index-by-index
+    def _evaluate_all_timesteps(self):
+        """
+        Evaluate the base variables at all the time points of the solution. Each
+        CasADi function is called once per sub-solution, with the times as a row
+        vector and the states as a matrix, so that CasADi evaluates all the columns
+        in a single call instead of one call per time point.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of size (n, len(t_pts)), where n is the size of the base variable
+        """
+        entries = []
         for ts, ys, inputs, base_var_casadi in zip(
             self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
         ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[idx] = float(base_var_casadi(t, y, inputs))
-
-                idx += 1
-
-        if self.cumtrapz_ic is not None:
-            entries = cumulative_trapezoid(
-                entries, self.t_pts, initial=float(self.cumtrapz_ic)
-            )
+            if len(ts) == 0:
+                continue
+            entries.append(base_var_casadi(np.reshape(ts, (1, -1)), ys, inputs).full())
+        if len(entries) == 0:
+            # the solution has no time points
+            return np.empty((self.base_eval.shape[0], 0))
+        return np.concatenate(entries, axis=1)
+
+    def initialise_0D(self, entries=None):
+        if entries is None:
+            entries = self._evaluate_all_timesteps()[0]
+
+            if self.cumtrapz_ic is not None and len(entries) > 0:
+                entries = cumulative_trapezoid(
+                    entries, self.t_pts, initial=float(self.cumtrapz_ic)
+                )
 
         # set up interpolation
-        if len(self.t_pts) == 1:
+        if len(self.t_pts) == 0:
+            # nothing to interpolate (see __call__)
+            self._interpolation_function = None
+        elif len(self.t_pts) == 1:
             # Variable is just a scalar value, but we need to create a callable
             # function to be consistent with other processed variables
             self._interpolation_function = Interpolant0D(entries)
@@ -148,19 +295,7 @@ class ProcessedVariable(object):
         self.dimensions = 0
 
     def initialise_1D(self, fixed_t=False):
-        len_space = self.base_eval.shape[0]
-        entries = np.empty((len_space, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, idx] = base_var_casadi(t, y, inputs).full()[:, 0]
-                idx += 1
+        entries = self._evaluate_all_timesteps()
 
         # Get node and edge values
         nodes = self.mesh.nodes
@@ -211,7 +346,10 @@ class ProcessedVariable(object):
         self.first_dim_pts = edges
 
         # set up interpolation
-        if len(self.t_pts) == 1:
+        if len(self.t_pts) == 0:
+            # nothing to interpolate (see __call__)
+            self._interpolation_function = None
+        elif len(self.t_pts) == 1:
             # function of space only
             self._interpolation_function = Interpolant1D(
                 pts_for_interp, entries_for_interp
@@ -244,22 +382,11 @@ class ProcessedVariable(object):
         second_dim_pts = second_dim_nodes
         first_dim_size = len(first_dim_pts)
         second_dim_size = len(second_dim_pts)
-        entries = np.empty((first_dim_size, second_dim_size, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, :, idx] = np.reshape(
-                    base_var_casadi(t, y, inputs).full(),
-                    [first_dim_size, second_dim_size],
-                    order="F",
-                )
-                idx += 1
+        entries = np.reshape(
+            self._evaluate_all_timesteps(),
+            [first_dim_size, second_dim_size, len(self.t_pts)],
+            order="F",
+        )
 
         # add points outside first dimension domain for extrapolation to
         # boundaries
@@ -362,7 +489,10 @@ class ProcessedVariable(object):
         self.second_dim_pts = second_dim_edges
 
         # set up interpolation
-        if len(self.t_pts) == 1:
+        if len(self.t_pts) == 0:
+            # nothing to interpolate (see __call__)
+            self._interpolation_function = None
+        elif len(self.t_pts) == 1:
             # function of space only. Note the order of the points is the reverse
             # of what you'd expect
             self._interpolation_function = Interpolant2D(
@@ -383,22 +513,9 @@ class ProcessedVariable(object):
         len_y = len(y_sol)
         z_sol = self.mesh.edges["z"]
         len_z = len(z_sol)
-        entries = np.empty((len_y, len_z, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, :, idx] = np.reshape(
-                    base_var_casadi(t, y, inputs).full(),
-                    [len_y, len_z],
-                    order="C",
-                )
-                idx += 1
+        entries = np.reshape(
+            self._evaluate_all_timesteps(), [len_y, len_z, len(self.t_pts)], order="C"
+        )
 
         # assign attributes for reference
         self.entries = entries
@@ -411,7 +528,10 @@ class ProcessedVariable(object):
         self.second_dim_pts = z_sol
 
         # set up interpolation
-        if len(self.t_pts) == 1:
+        if len(self.t_pts) == 0:
+            # nothing to interpolate (see __call__)
+            self._interpolation_function = None
+        elif len(self.t_pts) == 1:
             # function of space only. Note the order of the points is the reverse
             # of what you'd expect
             self._interpolation_function = Interpolant2D(
@@ -432,6 +552,13 @@ class ProcessedVariable(object):
         Evaluate the variable at arbitrary *dimensional* t (and x, r, y, z and/or R),
         using interpolation
         """
+        if len(self.t_pts) == 0:
+            raise ValueError(
+                "Cannot evaluate variable {} as the solution has no time points".format(
+                    self.base_variables
+                )
+            )
+
         # If t is None and there is only one value of time in the soluton (i.e.
         # the solution is independent of time) then we set t equal to the value
         # stored in the solution. If the variable is constant (doesn't depend on
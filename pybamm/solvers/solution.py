@@ -25,6 +25,114 @@ class NumpyEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)  # pragma: no cover
 
 
+class _SharedSegments:
+    """
+    The segments of one or several solutions, and the concatenation of the first
+    segments (stored in a buffer whose capacity is doubled when it is full, so that
+    concatenating segments one by one has amortised linear cost)
+    """
+
+    __slots__ = ("items", "buffer", "n_concatenated", "offsets")
+
+    def __init__(self, items):
+        self.items = items
+        self.buffer = None
+        self.n_concatenated = 0
+        self.offsets = [0]
+
+
+class _SegmentList:
+    """
+    A view of the first `n` segments of a list of segments (e.g. the times or states
+    of the sub-solutions of a solution) that is only ever appended to. Solutions
+    created by adding solutions together (see :meth:`Solution.__add__`) share their
+    segments, so that adding a solution only appends its segments, instead of
+    copying the segments of all the previous solutions, and concatenating the
+    segments (e.g. to get :attr:`Solution.t`) only copies the segments that have
+    not been concatenated before.
+    """
+
+    __slots__ = ("_shared", "_n")
+
+    def __init__(self, items, _shared=None):
+        if _shared is None:
+            _shared = _SharedSegments(list(items))
+        self._shared = _shared
+        self._n = len(_shared.items)
+
+    def __len__(self):
+        return self._n
+
+    def __reduce__(self):
+        # Only pickle the segments in this view
+        return (_SegmentList, (self.items,))
+
+    @property
+    def items(self):
+        items = self._shared.items
+        if len(items) == self._n:
+            return items
+        return items[: self._n]
+
+    def extend(self, new_items):
+        """
+        Return a list of the segments in this view followed by `new_items`. The
+        segments are shared with this view if it is a view of all the segments
+        """
+        shared = self._shared
+        if len(shared.items) == self._n:
+            shared.items.extend(new_items)
+        else:
+            shared = _SharedSegments(shared.items[: self._n] + list(new_items))
+        return _SegmentList(None, _shared=shared)
+
+    def concatenate(self, check_increasing=False):
+        """
+        Concatenate the segments, which must be numpy arrays with the same number of
+        rows (if they are 2D), along their last axis. The result is a read-only
+        view of a shared buffer.
+        """
+        shared = self._shared
+        if shared.n_concatenated < self._n:
+            new_items = shared.items[shared.n_concatenated : self._n]
+            start = shared.offsets[-1]
+            end = start + sum(item.shape[-1] for item in new_items)
+            # the buffer is stored with the concatenation axis first, so that the
+            # concatenated array is contiguous
+            shape = new_items[0].shape[:-1][::-1]
+            if any(item.shape[:-1][::-1] != shape for item in new_items) or (
+                shared.buffer is not None and shared.buffer.shape[1:] != shape
+            ):
+                raise ValueError("segments have different shapes")
+            if check_increasing:
+                # include the last time that has already been concatenated
+                previous = [shared.buffer[start - 1 : start]] if start > 0 else []
+                if np.any(np.diff(np.concatenate(previous + new_items)) <= 0):
+                    raise ValueError("Solution time vector must be strictly increasing")
+            dtype = np.result_type(
+                *new_items, *([] if shared.buffer is None else [shared.buffer])
+            )
+            # reallocate the buffer if it is full, or if the new segments need a
+            # wider dtype (which would otherwise be cast to the dtype of the buffer)
+            if (
+                shared.buffer is None
+                or shared.buffer.shape[0] < end
+                or shared.buffer.dtype != dtype
+            ):
+                capacity = end if shared.buffer is None else max(end, 2 * start)
+                buffer = np.empty((capacity,) + shape, dtype=dtype)
+                buffer[:start] = shared.buffer[:start] if start > 0 else 0
+                shared.buffer = buffer
+            for item in new_items:
+                shared.buffer[start : start + item.shape[-1]] = item.T
+                start += item.shape[-1]
+                shared.offsets.append(start)
+            shared.n_concatenated = self._n
+        concatenated = shared.buffer[: shared.offsets[self._n]].T
+        concatenated.flags.writeable = False
+        return concatenated
+
+
 class Solution(object):
     """
     Class containing the solution of, and various attributes associated with, a PyBaMM
@@ -62,8 +170,14 @@ class Solution(object):
         equations.  False if no sensitivities included/wanted. Dict if sensitivities are
         provided as a dict of {parameter: sensitivities} pairs.
 
+    Processed variables (see :meth:`__getitem__`) are cached in the solution. By
+    default all of them are kept; set `max_cached_variables` (on a solution, or on
+    :class:`pybamm.Solution` for all solutions) to only keep the most recently used
+    ones, e.g. when extracting many variables from a large solution.
     """
 
+    max_cached_variables = None
+
     def __init__(
         self,
         all_ts,
@@ -76,19 +190,19 @@ class Solution(object):
         sensitivities=False,
         check_solution=True,
     ):
-        if not isinstance(all_ts, list):
+        if not isinstance(all_ts, (list, _SegmentList)):
             all_ts = [all_ts]
-        if not isinstance(all_ys, list):
+        if not isinstance(all_ys, (list, _SegmentList)):
             all_ys = [all_ys]
-        if not isinstance(all_models, list):
+        if not isinstance(all_models, (list, _SegmentList)):
             all_models = [all_models]
-        self._all_ts = all_ts
-        self._all_ys = all_ys
-        self._all_ys_and_sens = all_ys
-        self._all_models = all_models
+        self._all_ts = _to_segment_list(all_ts)
+        self._all_ys = _to_segment_list(all_ys)
+        self._all_ys_and_sens = self._all_ys
+        self._all_models = _to_segment_list(all_models)
 
         # Set up inputs
-        if not isinstance(all_inputs, list):
+        if not isinstance(all_inputs, (list, _SegmentList)):
             all_inputs_copy = dict(all_inputs)
             for key, value in all_inputs_copy.items():
                 if isinstance(value, numbers.Number):
@@ -118,12 +232,11 @@ class Solution(object):
         self.solve_time = None
         self.integration_time = None
 
-        # initialize empty variables and data
+        # initialize empty variables
         self._variables = pybamm.FuzzyDict()
-        self.data = pybamm.FuzzyDict()
 
         # Add self as sub-solution for compatibility with ProcessedVariable
-        self._sub_solutions = [self]
+        self._sub_solutions = _SegmentList([self])
 
         # initialize empty cycles
         self._cycles = []
@@ -144,12 +257,14 @@ class Solution(object):
         )
 
         # make sure we remove all sensitivities from all_ys
+        all_ys = list(self.all_ys)
         for index, (model, ys, ts, inputs) in enumerate(
             zip(self.all_models, self.all_ys, self.all_ts, self.all_inputs)
         ):
-            self._all_ys[index], _ = self._extract_explicit_sensitivities(
+            all_ys[index], _ = self._extract_explicit_sensitivities(
                 model, ys, ts, inputs
             )
+        self._all_ys = _SegmentList(all_ys)
 
     def _extract_explicit_sensitivities(self, model, y, t_eval, inputs):
         """
@@ -252,9 +367,7 @@ class Solution(object):
             return self._t
 
     def set_t(self):
-        self._t = np.concatenate(self.all_ts)
-        if any(np.diff(self._t) <= 0):
-            raise ValueError("Solution time vector must be strictly increasing")
+        self._t = self._all_ts.concatenate(check_increasing=True)
 
     @property
     def y(self):
@@ -293,7 +406,7 @@ class Solution(object):
             if isinstance(self.all_ys[0], (casadi.DM, casadi.MX)):
                 self._y = casadi.horzcat(*self.all_ys)
             else:
-                self._y = np.hstack(self.all_ys)
+                self._y = self._all_ys.concatenate()
         except ValueError:
             raise pybamm.SolverError(
                 "The solution is made up from different models, so `y` cannot be "
@@ -320,16 +433,29 @@ class Solution(object):
 
     @property
     def all_ts(self):
-        return self._all_ts
+        return self._all_ts.items
 
     @property
     def all_ys(self):
-        return self._all_ys
+        return self._all_ys.items
 
     @property
     def all_models(self):
         """Model(s) used for solution"""
-        return self._all_models
+        return self._all_models.items
+
+    @all_models.setter
+    def all_models(self, all_models):
+        self._all_models = _SegmentList(all_models)
+
+    @property
+    def all_inputs(self):
+        """Inputs used for solution"""
+        return self._all_inputs.items
+
+    @all_inputs.setter
+    def all_inputs(self, all_inputs):
+        self._all_inputs = _to_segment_list(all_inputs)
 
     @cached_property
     def all_inputs_casadi(self):
@@ -371,8 +497,7 @@ class Solution(object):
             None,
             "final time",
         )
-        new_sol._all_inputs_casadi = self.all_inputs_casadi[:1]
-        new_sol._sub_solutions = self.sub_solutions[:1]
+        new_sol._sub_solutions = _SegmentList(self.sub_solutions[:1])
 
         new_sol.solve_time = 0
         new_sol.integration_time = 0
@@ -396,8 +521,7 @@ class Solution(object):
             self.y_event,
             self.termination,
         )
-        new_sol._all_inputs_casadi = self.all_inputs_casadi[-1:]
-        new_sol._sub_solutions = self.sub_solutions[-1:]
+        new_sol._sub_solutions = _SegmentList(self.sub_solutions[-1:])
 
         new_sol.solve_time = 0
         new_sol.integration_time = 0
@@ -419,19 +543,32 @@ class Solution(object):
 
     @property
     def summary_variables(self):
+        if self._summary_variables is None and hasattr(self, "all_summary_variables"):
+            all_summary_variables = self.all_summary_variables
+            # Calculate any deferred summary variables together, so that the eSOH
+            # variables of all the cycles are solved for at once
+            _evaluate_deferred_summary_variables(all_summary_variables)
+
+            summary_variables = {var: [] for var in all_summary_variables[0]}
+            for sum_vars in all_summary_variables:
+                for name, value in sum_vars.items():
+                    summary_variables[name].append(value)
+
+            summary_variables["Cycle number"] = range(1, len(all_summary_variables) + 1)
+            self._summary_variables = pybamm.FuzzyDict(
+                {name: np.array(value) for name, value in summary_variables.items()}
+            )
         return self._summary_variables
 
     def set_summary_variables(self, all_summary_variables):
-        summary_variables = {var: [] for var in all_summary_variables[0]}
-        for sum_vars in all_summary_variables:
-            for name, value in sum_vars.items():
-                summary_variables[name].append(value)
-
-        summary_variables["Cycle number"] = range(1, len(all_summary_variables) + 1)
         self.all_summary_variables = all_summary_variables
-        self._summary_variables = pybamm.FuzzyDict(
-            {name: np.array(value) for name, value in summary_variables.items()}
-        )
+        self._summary_variables = None
+        if not any(
+            isinstance(sum_vars, _DeferredSummaryVariables) and not sum_vars.evaluated
+            for sum_vars in all_summary_variables
+        ):
+            # Nothing to calculate, so collect the summary variables straight away
+            self.summary_variables
 
     def update(self, variables):
         """Add ProcessedVariables to the dictionary of variables in the solution"""
@@ -471,9 +608,18 @@ class Solution(object):
                 vars_pybamm, vars_casadi, self, cumtrapz_ic=cumtrapz_ic
             )
 
-            # Save variable and data
+            # Save variable, dropping the least recently used variables if there are
+            # too many
+            self._variables.pop(key, None)
             self._variables[key] = var
-            self.data[key] = var.data
+            if self.max_cached_variables is not None:
+                while len(self._variables) > self.max_cached_variables:
+                    del self._variables[next(iter(self._variables))]
+
+    @property
+    def data(self):
+        """Data of the processed variables that are cached in the solution"""
+        return pybamm.FuzzyDict({key: var.data for key, var in self._variables.items()})
 
     def process_casadi_var(self, var_pybamm, inputs, ys):
         t_MX = casadi.MX.sym("t")
@@ -499,12 +645,15 @@ class Solution(object):
         -------
         :class:`pybamm.ProcessedVariable`
             A variable that can be evaluated at any time or spatial point. The
-            underlying data for this variable is available in its attribute ".data"
+            underlying data for this variable is available in its attribute ".data",
+            and :meth:`pybamm.ProcessedVariable.at` evaluates it only at some times
         """
 
-        # return it if it exists
+        # return it if it exists, marking it as the most recently used variable
         if key in self._variables:
-            return self._variables[key]
+            var = self._variables.pop(key)
+            self._variables[key] = var
+            return var
         else:
             # otherwise create it, save it and then return it
             self.update(key)
@@ -652,7 +801,7 @@ class Solution(object):
         """List of sub solutions that have been
         concatenated to form the full solution"""
 
-        return self._sub_solutions
+        return self._sub_solutions.items
 
     def __add__(self, other):
         """Adds two solutions together, e.g. when stepping"""
@@ -676,20 +825,21 @@ class Solution(object):
             new_sol._y_event = other._y_event
             return new_sol
 
-        # Update list of sub-solutions
+        # Update list of sub-solutions. The segments of the new solution are shared
+        # with this solution where possible, rather than copied (see _SegmentList)
         if other.all_ts[0][0] == self.all_ts[-1][-1]:
             # Skip first time step if it is repeated
-            all_ts = self.all_ts + [other.all_ts[0][1:]] + other.all_ts[1:]
-            all_ys = self.all_ys + [other.all_ys[0][:, 1:]] + other.all_ys[1:]
+            other_ts = [other.all_ts[0][1:]] + other.all_ts[1:]
+            other_ys = [other.all_ys[0][:, 1:]] + other.all_ys[1:]
         else:
-            all_ts = self.all_ts + other.all_ts
-            all_ys = self.all_ys + other.all_ys
+            other_ts = other.all_ts
+            other_ys = other.all_ys
 
         new_sol = Solution(
-            all_ts,
-            all_ys,
-            self.all_models + other.all_models,
-            self.all_inputs + other.all_inputs,
+            self._all_ts.extend(other_ts),
+            self._all_ys.extend(other_ys),
+            self._all_models.extend(other.all_models),
+            self._all_inputs.extend(other.all_inputs),
             other.t_event,
             other.y_event,
             other.termination,
@@ -697,14 +847,13 @@ class Solution(object):
         )
 
         new_sol.closest_event_idx = other.closest_event_idx
-        new_sol._all_inputs_casadi = self.all_inputs_casadi + other.all_inputs_casadi
 
         # Set solution time
         new_sol.solve_time = self.solve_time + other.solve_time
         new_sol.integration_time = self.integration_time + other.integration_time
 
         # Set sub_solutions
-        new_sol._sub_solutions = self.sub_solutions + other.sub_solutions
+        new_sol._sub_solutions = self._sub_solutions.extend(other.sub_solutions)
 
         return new_sol
 
@@ -713,16 +862,15 @@ class Solution(object):
 
     def copy(self):
         new_sol = self.__class__(
-            self.all_ts,
-            self.all_ys,
-            self.all_models,
-            self.all_inputs,
+            self._all_ts,
+            self._all_ys,
+            self._all_models,
+            self._all_inputs,
             self.t_event,
             self.y_event,
             self.termination,
         )
-        new_sol._all_inputs_casadi = self.all_inputs_casadi
-        new_sol._sub_solutions = self.sub_solutions
+        new_sol._sub_solutions = self._sub_solutions
         new_sol.closest_event_idx = self.closest_event_idx
 
         new_sol.solve_time = self.solve_time
@@ -732,6 +880,12 @@ class Solution(object):
         return new_sol
 
 
+def _to_segment_list(items):
+    if isinstance(items, _SegmentList):
+        return items
+    return _SegmentList(items)
+
+
 class EmptySolution:
     def __init__(self, termination=None, t=None):
         self.termination = termination
@@ -754,7 +908,12 @@ class EmptySolution:
         return EmptySolution(self.termination)
 
 
-def make_cycle_solution(step_solutions, esoh_solver=None, save_this_cycle=True):
+def make_cycle_solution(
+    step_solutions,
+    esoh_solver=None,
+    save_this_cycle=True,
+    lazy_summary_variables=False,
+):
     """
     Function to create a Solution for an entire cycle, and associated summary variables
 
@@ -769,6 +928,9 @@ def make_cycle_solution(step_solutions, esoh_solver=None, save_this_cycle=True):
     save_this_cycle : bool, optional
         Whether to save the entire cycle variables or just the summary variables.
         Default True
+    lazy_summary_variables : bool, optional
+        Whether to defer calculating the eSOH summary variables until they are first
+        accessed. Default False
 
     Returns
     -------
@@ -784,21 +946,40 @@ def make_cycle_solution(step_solutions, esoh_solver=None, save_this_cycle=True):
     expansion. Journal of Power Sources, 427, 101-111.
 
     """
+    cycle_solution = _make_cycle_solution_from_steps(step_solutions)
+
+    if lazy_summary_variables:
+        cycle_summary_variables = _DeferredSummaryVariables(cycle_solution, esoh_solver)
+    else:
+        cycle_summary_variables = _get_cycle_summary_variables(
+            cycle_solution, esoh_solver
+        )
+
+    cycle_first_state = cycle_solution.first_state
+
+    if save_this_cycle:
+        cycle_solution.cycle_summary_variables = cycle_summary_variables
+    else:
+        cycle_solution = None
+
+    return cycle_solution, cycle_summary_variables, cycle_first_state
+
+
+def _make_cycle_solution_from_steps(step_solutions):
     sum_sols = step_solutions[0].copy()
     for step_solution in step_solutions[1:]:
         sum_sols = sum_sols + step_solution
 
     cycle_solution = Solution(
-        sum_sols.all_ts,
-        sum_sols.all_ys,
-        sum_sols.all_models,
-        sum_sols.all_inputs,
+        sum_sols._all_ts,
+        sum_sols._all_ys,
+        sum_sols._all_models,
+        sum_sols._all_inputs,
         sum_sols.t_event,
         sum_sols.y_event,
         sum_sols.termination,
     )
-    cycle_solution._all_inputs_casadi = sum_sols.all_inputs_casadi
-    cycle_solution._sub_solutions = sum_sols.sub_solutions
+    cycle_solution._sub_solutions = sum_sols._sub_solutions
 
     cycle_solution.solve_time = sum_sols.solve_time
     cycle_solution.integration_time = sum_sols.integration_time
@@ -806,19 +987,21 @@ def make_cycle_solution(step_solutions, esoh_solver=None, save_this_cycle=True):
 
     cycle_solution.steps = step_solutions
 
-    cycle_summary_variables = _get_cycle_summary_variables(cycle_solution, esoh_solver)
+    return cycle_solution
 
-    cycle_first_state = cycle_solution.first_state
 
-    if save_this_cycle:
-        cycle_solution.cycle_summary_variables = cycle_summary_variables
-    else:
-        cycle_solution = None
+def _get_cycle_summary_variables(cycle_solution, esoh_solver):
+    cycle_summary_variables = _get_cycle_summary_variables_without_esoh(cycle_solution)
 
-    return cycle_solution, cycle_summary_variables, cycle_first_state
+    # eSOH variables
+    esoh_inputs = _get_esoh_inputs(cycle_solution, esoh_solver)
+    if esoh_inputs is not None:
+        cycle_summary_variables.update(_solve_esoh(esoh_solver, esoh_inputs))
 
+    return cycle_summary_variables
 
-def _get_cycle_summary_variables(cycle_solution, esoh_solver):
+
+def _get_cycle_summary_variables_without_esoh(cycle_solution):
     model = cycle_solution.all_models[0]
     cycle_summary_variables = pybamm.FuzzyDict({})
 
@@ -857,26 +1040,138 @@ def _get_cycle_summary_variables(cycle_solution, esoh_solver):
             data_last[0] - data_first[0]
         )
 
+    return cycle_summary_variables
+
+
+def _get_esoh_inputs(cycle_solution, esoh_solver):
+    """
+    Inputs of the eSOH model at the end of the cycle, or None if the eSOH variables
+    are not calculated for this cycle
+    """
+    model = cycle_solution.all_models[0]
     # eSOH variables (full-cell lithium-ion model only, for now)
     if (
         esoh_solver is not None
         and isinstance(model, pybamm.lithium_ion.BaseModel)
         and model.options.electrode_types["negative"] == "porous"
     ):
+        last_state = cycle_solution.last_state
         Q_n = last_state["Negative electrode capacity [A.h]"].data[0]
         Q_p = last_state["Positive electrode capacity [A.h]"].data[0]
         Q_Li = last_state["Total lithium capacity in particles [A.h]"].data[0]
 
-        inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
+        return {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
 
-        try:
-            esoh_sol = esoh_solver.solve(inputs)
-        except pybamm.SolverError:  # pragma: no cover
-            raise pybamm.SolverError(
-                "Could not solve for summary variables, run "
-                "`sim.solve(calc_esoh=False)` to skip this step"
-            )
 
-        cycle_summary_variables.update(esoh_sol)
+def _solve_esoh(esoh_solver, inputs):
+    try:
+        return esoh_solver.solve(inputs)
+    except pybamm.SolverError:  # pragma: no cover
+        raise pybamm.SolverError(
+            "Could not solve for summary variables, run "
+            "`sim.solve(calc_esoh=False)` to skip this step"
+        )
 
-    return cycle_summary_variables
+
+class _DeferredSummaryVariables(pybamm.FuzzyDict):
+    """
+    Summary variables of a cycle whose eSOH variables are only calculated when they
+    are first accessed (see :func:`make_cycle_solution`). The other summary
+    variables are cheap to calculate, and are calculated straight away from the
+    cycle solution, which is then not kept.
+    """
+
+    def __init__(self, cycle_solution, esoh_solver):
+        super().__init__(_get_cycle_summary_variables_without_esoh(cycle_solution))
+        self._esoh_inputs = _get_esoh_inputs(cycle_solution, esoh_solver)
+        self._esoh_solver = esoh_solver
+
+    @property
+    def evaluated(self):
+        return self._esoh_inputs is None
+
+    def evaluate(self):
+        if not self.evaluated:
+            _evaluate_deferred_summary_variables([self])
+
+    def __getitem__(self, key):
+        # Only solve the eSOH model if the variable is not one of those calculated
+        # already
+        if not dict.__contains__(self, key):
+            self.evaluate()
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            self.evaluate()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.evaluate()
+        return super().__iter__()
+
+    def __len__(self):
+        self.evaluate()
+        return super().__len__()
+
+    def __repr__(self):
+        self.evaluate()
+        return super().__repr__()
+
+    def __eq__(self, other):
+        self.evaluate()
+        return super().__eq__(other)
+
+    def get(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self.evaluate()
+        return super().get(key, default)
+
+    def keys(self):
+        self.evaluate()
+        return super().keys()
+
+    def values(self):
+        self.evaluate()
+        return super().values()
+
+    def items(self):
+        self.evaluate()
+        return super().items()
+
+    def copy(self):
+        return pybamm.FuzzyDict(self.items())
+
+    def __reduce__(self):
+        return pybamm.FuzzyDict, (dict(self.items()),)
+
+
+def _evaluate_deferred_summary_variables(all_summary_variables):
+    """
+    Calculate the deferred summary variables in a list of cycle summary variables.
+    The eSOH model is solved for all the cycles that share an eSOH solver at once.
+    """
+    deferred = []
+    for sum_vars in all_summary_variables:
+        if (
+            isinstance(sum_vars, _DeferredSummaryVariables)
+            and not sum_vars.evaluated
+            and not any(sum_vars is other for other in deferred)
+        ):
+            deferred.append(sum_vars)
+
+    esoh_batches = {}
+    for sum_vars in deferred:
+        batch = esoh_batches.setdefault(sum_vars._esoh_solver, [])
+        batch.append(sum_vars)
+
+    for esoh_solver, batch in esoh_batches.items():
+        inputs = {
+            name: np.array([sum_vars._esoh_inputs[name] for sum_vars in batch])
+            for name in batch[0]._esoh_inputs
+        }
+        esoh_sol = _solve_esoh(esoh_solver, inputs)
+        for i, sum_vars in enumerate(batch):
+            dict.update(sum_vars, {name: value[i] for name, value in esoh_sol.items()})
+            sum_vars._esoh_inputs = None
+            sum_vars._esoh_solver = None
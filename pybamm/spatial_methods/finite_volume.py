@@ -111,14 +111,18 @@ class FiniteVolume(pybamm.SpatialMethod):
         # Create appropriate submesh by combining submeshes in primary domain
         submesh = self.mesh[domain]
 
+        # number of repeats
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        key = ("gradient", submesh, second_dim_repeats)
+        if key in self._operators:
+            return self._operators[key]
+
         # Create 1D matrix using submesh
         n = submesh.npts
         e = 1 / submesh.d_nodes
         sub_matrix = diags([-e, e], [0, 1], shape=(n - 1, n))
 
-        # number of repeats
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index (row-slicing), which is
         # not supported by the default kron format
@@ -126,7 +130,8 @@ class FiniteVolume(pybamm.SpatialMethod):
         # issue
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        self._operators[key] = pybamm.Matrix(matrix)
+        return self._operators[key]
 
     def divergence(self, symbol, discretised_symbol, boundary_conditions):
         """Matrix-vector multiplication to implement the divergence operator.
@@ -169,6 +174,13 @@ class FiniteVolume(pybamm.SpatialMethod):
         # Create appropriate submesh by combining submeshes in domain
         submesh = self.mesh[domains["primary"]]
 
+        # repeat matrix for each node in secondary dimensions
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        key = ("divergence", submesh, second_dim_repeats)
+        if key in self._operators:
+            return self._operators[key]
+
         # check coordinate system
         if submesh.coord_sys in ["cylindrical polar", "spherical polar"]:
             r_edges_left = submesh.edges[:-1]
@@ -186,15 +198,14 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts + 1
         sub_matrix = diags([-e, e], [0, 1], shape=(n - 1, n))
 
-        # repeat matrix for each node in secondary dimensions
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index (row-slicing), which is
         # not supported by the default kron format
         # Note that this makes column-slicing inefficient, but this should not be an
         # issue
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
-        return pybamm.Matrix(matrix)
+        self._operators[key] = pybamm.Matrix(matrix)
+        return self._operators[key]
 
     def laplacian(self, symbol, discretised_symbol, boundary_conditions):
         """
@@ -250,6 +261,18 @@ class FiniteVolume(pybamm.SpatialMethod):
         domain = child.domains[integration_dimension]
         submesh = self.mesh[domain]
 
+        key = (
+            "definite integral",
+            integration_dimension,
+            vector_type,
+            submesh,
+            self.mesh[domains["primary"]],
+            child.evaluates_on_edges("primary"),
+            self._get_auxiliary_domain_repeats(domains),
+        )
+        if key in self._operators:
+            return self._operators[key]
+
         # check coordinate system
         if submesh.coord_sys in ["cylindrical polar", "spherical polar"]:
             r_edges_left = submesh.edges[:-1]
@@ -304,7 +327,8 @@ class FiniteVolume(pybamm.SpatialMethod):
         # not supported by the default kron format
         # Note that this makes column-slicing inefficient, but this should not be an
         # issue
-        return pybamm.Matrix(csr_matrix(matrix))
+        self._operators[key] = pybamm.Matrix(csr_matrix(matrix))
+        return self._operators[key]
 
     def indefinite_integral(self, child, discretised_child, direction):
         """Implementation of the indefinite integral operator."""
@@ -414,6 +438,10 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts
         second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
 
+        key = ("indefinite integral edges", submesh, second_dim_repeats, direction)
+        if key in self._operators:
+            return self._operators[key]
+
         du_n = submesh.d_nodes
         if direction == "forward":
             du_entries = [du_n] * (n - 1)
@@ -437,7 +465,8 @@ class FiniteVolume(pybamm.SpatialMethod):
         # issue
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        self._operators[key] = pybamm.Matrix(matrix)
+        return self._operators[key]
 
     def indefinite_integral_matrix_nodes(self, domains, direction):
         """
@@ -464,6 +493,10 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts
         second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
 
+        key = ("indefinite integral nodes", submesh, second_dim_repeats, direction)
+        if key in self._operators:
+            return self._operators[key]
+
         du_n = submesh.d_edges
         du_entries = [du_n] * n
         if direction == "forward":
@@ -477,7 +510,8 @@ class FiniteVolume(pybamm.SpatialMethod):
         # issue
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        self._operators[key] = pybamm.Matrix(matrix)
+        return self._operators[key]
 
     def delta_function(self, symbol, discretised_symbol):
         """
@@ -1165,6 +1199,15 @@ class FiniteVolume(pybamm.SpatialMethod):
             # Create appropriate submesh by combining submeshes in domain
             submesh = self.mesh[array.domain]
 
+            # Second dimension length
+            second_dim_repeats = self._get_auxiliary_domain_repeats(
+                discretised_symbol.domains
+            )
+
+            key = ("arithmetic mean", shift_key, submesh, second_dim_repeats)
+            if key in self._operators:
+                return self._operators[key] @ array
+
             # Create 1D matrix using submesh
             n = submesh.npts
 
@@ -1183,10 +1226,6 @@ class FiniteVolume(pybamm.SpatialMethod):
                 sub_matrix = diags([0.5, 0.5], [0, 1], shape=(n, n + 1))
             else:
                 raise ValueError("shift key '{}' not recognised".format(shift_key))
-            # Second dimension length
-            second_dim_repeats = self._get_auxiliary_domain_repeats(
-                discretised_symbol.domains
-            )
 
             # Generate full matrix from the submatrix
             # Convert to csr_matrix so that we can take the index (row-slicing), which
@@ -1195,7 +1234,8 @@ class FiniteVolume(pybamm.SpatialMethod):
             # issue
             matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-            return pybamm.Matrix(matrix) @ array
+            self._operators[key] = pybamm.Matrix(matrix)
+            return self._operators[key] @ array
 
         def harmonic_mean(array):
             """
@@ -1228,105 +1268,27 @@ class FiniteVolume(pybamm.SpatialMethod):
                 discretised_symbol.domains
             )
 
-            # Create 1D matrix using submesh
-            n = submesh.npts
-
-            if shift_key == "node to edge":
-                # Matrix to compute values at the exterior edges
-                edges_sub_matrix_left = csr_matrix(
-                    ([1.5, -0.5], ([0, 0], [0, 1])), shape=(1, n)
-                )
-                edges_sub_matrix_center = csr_matrix((n - 1, n))
-                edges_sub_matrix_right = csr_matrix(
-                    ([-0.5, 1.5], ([0, 0], [n - 2, n - 1])), shape=(1, n)
-                )
-                edges_sub_matrix = vstack(
-                    [
-                        edges_sub_matrix_left,
-                        edges_sub_matrix_center,
-                        edges_sub_matrix_right,
-                    ]
-                )
-
-                # Generate full matrix from the submatrix
-                # Convert to csr_matrix so that we can take the index (row-slicing),
-                # which is not supported by the default kron format
-                # Note that this makes column-slicing inefficient, but this should
-                # not be an issue
-                edges_matrix = csr_matrix(
-                    kron(eye(second_dim_repeats), edges_sub_matrix)
-                )
-
-                # Matrix to extract the node values running from the first node
-                # to the penultimate node in the primary dimension (D_1 in the
-                # definiton of the harmonic mean)
-                sub_matrix_D1 = hstack([eye(n - 1), csr_matrix((n - 1, 1))])
-                matrix_D1 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D1))
-                D1 = pybamm.Matrix(matrix_D1) @ array
-
-                # Matrix to extract the node values running from the second node
-                # to the final node in the primary dimension  (D_2 in the
-                # definiton of the harmonic mean)
-                sub_matrix_D2 = hstack([csr_matrix((n - 1, 1)), eye(n - 1)])
-                matrix_D2 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D2))
-                D2 = pybamm.Matrix(matrix_D2) @ array
-
-                # Compute weight beta
-                dx = submesh.d_edges
-                sub_beta = (dx[:-1] / (dx[1:] + dx[:-1]))[:, np.newaxis]
-                beta = pybamm.Array(np.kron(np.ones((second_dim_repeats, 1)), sub_beta))
-
-                # Compute harmonic mean on internal edges
-                # Note: add small number to denominator to regularise D_eff
-                D_eff = D1 * D2 / (D2 * beta + D1 * (1 - beta) + 1e-16)
-
-                # Matrix to pad zeros at the beginning and end of the array where
-                # the exterior edge values will be added
-                sub_matrix = vstack(
-                    [csr_matrix((1, n - 1)), eye(n - 1), csr_matrix((1, n - 1))]
-                )
-
-                # Generate full matrix from the submatrix
-                # Convert to csr_matrix so that we can take the index (row-slicing),
-                # which is not supported by the default kron format
-                # Note that this makes column-slicing inefficient, but this should
-                # not be an issue
-                matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
-
-                return (
-                    pybamm.Matrix(edges_matrix) @ array + pybamm.Matrix(matrix) @ D_eff
+            key = ("harmonic mean", shift_key, submesh, second_dim_repeats)
+            if key not in self._operators:
+                self._operators[key] = self._harmonic_mean_operators(
+                    submesh, second_dim_repeats, shift_key
                 )
+            matrix_D1, matrix_D2, beta, edges_matrix, matrix = self._operators[key]
 
-            elif shift_key == "edge to node":
-                # Matrix to extract the edge values running from the first edge
-                # to the penultimate edge in the primary dimension (D_1 in the
-                # definiton of the harmonic mean)
-                sub_matrix_D1 = hstack([eye(n), csr_matrix((n, 1))])
-                matrix_D1 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D1))
-                D1 = pybamm.Matrix(matrix_D1) @ array
-
-                # Matrix to extract the edge values running from the second edge
-                # to the final edge in the primary dimension  (D_2 in the
-                # definiton of the harmonic mean)
-                sub_matrix_D2 = hstack([csr_matrix((n, 1)), eye(n)])
-                matrix_D2 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D2))
-                D2 = pybamm.Matrix(matrix_D2) @ array
-
-                # Compute weight beta
-                dx0 = submesh.nodes[0] - submesh.edges[0]  # first edge to node
-                dxN = submesh.edges[-1] - submesh.nodes[-1]  # last node to edge
-                dx = np.concatenate(([dx0], submesh.d_nodes, [dxN]))
-                sub_beta = (dx[:-1] / (dx[1:] + dx[:-1]))[:, np.newaxis]
-                beta = pybamm.Array(np.kron(np.ones((second_dim_repeats, 1)), sub_beta))
-
-                # Compute harmonic mean on nodes
-                # Note: add small number to denominator to regularise D_eff
-                D_eff = D1 * D2 / (D2 * beta + D1 * (1 - beta) + 1e-16)
+            # D_1 and D_2 in the definition of the harmonic mean
+            D1 = matrix_D1 @ array
+            D2 = matrix_D2 @ array
 
-                return D_eff
+            # Compute harmonic mean
+            # Note: add small number to denominator to regularise D_eff
+            D_eff = D1 * D2 / (D2 * beta + D1 * (1 - beta) + 1e-16)
 
+            if shift_key == "node to edge":
+                # D_eff is on the internal edges, so pad it with zeros and add the
+                # exterior edge values
+                return edges_matrix @ array + matrix @ D_eff
             else:
-                raise ValueError("shift key '{}' not recognised".format(shift_key))
+                return D_eff
 
         # If discretised_symbol evaluates to number there is no need to average
         if discretised_symbol.size == 1:
@@ -1339,6 +1301,118 @@ class FiniteVolume(pybamm.SpatialMethod):
             raise ValueError("method '{}' not recognised".format(method))
         return out
 
+    def _harmonic_mean_operators(self, submesh, second_dim_repeats, shift_key):
+        """
+        Create the matrices and weights used by the harmonic mean in
+        :meth:`FiniteVolume.shift`.
+
+        Parameters
+        ----------
+        submesh : :class:`pybamm.SubMesh`
+            The submesh of the symbol being averaged
+        second_dim_repeats : int
+            The number of times the primary dimension is repeated
+        shift_key : str
+            Whether to shift from nodes to edges ("node to edge"), or from edges to
+            nodes ("edge to node")
+
+        Returns
+        -------
+        tuple
+            The matrices that extract D_1 and D_2, the weight beta and, if shifting
+            from nodes to edges, the matrices for the exterior edge values and for
+            padding the internal edge values with zeros (otherwise None)
+        """
+        # Create 1D matrix using submesh
+        n = submesh.npts
+
+        if shift_key == "node to edge":
+            # Matrix to compute values at the exterior edges
+            edges_sub_matrix_left = csr_matrix(
+                ([1.5, -0.5], ([0, 0], [0, 1])), shape=(1, n)
+            )
+            edges_sub_matrix_center = csr_matrix((n - 1, n))
+            edges_sub_matrix_right = csr_matrix(
+                ([-0.5, 1.5], ([0, 0], [n - 2, n - 1])), shape=(1, n)
+            )
+            edges_sub_matrix = vstack(
+                [
+                    edges_sub_matrix_left,
+                    edges_sub_matrix_center,
+                    edges_sub_matrix_right,
+                ]
+            )
+
+            # Generate full matrix from the submatrix
+            # Convert to csr_matrix so that we can take the index (row-slicing),
+            # which is not supported by the default kron format
+            # Note that this makes column-slicing inefficient, but this should
+            # not be an issue
+            edges_matrix = csr_matrix(kron(eye(second_dim_repeats), edges_sub_matrix))
+
+            # Matrix to extract the node values running from the first node
+            # to the penultimate node in the primary dimension (D_1 in the
+            # definiton of the harmonic mean)
+            sub_matrix_D1 = hstack([eye(n - 1), csr_matrix((n - 1, 1))])
+            matrix_D1 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D1))
+
+            # Matrix to extract the node values running from the second node
+            # to the final node in the primary dimension  (D_2 in the
+            # definiton of the harmonic mean)
+            sub_matrix_D2 = hstack([csr_matrix((n - 1, 1)), eye(n - 1)])
+            matrix_D2 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D2))
+
+            # Compute weight beta
+            dx = submesh.d_edges
+            sub_beta = (dx[:-1] / (dx[1:] + dx[:-1]))[:, np.newaxis]
+            beta = pybamm.Array(np.kron(np.ones((second_dim_repeats, 1)), sub_beta))
+
+            # Matrix to pad zeros at the beginning and end of the array where
+            # the exterior edge values will be added
+            sub_matrix = vstack(
+                [csr_matrix((1, n - 1)), eye(n - 1), csr_matrix((1, n - 1))]
+            )
+
+            # Generate full matrix from the submatrix
+            # Convert to csr_matrix so that we can take the index (row-slicing),
+            # which is not supported by the default kron format
+            # Note that this makes column-slicing inefficient, but this should
+            # not be an issue
+            matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
+
+            return (
+                pybamm.Matrix(matrix_D1),
+                pybamm.Matrix(matrix_D2),
+                beta,
+                pybamm.Matrix(edges_matrix),
+                pybamm.Matrix(matrix),
+            )
+
+        elif shift_key == "edge to node":
+            # Matrix to extract the edge values running from the first edge
+            # to the penultimate edge in the primary dimension (D_1 in the
+            # definiton of the harmonic mean)
+            sub_matrix_D1 = hstack([eye(n), csr_matrix((n, 1))])
+            matrix_D1 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D1))
+
+            # Matrix to extract the edge values running from the second edge
+            # to the final edge in the primary dimension  (D_2 in the
+            # definiton of the harmonic mean)
+            sub_matrix_D2 = hstack([csr_matrix((n, 1)), eye(n)])
+            matrix_D2 = csr_matrix(kron(eye(second_dim_repeats), sub_matrix_D2))
+
+            # Compute weight beta
+            dx0 = submesh.nodes[0] - submesh.edges[0]  # first edge to node
+            dxN = submesh.edges[-1] - submesh.nodes[-1]  # last node to edge
+            dx = np.concatenate(([dx0], submesh.d_nodes, [dxN]))
+            sub_beta = (dx[:-1] / (dx[1:] + dx[:-1]))[:, np.newaxis]
+            beta = pybamm.Array(np.kron(np.ones((second_dim_repeats, 1)), sub_beta))
+
+            return pybamm.Matrix(matrix_D1), pybamm.Matrix(matrix_D2), beta, None, None
+
+        else:
+            raise ValueError("shift key '{}' not recognised".format(shift_key))
+
     def upwind_or_downwind(self, symbol, discretised_symbol, bcs, direction):
         """
         Implement an upwinding operator. Currently, this requires the symbol to have
@@ -32,11 +32,17 @@ class SpatialMethod:
                     self.options[opt] = val
 
         self._mesh = None
+        # Discrete operators (e.g. gradient matrices) that have been created for the
+        # current mesh, so that each one is only created once and is then shared
+        # between all the symbols that use it
+        self._operators = {}
 
     def build(self, mesh):
         # add npts_for_broadcast to mesh domains for this particular discretisation
         for dom in mesh.keys():
             mesh[dom].npts_for_broadcast_to_nodes = mesh[dom].npts
+        if mesh is not self._mesh:
+            self._operators = {}
         self._mesh = mesh
 
     def _get_auxiliary_domain_repeats(self, domains):
@@ -756,6 +756,52 @@ class TestDiscretise(unittest.TestCase):
         )
         discretised_model.check_well_posedness()
 
+    def test_process_model_again(self):
+        # discretising models that differ in some parameter values with the same
+        # discretisation reuses the discretised symbols that do not depend on them
+        c = pybamm.Variable("c", domain=["negative electrode"])
+        d = pybamm.Variable("d", domain=["negative electrode"])
+        a = pybamm.Parameter("a")
+        model = pybamm.BaseModel()
+        model.rhs = {c: pybamm.div(pybamm.grad(c)), d: pybamm.div(pybamm.grad(d)) * a}
+        model.initial_conditions = {c: pybamm.Scalar(3), d: pybamm.Scalar(1)}
+        model.boundary_conditions = {
+            c: {"left": (0, "Neumann"), "right": (a, "Neumann")},
+            d: {"left": (0, "Neumann"), "right": (0, "Neumann")},
+        }
+        mesh = get_mesh_for_testing()
+        spatial_methods = {"macroscale": pybamm.FiniteVolume()}
+        disc = pybamm.Discretisation(mesh, spatial_methods)
+
+        param = pybamm.ParameterValues({"a": 1})
+        disc_model = disc.process_model(
+            param.process_model(model, inplace=False), inplace=False
+        )
+        param.update({"a": 2})
+        new_disc_model = disc.process_model(
+            param.process_model(model, inplace=False), inplace=False
+        )
+        self.assertIs(
+            new_disc_model.initial_conditions[d], disc_model.initial_conditions[d]
+        )
+
+        # the boundary condition on c and the parameter in the equation for d have
+        # changed, so the rhs is discretised again
+        expected_model = pybamm.Discretisation(mesh, spatial_methods).process_model(
+            pybamm.ParameterValues({"a": 2}).process_model(model, inplace=False)
+        )
+        y = np.linspace(0, 1, new_disc_model.concatenated_rhs.size)[:, np.newaxis]
+        np.testing.assert_array_equal(
+            new_disc_model.concatenated_rhs.evaluate(None, y),
+            expected_model.concatenated_rhs.evaluate(None, y),
+        )
+        self.assertFalse(
+            np.array_equal(
+                new_disc_model.concatenated_rhs.evaluate(None, y),
+                disc_model.concatenated_rhs.evaluate(None, y),
+            )
+        )
+
     def test_initial_condition_bounds(self):
         # concatenation of variables as the key
         c = pybamm.Variable("c", bounds=(0, 1))
@@ -6,6 +6,7 @@ import pybamm
 import numpy as np
 import os
 import unittest
+from unittest.mock import patch
 
 
 class TestSimulationExperiment(unittest.TestCase):
@@ -127,6 +128,61 @@ class TestSimulationExperiment(unittest.TestCase):
         self.assertEqual(len(sol3.cycles), 2)
         os.remove("test_experiment.sav")
 
+    def test_run_experiment_share_models(self):
+        drive_cycle = np.array([np.arange(10), 0.1 * np.arange(10)]).T
+        experiment = pybamm.Experiment(
+            [
+                (
+                    "Discharge at C/2 until 3.5 V",
+                    "Rest for 10 minutes",
+                    "Charge at 1 A until 4.1 V",
+                    "Hold at 4.1 V until 50 mA",
+                    "Discharge at 1C until 3.3 V",
+                    "Rest for 5 minutes",
+                    "Charge at 0.5 A until 4.0 V",
+                    "Hold at 4.0 V until 100 mA",
+                    "Run drive_cycle (A)",
+                )
+            ],
+            drive_cycles={"drive_cycle": drive_cycle},
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sol = sim.solve()
+        sim_shared = pybamm.Simulation(
+            model, experiment=experiment, share_experiment_models=True
+        )
+        sol_shared = sim_shared.solve()
+
+        # steps that only differ in the value of the control share a model and a
+        # solver, but drive cycles are never shared
+        built_models = sim_shared.op_conds_to_built_models
+        self.assertEqual(len({id(m) for m in built_models.values()}), 5)
+        self.assertIs(
+            built_models["Discharge at C/2 until 3.5 V"],
+            built_models["Discharge at 1C until 3.3 V"],
+        )
+        self.assertIs(
+            built_models["Rest for 10 minutes"], built_models["Rest for 5 minutes"]
+        )
+        self.assertIsNot(
+            built_models["Discharge at C/2 until 3.5 V"],
+            built_models["Charge at 1 A until 4.1 V"],
+        )
+        self.assertIs(
+            sim_shared.op_conds_to_built_solvers["Hold at 4.1 V until 50 mA"],
+            sim_shared.op_conds_to_built_solvers["Hold at 4.0 V until 100 mA"],
+        )
+        self.assertEqual(len({id(m) for m in sim.op_conds_to_built_models.values()}), 9)
+
+        for step, step_shared in zip(sol.cycles[0].steps, sol_shared.cycles[0].steps):
+            np.testing.assert_array_almost_equal(
+                step["Voltage [V]"].data, step_shared["Voltage [V]"].data, decimal=4
+            )
+            np.testing.assert_array_almost_equal(
+                step["Current [A]"].data, step_shared["Current [A]"].data, decimal=4
+            )
+
     def test_run_experiment_multiple_times(self):
         experiment = pybamm.Experiment(
             [
@@ -395,6 +451,92 @@ class TestSimulationExperiment(unittest.TestCase):
         # Summary variables are not None
         self.assertIsNotNone(sol.summary_variables["Capacity [A.h]"])
 
+    def test_lazy_summary_variables(self):
+        experiment = pybamm.Experiment(
+            [
+                (
+                    "Discharge at 1C until 3.3V",
+                    "Charge at 1C until 4.1 V",
+                    "Hold at 4.1V until C/10",
+                ),
+            ]
+            * 4,
+        )
+        model = pybamm.lithium_ion.SPM({"SEI": "ec reaction limited"})
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        sim = pybamm.Simulation(
+            model, experiment=experiment, parameter_values=parameter_values
+        )
+        solver = pybamm.CasadiSolver("fast with events")
+        sol = sim.solve(solver=solver, lazy_summary_variables=True)
+
+        # Summary variables are only calculated when they are accessed
+        self.assertFalse(
+            any(sum_vars.evaluated for sum_vars in sol.all_summary_variables)
+        )
+
+        # Compare against the summary variables calculated eagerly from the same
+        # cycles
+        esoh_solver = sim.get_esoh_solver(True)
+        all_summary_variables = [
+            pybamm.solvers.solution._get_cycle_summary_variables(cycle, esoh_solver)
+            for cycle in sol.cycles
+        ]
+        self.assertAlmostEqual(
+            sol.all_summary_variables[1]["x_100"], all_summary_variables[1]["x_100"]
+        )
+        self.assertTrue(sol.all_summary_variables[1].evaluated)
+        self.assertFalse(sol.all_summary_variables[2].evaluated)
+
+        # ... and all at once through the summary variables of the solution
+        self.assertEqual(
+            list(sol.summary_variables.keys()),
+            list(all_summary_variables[0].keys()) + ["Cycle number"],
+        )
+        for i, sum_vars in enumerate(all_summary_variables):
+            for name, value in sum_vars.items():
+                np.testing.assert_allclose(sol.summary_variables[name][i], value)
+        self.assertTrue(
+            all(sum_vars.evaluated for sum_vars in sol.all_summary_variables)
+        )
+
+        # A voltage stopping condition does not need the eSOH variables, so they
+        # are still only calculated when they are accessed
+        solve_esoh = pybamm.solvers.solution._solve_esoh
+        experiment = pybamm.Experiment(
+            experiment.operating_conditions_cycles, termination="2.5V"
+        )
+        sim = pybamm.Simulation(
+            model, experiment=experiment, parameter_values=parameter_values
+        )
+        with patch("pybamm.solvers.solution._solve_esoh", wraps=solve_esoh) as mock:
+            sol = sim.solve(solver=solver, lazy_summary_variables=True)
+            self.assertEqual(len(sol.cycles), 4)
+            self.assertEqual(mock.call_count, 0)
+            sol.summary_variables
+            self.assertEqual(mock.call_count, 1)
+
+        # A capacity stopping condition needs the capacity of each cycle, which is
+        # an eSOH variable
+        experiment = pybamm.Experiment(
+            experiment.operating_conditions_cycles, termination="99% capacity"
+        )
+        sim = pybamm.Simulation(
+            model, experiment=experiment, parameter_values=parameter_values
+        )
+        with patch("pybamm.solvers.solution._solve_esoh", wraps=solve_esoh) as mock:
+            sol = sim.solve(solver=solver, lazy_summary_variables=True)
+            self.assertEqual(mock.call_count, len(sol.cycles))
+        self.assertLess(len(sol.cycles), 4)
+        C = sol.summary_variables["Capacity [A.h]"]
+        np.testing.assert_array_less(0.99 * C[0], C[:-1])
+        self.assertLessEqual(C[-1], 0.99 * C[0])
+        for i, cycle in enumerate(sol.cycles):
+            sum_vars = pybamm.solvers.solution._get_cycle_summary_variables(
+                cycle, esoh_solver
+            )
+            np.testing.assert_allclose(C[i], sum_vars["Capacity [A.h]"])
+
     def test_cycle_summary_variables(self):
         # Test cycle_summary_variables works for different combinations of data and
         # function OCPs
@@ -207,6 +207,28 @@ class TestCasadiConverter(unittest.TestCase):
             interp = pybamm.Interpolant(x4_, data4, y4, interpolator="linear")
             interp_casadi = interp.to_casadi(y=casadi_y)
 
+    def test_interpolation_lookup_tables(self):
+        from pybamm.expression_tree.operations.convert_to_casadi import _is_uniform
+
+        y = pybamm.StateVector(slice(0, 2))
+        casadi_y = casadi.MX.sym("y", 2)
+        y_test = np.array([0.35, 0.6])
+        for x in [np.linspace(0, 1, 201), np.linspace(0, 1, 201) ** 2]:
+            # only one lookup table is created for interpolants with the same data
+            interp_1 = pybamm.Interpolant(x, np.sin(x), y)
+            interp_2 = pybamm.Interpolant(x, np.sin(x), 2 * y)
+            n_tables = len(pybamm.CasadiConverter._lookup_tables)
+            interp_1.to_casadi(y=casadi_y)
+            interp_2.to_casadi(y=casadi_y)
+            self.assertEqual(len(pybamm.CasadiConverter._lookup_tables), n_tables + 1)
+
+            f = casadi.Function("f", [casadi_y], [interp_1.to_casadi(y=casadi_y)])
+            np.testing.assert_array_almost_equal(interp_1.evaluate(y=y_test), f(y_test))
+
+        self.assertTrue(_is_uniform(np.linspace(0, 0.3, 31)))
+        self.assertFalse(_is_uniform(np.linspace(0, 1, 31) ** 2))
+        self.assertFalse(_is_uniform(np.array([0, 1])))
+
     def test_interpolation_2d(self):
         x_ = [np.linspace(0, 1), np.linspace(0, 1)]
 
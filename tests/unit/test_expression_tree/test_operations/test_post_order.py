@@ -0,0 +1,90 @@
+#
+# Tests for the post-order traversal of expression trees
+#
+import sys
+import unittest
+
+import casadi
+import numpy as np
+
+import pybamm
+
+
+class TestProcessPostOrder(unittest.TestCase):
+    def test_process_post_order(self):
+        a = pybamm.Parameter("a")
+        b = pybamm.Parameter("b")
+        expr = (a + b) * (a + b) - a
+
+        processed = []
+
+        def process(node):
+            processed.append(node)
+            return node.name
+
+        memo = {}
+        self.assertEqual(pybamm.process_post_order(expr, memo, process), "-")
+        # children are processed before their parents, from left to right, and
+        # repeated nodes are only processed once
+        self.assertEqual(processed, [a, b, a + b, (a + b) * (a + b), expr])
+        self.assertEqual(memo[a + b], "+")
+
+        # nodes that are already in the memo (and the nodes below them) are skipped
+        processed.clear()
+        memo = {a + b: "known"}
+        pybamm.process_post_order(expr, memo, process)
+        self.assertEqual(processed, [(a + b) * (a + b), a, expr])
+        self.assertEqual(memo[a + b], "known")
+
+        # only the children given by `children` are processed first
+        processed.clear()
+        pybamm.process_post_order(expr, {}, process, children=lambda node: [])
+        self.assertEqual(processed, [expr])
+
+    def test_deep_trees(self):
+        depth = 3 * sys.getrecursionlimit()
+
+        y = pybamm.StateVector(slice(0, 1))
+        expr = y
+        for _ in range(depth):
+            expr = pybamm.Addition(y, expr)
+
+        unpacker = pybamm.SymbolUnpacker(pybamm.StateVector)
+        self.assertEqual(unpacker.unpack_symbol(expr), {y})
+
+        jac = pybamm.Jacobian().jac(expr, y)
+        np.testing.assert_array_equal(jac.evaluate().toarray(), depth + 1)
+
+        t_casadi = casadi.MX.sym("t")
+        y_casadi = casadi.MX.sym("y")
+        f = casadi.Function("f", [y_casadi], [expr.to_casadi(t_casadi, y_casadi)])
+        self.assertEqual(f(2), 2 * (depth + 1))
+
+        a = pybamm.Parameter("a")
+        expr = a
+        for _ in range(depth):
+            expr = pybamm.Addition(a, expr)
+        processed = pybamm.ParameterValues({"a": 2}).process_symbol(expr)
+        self.assertEqual(processed.evaluate(), 2 * (depth + 1))
+
+        var = pybamm.Variable("var")
+        expr = var
+        for _ in range(depth):
+            expr = pybamm.Addition(var, expr)
+        disc = pybamm.Discretisation()
+        disc.set_variable_slices([var])
+        discretised = disc.process_symbol(expr)
+        f = casadi.Function(
+            "f", [y_casadi], [discretised.to_casadi(t_casadi, y_casadi)]
+        )
+        self.assertEqual(f(2), 2 * (depth + 1))
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
@@ -2,6 +2,7 @@
 # Test for the Symbol class
 #
 import os
+import sys
 import unittest
 
 import numpy as np
@@ -31,6 +32,51 @@ class TestSymbol(unittest.TestCase):
 
         check_are_equal(symp.children, (symc1, symc2))
 
+    def test_intern_symbols(self):
+        pybamm.settings.intern_symbols = True
+        try:
+            a = pybamm.Parameter("a")
+            b = pybamm.Parameter("b")
+            exp_1 = pybamm.exp(a * b)
+            exp_2 = pybamm.exp(pybamm.Parameter("a") * pybamm.Parameter("b"))
+            # identical subexpressions are shared
+            self.assertIsNot(exp_2, exp_1)
+            self.assertIs(exp_2.children[0], exp_1.children[0])
+            self.assertIs(exp_2.children[0].left, a)
+
+            # nodes that have been modified since they were interned are not reused
+            c = pybamm.Parameter("c")
+            d = pybamm.Parameter("c")
+            pybamm.Negate(c)
+            c.domains = {"primary": ["negative electrode"]}
+            self.assertIs(pybamm.Negate(d).child, d)
+
+            # variables with different scales are not shared, even though they have
+            # the same id
+            var = pybamm.Variable("var", scale=pybamm.Parameter("scale"))
+            scaled_var = var.create_copy()
+            scaled_var._scale = pybamm.Scalar(2)
+            self.assertEqual(var.id, scaled_var.id)
+            pybamm.Negate(var)
+            self.assertIs(pybamm.Negate(scaled_var).child, scaled_var)
+        finally:
+            pybamm.settings.intern_symbols = False
+
+        # deep trees (here built while interning is off, so that none of their nodes
+        # have been interned yet) do not reach the recursion limit
+        expr = a
+        for _ in range(3 * sys.getrecursionlimit()):
+            expr = pybamm.Addition(a, expr)
+        pybamm.settings.intern_symbols = True
+        try:
+            self.assertIs(pybamm.Negate(expr).child, expr)
+        finally:
+            pybamm.settings.intern_symbols = False
+
+        # nodes are not shared when interning is off
+        exp_3 = pybamm.exp(pybamm.Parameter("a") * pybamm.Parameter("b"))
+        self.assertIsNot(exp_3.children[0], exp_1.children[0])
+
     def test_symbol_domains(self):
         a = pybamm.Symbol("a", domain="test")
         self.assertEqual(a.domain, ["test"])
@@ -469,6 +515,37 @@ class TestSymbol(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             sym.shape_for_testing
 
+    def test_static_shape(self):
+        y = pybamm.StateVector(slice(0, 10))
+        matrix = pybamm.Matrix(np.ones((5, 10)))
+        expr = pybamm.exp(-(matrix @ y)) * pybamm.Time() + pybamm.Vector(np.ones(5))
+        expr = pybamm.numpy_concatenation(expr, pybamm.Index(y, slice(2, 5)))
+        self.assertEqual(expr._static_shape(lambda child: child.shape), (8, 1))
+        # Shapes are found without evaluating anything
+        for node in expr.pre_order():
+            node.evaluate = node._evaluate_for_shape = None
+        self.assertEqual(expr.shape, (8, 1))
+        self.assertEqual(expr.shape_for_testing, (8, 1))
+
+        broadcast = pybamm.PrimaryBroadcast(pybamm.Scalar(0), "negative electrode")
+        broadcast = pybamm.SecondaryBroadcast(broadcast, "current collector")
+        self.assertEqual(broadcast.shape_for_testing, (33, 1))
+        full_broadcast = pybamm.FullBroadcast(
+            0, "negative electrode", "current collector"
+        )
+        self.assertEqual(full_broadcast.shape_for_testing, (33, 1))
+
+        # No rule: found by evaluation
+        y = pybamm.StateVector(slice(0, 10))
+        self.assertIsNone(pybamm.max(y)._static_shape(lambda child: child.shape))
+        self.assertEqual(pybamm.max(y).shape, ())
+
+        matrix = pybamm.Matrix(np.ones((5, 10)))
+        with self.assertRaisesRegex(ValueError, "inconsistent shapes"):
+            (y + matrix @ y).shape
+        with self.assertRaisesRegex(ValueError, "dimension mismatch"):
+            (matrix @ pybamm.StateVector(slice(0, 5))).shape
+
     def test_test_shape(self):
         # right shape, passes
         y1 = pybamm.StateVector(slice(0, 10))
@@ -0,0 +1,207 @@
+#
+# Tests for the on-disk model cache
+#
+import functools
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+import pybamm
+
+
+class TestModelCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = pybamm.ModelCache(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_key(self):
+        model = pybamm.lithium_ion.SPM()
+        parameter_values = pybamm.ParameterValues("Chen2020")
+        key = self.cache.get_key(model, parameter_values)
+        self.assertEqual(
+            key, self.cache.get_key(pybamm.lithium_ion.SPM(), parameter_values.copy())
+        )
+
+        # different options, model or parameters give different keys
+        model = pybamm.lithium_ion.SPM({"thermal": "lumped"})
+        self.assertNotEqual(key, self.cache.get_key(model, parameter_values))
+        model = pybamm.lithium_ion.SPMe()
+        self.assertNotEqual(key, self.cache.get_key(model, parameter_values))
+        model = pybamm.lithium_ion.SPM()
+        new_parameter_values = parameter_values.copy()
+        new_parameter_values["Current function [A]"] = 2
+        self.assertNotEqual(key, self.cache.get_key(model, new_parameter_values))
+        new_parameter_values["Current function [A]"] = "[input]"
+        self.assertNotEqual(key, self.cache.get_key(model, new_parameter_values))
+        self.assertNotEqual(
+            key, self.cache.get_key(model, parameter_values, var_pts={"x_n": 10})
+        )
+
+    def test_get_key_functions(self):
+        model = pybamm.lithium_ion.SPM()
+        parameter_values = pybamm.ParameterValues("Chen2020")
+
+        def current(t, a=1):
+            return a + 0 * t
+
+        def make_current(a):
+            def current_closure(t):
+                return a + 0 * t
+
+            return current_closure
+
+        keys = set()
+        for value in [
+            current,
+            functools.partial(current, a=1),
+            functools.partial(current, a=2),
+            make_current(1),
+            make_current(2),
+        ]:
+            parameter_values["Current function [A]"] = value
+            keys.add(self.cache.get_key(model, parameter_values))
+        self.assertEqual(len(keys), 5)
+
+        # the same closure values give the same key
+        parameter_values["Current function [A]"] = make_current(1)
+        self.assertIn(self.cache.get_key(model, parameter_values), keys)
+
+        # values that cannot be represented stably are not cached
+        parameter_values["Current function [A]"] = make_current(threading.Lock())
+        key = self.cache.get_key(model, parameter_values)
+        self.assertIsNone(key)
+        self.cache.save(key, {"x": np.ones(10)})
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+        self.assertIsNone(self.cache.load(key))
+
+    def test_get_key_equations(self):
+        parameter_values = pybamm.ParameterValues({})
+
+        def make_model(rate):
+            model = pybamm.BaseModel()
+            v = pybamm.Variable("v")
+            model.rhs = {v: -rate * v}
+            model.initial_conditions = {v: 1}
+            model.variables = {"v": v}
+            return model
+
+        # models that only differ in their equations get different keys ...
+        key = self.cache.get_key(make_model(1), parameter_values)
+        self.assertEqual(key, self.cache.get_key(make_model(1), parameter_values))
+        self.assertNotEqual(key, self.cache.get_key(make_model(5), parameter_values))
+
+        # ... as do models that are changed after they have been created
+        model = pybamm.lithium_ion.SPM()
+        key = self.cache.get_key(model, parameter_values)
+        model.variables["Double voltage [V]"] = 2 * model.variables["Voltage [V]"]
+        new_key = self.cache.get_key(model, parameter_values)
+        self.assertNotEqual(key, new_key)
+        model.events.append(
+            pybamm.Event("Minimum voltage", model.variables["Voltage [V]"] - 3)
+        )
+        self.assertNotEqual(new_key, self.cache.get_key(model, parameter_values))
+
+        # so simulations of different custom models are not mixed up
+        t_eval = np.linspace(0, 1, 2)
+        for rate in [1, 5]:
+            sim = pybamm.Simulation(
+                make_model(rate),
+                parameter_values=parameter_values,
+                model_cache=self.cache,
+            )
+            sol = sim.solve(t_eval)
+            np.testing.assert_allclose(sol["v"].entries[-1], np.exp(-rate), rtol=1e-3)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    def test_save_load_evict(self):
+        self.assertIsNone(self.cache.load("a"))
+        self.cache.save("a", {"x": np.ones(10)})
+        np.testing.assert_array_equal(self.cache.load("a")["x"], np.ones(10))
+
+        # un-pickleable entries are not saved
+        self.cache.save("b", {"x": lambda x: x})
+        self.assertIsNone(self.cache.load("b"))
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["a.pkl"])
+
+        # corrupt entries are treated as a miss
+        with open(os.path.join(self.tmp_dir.name, "c.pkl"), "w") as f:
+            f.write("not a pickle")
+        self.assertIsNone(self.cache.load("c"))
+
+        # least recently used entries are evicted first
+        self.cache.clear()
+        self.cache.max_size = 2000
+        self.cache.save("a", np.ones(100))
+        self.cache.save("b", np.ones(100))
+        os.utime(os.path.join(self.tmp_dir.name, "a.pkl"), (0, 0))
+        self.cache.load("b")
+        self.cache.save("c", np.ones(100))
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)), ["b.pkl", "c.pkl"])
+
+    def test_simulation(self):
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, model_cache=self.cache)
+        sol = sim.solve([0, 3600])
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 1)
+
+        # a new simulation loads the built model from the cache
+        sim_cached = pybamm.Simulation(model, model_cache=self.cache)
+        sim_cached.build()
+        self.assertIsNone(sim_cached.model_with_set_params)
+        self.assertEqual(sim_cached.mesh.keys(), sim.mesh.keys())
+        sol_cached = sim_cached.solve([0, 3600])
+        np.testing.assert_array_almost_equal(
+            sol_cached["Voltage [V]"].data, sol["Voltage [V]"].data
+        )
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 1)
+
+        # a different mesh gives a different entry
+        var_pts = {"x_n": 5, "x_s": 5, "x_p": 5, "r_n": 5, "r_p": 5}
+        sim = pybamm.Simulation(model, var_pts=var_pts, model_cache=self.cache)
+        sim.build()
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    def test_simulation_experiment(self):
+        model = pybamm.lithium_ion.SPM()
+        experiment = pybamm.Experiment(
+            ["Discharge at C/2 for 10 minutes", "Hold at 3.9 V for 5 minutes"]
+        )
+        sim = pybamm.Simulation(model, experiment=experiment, model_cache=self.cache)
+        sol = sim.solve()
+
+        sim_cached = pybamm.Simulation(
+            model, experiment=experiment, model_cache=self.cache
+        )
+        sim_cached.build_for_experiment()
+        self.assertFalse(hasattr(sim_cached, "op_string_to_model"))
+        self.assertEqual(
+            sim_cached.op_conds_to_built_models.keys(),
+            sim.op_conds_to_built_models.keys(),
+        )
+        sol_cached = sim_cached.solve()
+        np.testing.assert_array_almost_equal(
+            sol_cached["Voltage [V]"].data, sol["Voltage [V]"].data
+        )
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 1)
+
+        # a different experiment gives a different entry
+        experiment = pybamm.Experiment(["Discharge at 1C for 10 minutes"])
+        sim = pybamm.Simulation(model, experiment=experiment, model_cache=self.cache)
+        sim.build_for_experiment()
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
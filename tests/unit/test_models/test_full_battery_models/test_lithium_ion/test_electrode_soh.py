@@ -3,6 +3,7 @@
 #
 import pybamm
 import unittest
+import numpy as np
 
 
 class TestElectrodeSOH(unittest.TestCase):
@@ -75,6 +76,34 @@ class TestElectrodeSOH(unittest.TestCase):
         self.assertAlmostEqual(sol["Up(y_0) - Un(x_0)"], Vmin, places=5)
         self.assertAlmostEqual(sol["Q"], Q, places=5)
 
+    def test_newton_solver(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+        inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
+
+        # The Newton solver agrees with the simulation
+        sol = esoh_solver.solve(inputs)
+        sol_sim = esoh_solver._solve_simulation(inputs)
+        self.assertEqual(sol.keys(), sol_sim.keys())
+        for key in sol:
+            self.assertAlmostEqual(sol[key], sol_sim[key], places=6)
+
+        # The next solve starts from the previous solution
+        np.testing.assert_allclose(esoh_solver._y_guess, [sol["x_100"], sol["x_0"]])
+
+        # Several sets of inputs can be solved at once
+        Q_Li_batch = Q_Li * np.array([1, 0.95, 0.9])
+        sol_batch = esoh_solver.solve({"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li_batch})
+        for i, Q_Li_i in enumerate(Q_Li_batch):
+            sol_i = esoh_solver.solve({"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li_i})
+            for key in sol_i:
+                self.assertAlmostEqual(sol_batch[key][i], sol_i[key], places=8)
+
     def test_error(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Ai2020")
@@ -217,6 +246,52 @@ class TestGetInitialSOC(unittest.TestCase):
         V = parameter_values.evaluate(param.p.prim.U(y0, T) - param.n.prim.U(x0, T))
         self.assertAlmostEqual(V, 2.8)
 
+    def test_batched_inputs(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+        inputs = {
+            "Q_n": Q_n * np.array([1, 0.95, 0.9]),
+            "Q_p": Q_p * np.array([1, 0.98, 0.96]),
+            "Q_Li": Q_Li * np.array([1, 0.97, 0.94]),
+        }
+
+        stoichiometries = pybamm.lithium_ion.get_min_max_stoichiometries(
+            parameter_values, param, inputs=inputs
+        )
+        for initial_value in [0.4, np.array([0, 0.5, 1]), "4 V"]:
+            x, y = pybamm.lithium_ion.get_initial_stoichiometries(
+                initial_value, parameter_values, param, inputs=inputs
+            )
+            self.assertEqual(x.shape, (3,))
+            for i in range(3):
+                inputs_i = {k: v[i] for k, v in inputs.items()}
+                self.assertAlmostEqual(
+                    stoichiometries[0][i],
+                    pybamm.lithium_ion.get_min_max_stoichiometries(
+                        parameter_values, param, inputs=inputs_i
+                    )[0],
+                )
+                value_i = (
+                    initial_value[i]
+                    if isinstance(initial_value, np.ndarray)
+                    else initial_value
+                )
+                x_i, y_i = pybamm.lithium_ion.get_initial_stoichiometries(
+                    value_i, parameter_values, param, inputs=inputs_i
+                )
+                self.assertAlmostEqual(x[i], x_i)
+                self.assertAlmostEqual(y[i], y_i)
+
+        with self.assertRaisesRegex(
+            ValueError, "Initial SOC should be between 0 and 1"
+        ):
+            pybamm.lithium_ion.get_initial_stoichiometries(
+                np.array([0.5, 2, 0.5]), parameter_values, param, inputs=inputs
+            )
+
     def test_initial_soc_cell_capacity(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Mohtat2020")
@@ -142,6 +142,29 @@ class TestParameterValues(unittest.TestCase):
         del param["a"]
         self.assertNotIn("a", param.keys())
 
+    def test_update_keeps_processed_symbols(self):
+        a = pybamm.Parameter("a")
+        b = pybamm.Parameter("b")
+        c = pybamm.Parameter("c")
+        f = pybamm.FunctionParameter("f", {"x": b})
+        param = pybamm.ParameterValues({"a": 1, "b": 2, "c": c * 0 + 3, "f": 4})
+        param.update({"f": lambda x: x**2, "c": a + 2}, check_already_exists=False)
+
+        b_times_f = param.process_symbol(b * f)
+        processed_c = param.process_symbol(pybamm.exp(c))
+        self.assertEqual(param.process_symbol(a * b * f + c).evaluate(), 11)
+
+        # only the processed symbols that depend on "a" are processed again
+        param.update({"a": 2})
+        self.assertIs(param.process_symbol(b * f), b_times_f)
+        self.assertIsNot(param.process_symbol(pybamm.exp(c)), processed_c)
+        self.assertEqual(param.process_symbol(a * b * f + c).evaluate(), 20)
+
+        # parameters in function parameters are tracked too
+        param.update({"b": 3})
+        self.assertIsNot(param.process_symbol(b * f), b_times_f)
+        self.assertEqual(param.process_symbol(b * f).evaluate(), 27)
+
     def test_set_initial_stoichiometries(self):
         param = pybamm.ParameterValues("Chen2020")
         param.set_initial_stoichiometries(0.4)
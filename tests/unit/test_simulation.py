@@ -200,6 +200,95 @@ class TestSimulation(unittest.TestCase):
         sim.build(initial_soc=0.5)
         self.assertEqual(sim._built_initial_soc, 0.5)
 
+    def test_update_parameters(self):
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model)
+        sim.solve([0, 600])
+        built_model = sim.built_model
+        sim.update_parameters({"Current function [A]": 2})
+        self.assertIsNot(sim.built_model, built_model)
+        # the parts of the model that do not depend on the current are reused
+        self.assertIs(
+            sim.built_model.variables["Negative electrode porosity"],
+            built_model.variables["Negative electrode porosity"],
+        )
+        sol = sim.solve([0, 600])
+
+        param = model.default_parameter_values
+        param["Current function [A]"] = 2
+        expected = pybamm.Simulation(model, parameter_values=param).solve([0, 600])
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].data, expected["Voltage [V]"].data
+        )
+
+        # before building, the parameter values are just updated
+        sim = pybamm.Simulation(model)
+        sim.update_parameters({"Current function [A]": 2})
+        self.assertEqual(sim.parameter_values["Current function [A]"], 2)
+
+        sim.build()
+        with self.assertRaisesRegex(ValueError, "geometry"):
+            sim.update_parameters({"Negative electrode thickness [m]": 1e-4})
+        exp = pybamm.Experiment(["Rest for 1 minute"])
+        sim = pybamm.Simulation(model, experiment=exp)
+        with self.assertRaisesRegex(NotImplementedError, "experiment"):
+            sim.update_parameters({"Current function [A]": 2})
+
+    def test_sweep(self):
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model)
+        solutions = sim.sweep({"Current function [A]": [1, 2]}, t_eval=[0, 600])
+        self.assertEqual(len(solutions), 2)
+        for current, solution in zip([1, 2], solutions):
+            param = model.default_parameter_values
+            param["Current function [A]"] = current
+            expected = pybamm.Simulation(model, parameter_values=param).solve([0, 600])
+            np.testing.assert_array_almost_equal(
+                solution["Voltage [V]"].data, expected["Voltage [V]"].data
+            )
+
+        # the model is only built once for the same swept parameters
+        built_model = sim._sweep_simulations[("Current function [A]",)].built_model
+        sim.sweep({"Current function [A]": [3]}, t_eval=[0, 600])
+        self.assertIs(
+            sim._sweep_simulations[("Current function [A]",)].built_model,
+            built_model,
+        )
+
+        # parameters that set the initial conditions are built separately
+        c_n_init = "Initial concentration in negative electrode [mol.m-3]"
+        values = {c_n_init: [19986, 15000, 19986], "Current function [A]": [1, 2, 3]}
+        solutions = sim.sweep(values, t_eval=[0, 600])
+        for i, solution in enumerate(solutions):
+            param = model.default_parameter_values
+            param.update({name: value[i] for name, value in values.items()})
+            expected = pybamm.Simulation(model, parameter_values=param).solve([0, 600])
+            np.testing.assert_array_almost_equal(
+                solution["Voltage [V]"].data, expected["Voltage [V]"].data
+            )
+        self.assertIn(
+            (("Current function [A]",), ((c_n_init, 19986),)), sim._sweep_simulations
+        )
+        solutions = sim.sweep({c_n_init: [19986, 15000]}, t_eval=[0, 600])
+        self.assertLess(
+            solutions[1]["Voltage [V]"].data[0], solutions[0]["Voltage [V]"].data[0]
+        )
+
+        with self.assertRaisesRegex(ValueError, "same number of values"):
+            sim.sweep(
+                {
+                    "Current function [A]": [1, 2],
+                    "Ambient temperature [K]": [298.15],
+                }
+            )
+        sim.build()
+        with self.assertRaisesRegex(ValueError, "geometry"):
+            sim.sweep({"Negative electrode thickness [m]": [1e-4]})
+        exp = pybamm.Experiment(["Rest for 1 minute"])
+        sim = pybamm.Simulation(model, experiment=exp)
+        with self.assertRaisesRegex(NotImplementedError, "experiment"):
+            sim.sweep({"Current function [A]": [1, 2]})
+
     def test_solve_with_inputs(self):
         model = pybamm.lithium_ion.SPM()
         param = model.default_parameter_values
@@ -0,0 +1,102 @@
+#
+# Tests for the cache of CasADi functions
+#
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import pybamm
+
+
+class TestCasadiFunctionCache(unittest.TestCase):
+    def setUp(self):
+        pybamm.casadi_function_cache.clear()
+
+    def tearDown(self):
+        pybamm.casadi_function_cache.clear()
+
+    def test_get_set(self):
+        cache = pybamm.CasadiFunctionCache(maxsize=2)
+        a = pybamm.Scalar(1)
+        b = pybamm.Scalar(2)
+        c = pybamm.Scalar(3)
+        self.assertIsNone(cache.get(a, ("a",)))
+        cache.set(a, ("a",), "entry a")
+        self.assertEqual(cache.get(a, ("a",)), "entry a")
+        # the same expression with a different key is a different entry
+        self.assertIsNone(cache.get(a, ("b",)))
+        # an identical expression is the same entry
+        self.assertEqual(cache.get(pybamm.Scalar(1), ("a",)), "entry a")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+        # least recently used entries are dropped
+        cache.set(b, (), "entry b")
+        cache.get(a, ("a",))
+        cache.set(c, (), "entry c")
+        self.assertIsNone(cache.get(b, ()))
+        self.assertEqual(cache.get(a, ("a",)), "entry a")
+
+        # disabled cache
+        cache = pybamm.CasadiFunctionCache(maxsize=0)
+        cache.set(a, (), "entry a")
+        self.assertIsNone(cache.get(a, ()))
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = pybamm.CasadiFunctionCache(directory=tmp_dir)
+            a = pybamm.Scalar(1)
+            cache.set(a, ("a",), "entry a")
+            self.assertEqual(len(os.listdir(tmp_dir)), 1)
+
+            cache = pybamm.CasadiFunctionCache(directory=tmp_dir)
+            self.assertEqual(cache.get(a, ("a",)), "entry a")
+            self.assertIsNone(cache.get(a, ("b",)))
+
+            # corrupt entries are treated as a miss
+            with open(cache._path(a, ("a",)), "w") as f:
+                f.write("not a pickle")
+            cache.clear()
+            self.assertIsNone(cache.get(a, ("a",)))
+
+    def test_reuse_between_solvers(self):
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model)
+        sim.build()
+        t_eval = np.linspace(0, 3600, 10)
+
+        solver = pybamm.CasadiSolver()
+        sol = solver.solve(sim.built_model, t_eval)
+        self.assertEqual(pybamm.casadi_function_cache.hits, 0)
+        misses = pybamm.casadi_function_cache.misses
+        self.assertGreater(misses, 0)
+
+        # a new solver for the same model reuses the functions
+        new_solver = pybamm.CasadiSolver()
+        new_sol = new_solver.solve(sim.built_model, t_eval)
+        self.assertEqual(pybamm.casadi_function_cache.hits, misses)
+        self.assertEqual(pybamm.casadi_function_cache.misses, misses)
+        np.testing.assert_array_equal(new_sol.y, sol.y)
+
+        # different inputs need new functions
+        sim = pybamm.Simulation(
+            model,
+            parameter_values=pybamm.ParameterValues(
+                {**model.default_parameter_values, "Current function [A]": "[input]"}
+            ),
+        )
+        sim.build()
+        solver = pybamm.CasadiSolver()
+        solver.solve(sim.built_model, t_eval, inputs={"Current function [A]": 1})
+        self.assertGreater(pybamm.casadi_function_cache.misses, misses)
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
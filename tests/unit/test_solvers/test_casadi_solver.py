@@ -1,11 +1,14 @@
 #
 # Tests for the Casadi Solver class
 #
+import casadi
 import pybamm
 import unittest
 import numpy as np
 from tests import get_mesh_for_testing, get_discretisation_for_testing
 from scipy.sparse import eye
+from types import SimpleNamespace
+from unittest.mock import patch
 
 
 class TestCasadiSolver(unittest.TestCase):
@@ -412,6 +415,129 @@ class TestCasadiSolver(unittest.TestCase):
             solution.y.full()[0], np.exp(-1.1 * solution.t), rtol=1e-04
         )
 
+    def test_model_solver_batch_inputs(self):
+        # Create model
+        model = pybamm.BaseModel()
+        var1 = pybamm.Variable("var1")
+        var2 = pybamm.Variable("var2")
+        model.rhs = {var1: -pybamm.InputParameter("rate") * var1}
+        model.algebraic = {var2: 2 * var1 - var2}
+        model.initial_conditions = {var1: 1, var2: 2}
+        model.events = [pybamm.Event("var1=0.5", var1 - 0.5)]
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        t_eval = np.linspace(0, 5, 100)
+        inputs_list = [{"rate": 0.1 * (i + 1)} for i in range(4)]
+        solver = pybamm.CasadiSolver(
+            mode="fast with events", rtol=1e-8, atol=1e-8, batch_inputs=True
+        )
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        # No worker processes are used
+        self.assertIsNone(solver._pool)
+        for i, solution in enumerate(solutions):
+            rate = 0.1 * (i + 1)
+            np.testing.assert_allclose(
+                solution.y.full()[0], np.exp(-rate * solution.t), rtol=1e-5
+            )
+            np.testing.assert_allclose(
+                solution.y.full()[-1], 2 * np.exp(-rate * solution.t), rtol=1e-5
+            )
+            self.assertEqual(solution.all_inputs[0]["rate"], rate)
+        # The last two inputs reach the event before the final time
+        self.assertEqual(solutions[0].termination, "final time")
+        self.assertEqual(solutions[-1].termination, "event: var1=0.5")
+        np.testing.assert_allclose(solutions[-1].t[-1], np.log(2) / 0.4, rtol=1e-3)
+
+        # The mapped integrator is reused
+        n_integrators = len(solver.integrators[model])
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        self.assertEqual(len(solver.integrators[model]), n_integrators)
+
+    def test_safe_mode_shares_integrators(self):
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -0.1 * var}
+        model.initial_conditions = {var: 1}
+        model.events = [pybamm.Event("var=0.1", var - 0.1)]
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        # Windows of equally spaced times with different time steps all use the
+        # same integrator, which rescales time
+        solver = pybamm.CasadiSolver(mode="safe", rtol=1e-8, atol=1e-8, dt_max=1)
+        for t_eval in [np.linspace(0, 5, 6), np.linspace(0, 10, 6)]:
+            solution = solver.solve(model, t_eval)
+            np.testing.assert_array_equal(solution.t, t_eval)
+            np.testing.assert_allclose(
+                solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-6
+            )
+        self.assertEqual(len(solver.integrators[model]), 1)
+
+        # Windows that are the same up to a shift and a rescaling also share an
+        # integrator
+        t_eval = np.array([0, 0.1, 0.4, 1, 1.1, 1.4, 2])
+        solver = pybamm.CasadiSolver(mode="safe", rtol=1e-8, atol=1e-8, dt_max=1.05)
+        solution = solver.solve(model, t_eval)
+        np.testing.assert_array_equal(solution.t, t_eval)
+        np.testing.assert_allclose(
+            solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-6
+        )
+        self.assertEqual(len(solver.integrators[model]), 1)
+
+        # The dense windows used to locate events share an integrator too
+        solver = pybamm.CasadiSolver(mode="safe", rtol=1e-8, atol=1e-8)
+        for t_eval in [np.linspace(0, 30, 4), np.linspace(0, 30, 7)]:
+            solution = solver.solve(model, t_eval)
+            self.assertEqual(solution.termination, "event: var=0.1")
+            np.testing.assert_allclose(solution.t[-1], 10 * np.log(10), rtol=1e-3)
+        self.assertEqual(len(solver.integrators[model]), 3)
+
+    def test_max_integrators(self):
+        with self.assertRaisesRegex(ValueError, "max_integrators"):
+            pybamm.CasadiSolver(max_integrators=0)
+
+        models = []
+        for rate in [0.1, 0.2]:
+            model = pybamm.BaseModel()
+            var = pybamm.Variable("var")
+            model.rhs = {var: -rate * var}
+            model.initial_conditions = {var: 1}
+            pybamm.Discretisation().process_model(model)
+            models.append(model)
+        model_1, model_2 = models
+
+        solver = pybamm.CasadiSolver(mode="fast", max_integrators=2)
+        t_evals = [np.linspace(0, 1, n) for n in [10, 20, 30]]
+        solver.solve(model_1, t_evals[0])
+        solver.solve(model_1, t_evals[1])
+        solver.solve(model_1, t_evals[0])
+        self.assertEqual((solver.integrator_hits, solver.integrator_misses), (1, 2))
+
+        # The least recently used integrator is dropped
+        solver.solve(model_1, t_evals[2])
+        self.assertEqual(len(solver.integrators[model_1]), 2)
+        self.assertEqual(solver.integrator_misses, 3)
+        solver.solve(model_1, t_evals[0])
+        self.assertEqual(solver.integrator_hits, 2)
+        solver.solve(model_1, t_evals[1])
+        self.assertEqual(solver.integrator_misses, 4)
+
+        # Copies of the solver (e.g. for the steps of an experiment) share the
+        # integrators. The integrators of the least recently used model are dropped
+        # first, and its problem is dropped with its last integrator
+        solver_2 = solver.copy()
+        solver_2.solve(model_2, t_evals[0])
+        self.assertEqual(len(solver.integrators[model_1]), 1)
+        solver_2.solve(model_2, t_evals[1])
+        self.assertNotIn(model_1, solver.integrators)
+        self.assertNotIn(model_1, solver.integrator_specs)
+        solution = solver.solve(model_1, t_evals[1])
+        np.testing.assert_allclose(
+            solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-5
+        )
+        self.assertEqual(list(solver.integrators), [model_2, model_1])
+
     def test_model_solver_dae_inputs_in_initial_conditions(self):
         # Create model
         model = pybamm.BaseModel()
@@ -538,6 +664,49 @@ class TestCasadiSolver(unittest.TestCase):
         with self.assertRaisesRegex(pybamm.SolverError, "interpolation bounds"):
             solver.solve(model, t_eval=[0, 1])
 
+    def test_fused_rhs_algebraic_events(self):
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        shared = pybamm.exp(u) * pybamm.sin(v)
+        model.rhs = {u: -shared}
+        model.algebraic = {v: v - 0.5 - shared}
+        model.initial_conditions = {u: 1, v: 0.5}
+        model.events = [pybamm.Event("u = 0.5", u - 0.5, pybamm.EventType.SWITCH)]
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.CasadiSolver(mode="fast with events")
+        solver.set_up(model)
+        fused = model.casadi_rhs_algebraic_events
+        functions = [model.casadi_rhs, model.casadi_algebraic]
+        functions += model.casadi_switch_events
+        self.assertEqual(fused.n_out(), 3)
+
+        # the fused function gives the same outputs as the separate functions, but
+        # the shared term is only computed once
+        y = np.array([[0.8], [0.6]])
+        for fused_out, func in zip(fused(0, y, []), functions):
+            np.testing.assert_array_almost_equal(fused_out, func(0, y, []))
+        self.assertLess(fused.n_nodes(), sum(f.n_nodes() for f in functions))
+
+        # without common subexpression elimination (CasADi < 3.6) the outputs are
+        # combined as they are
+        no_cse = SimpleNamespace(Function=casadi.Function)
+        with patch("pybamm.solvers.base_solver.casadi", no_cse):
+            unfused = pybamm.solvers.base_solver.fuse_casadi_functions(
+                "unfused", functions, fused.mx_in()
+            )
+        for unfused_out, func in zip(unfused(0, y, []), functions):
+            np.testing.assert_array_almost_equal(unfused_out, func(0, y, []))
+
+        t_eval = np.linspace(0, 1, 10)
+        solution = solver.solve(model, t_eval)
+        u_sol, v_sol = solution.y.full()
+        np.testing.assert_array_almost_equal(
+            v_sol, 0.5 + np.exp(u_sol) * np.sin(v_sol), decimal=5
+        )
+
 
 class TestCasadiSolverODEsWithForwardSensitivityEquations(unittest.TestCase):
     def test_solve_sensitivity_scalar_var_scalar_input(self):
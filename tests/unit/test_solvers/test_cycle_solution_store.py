@@ -0,0 +1,131 @@
+#
+# Tests for the on-disk store of cycle solutions
+#
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import pybamm
+
+
+class TestCycleSolutionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_simulation(self):
+        experiment = pybamm.Experiment(
+            [
+                (
+                    "Discharge at 1C until 3.3V",
+                    "Charge at 1C until 4.1 V",
+                    "Hold at 4.1V until C/10",
+                ),
+            ]
+            * 4,
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sol = sim.solve(save_at_cycles=2)
+
+        store = pybamm.CycleSolutionStore(self.tmp_dir.name)
+        sol_stored = sim.solve(save_at_cycles=2, cycle_store=store)
+        self.assertIs(sol_stored.cycles, store)
+        self.assertEqual(len(store), 4)
+        # cycles that are not saved are not written to disk
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 3)
+        self.assertIsNone(store[2])
+
+        # the returned solution only contains the last cycle
+        np.testing.assert_array_equal(sol_stored.t, store[-1].t)
+        np.testing.assert_array_equal(
+            sol_stored["Voltage [V]"].data, store[-1]["Voltage [V]"].data
+        )
+        for cycle, cycle_stored in zip(sol.cycles, store):
+            if cycle is None:
+                self.assertIsNone(cycle_stored)
+                continue
+            np.testing.assert_array_almost_equal(cycle.t, cycle_stored.t)
+            np.testing.assert_array_almost_equal(
+                cycle["Voltage [V]"].data, cycle_stored["Voltage [V]"].data
+            )
+            self.assertEqual(len(cycle.steps), len(cycle_stored.steps))
+            for step, step_stored in zip(cycle.steps, cycle_stored.steps):
+                np.testing.assert_array_almost_equal(
+                    step["Current [A]"].data, step_stored["Current [A]"].data
+                )
+                self.assertEqual(step.termination, step_stored.termination)
+            self.assertAlmostEqual(
+                cycle.cycle_summary_variables["Capacity [A.h]"],
+                cycle_stored.cycle_summary_variables["Capacity [A.h]"],
+            )
+        np.testing.assert_array_almost_equal(
+            sol.summary_variables["Capacity [A.h]"],
+            sol_stored.summary_variables["Capacity [A.h]"],
+        )
+        self.assertEqual(len(store[1:3]), 2)
+        self.assertEqual(store[-1].t[-1], store[3].t[-1])
+        with self.assertRaisesRegex(IndexError, "out of range"):
+            store[4]
+
+        # continuing from a stored solution needs a store, so that the stored
+        # cycles are not loaded back into memory ...
+        with self.assertRaisesRegex(ValueError, "cycle_store must also be given"):
+            sim.solve(starting_solution=sol_stored)
+        self.assertEqual(len(store), 4)
+
+        # ... either a new one, to which the stored cycles are copied ...
+        new_store = pybamm.CycleSolutionStore(os.path.join(self.tmp_dir.name, "new"))
+        sol_continued = sim.solve(starting_solution=sol_stored, cycle_store=new_store)
+        self.assertIs(sol_continued.cycles, new_store)
+        self.assertEqual(len(new_store), 8)
+        self.assertEqual(len(store), 4)
+        np.testing.assert_array_equal(new_store[0].t, store[0].t)
+        self.assertIsNone(new_store[2])
+
+        # ... or the same one, to which the new cycles are added
+        sol_stored = sim.solve(starting_solution=sol_stored, cycle_store=store)
+        self.assertIs(sol_stored.cycles, store)
+        self.assertEqual(len(store), 8)
+        self.assertGreater(sol_stored.t[0], store[3].t[-1] - 1e-6)
+        self.assertEqual(len(sol_stored.summary_variables["Capacity [A.h]"]), 8)
+
+        # continuing from an in-memory solution writes its cycles to the store
+        other_store = pybamm.CycleSolutionStore(
+            os.path.join(self.tmp_dir.name, "other")
+        )
+        sol_stored = sim.solve(starting_solution=sol, cycle_store=other_store)
+        self.assertEqual(len(other_store), 8)
+        self.assertEqual(len(sol.cycles), 4)
+        np.testing.assert_array_equal(other_store[0].t, sol.cycles[0].t)
+
+        # not allowed without an experiment
+        sim = pybamm.Simulation(model)
+        with self.assertRaisesRegex(ValueError, "cycle_store"):
+            sim.solve([0, 600], cycle_store=store)
+
+    def test_empty_steps(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 1 minute", "Charge at 1C until 3 V")]
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        store = pybamm.CycleSolutionStore(self.tmp_dir.name)
+        sim.solve(cycle_store=store)
+        steps = store[0].steps
+        self.assertIsInstance(steps[1], pybamm.EmptySolution)
+        self.assertEqual(steps[1].termination, "Event exceeded in initial conditions")
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
@@ -180,6 +180,37 @@ class TestIDAKLUSolver(unittest.TestCase):
             true_solution = b_value * sol.t
             np.testing.assert_array_almost_equal(sol.y[1:3], true_solution)
 
+    def test_multiple_inputs(self):
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        a = pybamm.InputParameter("a")
+        model.rhs = {u: a * v}
+        model.algebraic = {v: 1 - v}
+        model.initial_conditions = {u: 0, v: 1}
+        model.events = [pybamm.Event("u=0.2", 0.2 - u)]
+
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.IDAKLUSolver()
+        t_eval = np.linspace(0, 3, 100)
+        inputs_list = [{"a": 0.01 * (i + 1)} for i in range(10)]
+
+        # Solved on native threads, not on a pool of processes
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNone(solver._pool)
+        for inputs, sol in zip(inputs_list, solutions):
+            np.testing.assert_array_almost_equal(sol.y[0], inputs["a"] * sol.t)
+            np.testing.assert_array_almost_equal(sol.y[1], np.ones(sol.t.shape))
+            self.assertEqual(sol.all_inputs[0]["a"], inputs["a"])
+
+        # The last inputs reach the event, at different times
+        self.assertEqual(solutions[0].termination, "final time")
+        self.assertEqual(solutions[-1].termination, "event: u=0.2")
+        np.testing.assert_array_almost_equal(solutions[-1].t[-1], 2.0)
+        np.testing.assert_array_almost_equal(solutions[-2].t[-1], 0.2 / 0.09)
+
     def test_ida_roberts_klu_sensitivities(self):
         # this test implements a python version of the ida Roberts
         # example provided in sundials
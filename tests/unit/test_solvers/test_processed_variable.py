@@ -202,6 +202,43 @@ class TestProcessedVariable(unittest.TestCase):
             processed_eqn2.entries, y_sol + x_sol[:, np.newaxis]
         )
 
+    def test_processed_variable_1D_multiple_sub_solutions(self):
+        # sub-solutions with different numbers of states are evaluated separately
+        t = pybamm.t
+        var = pybamm.Variable("var", domain=["negative electrode", "separator"])
+        x = pybamm.SpatialVariable("x", domain=["negative electrode", "separator"])
+        disc = tests.get_discretisation_for_testing()
+        disc.set_variable_slices([var])
+        x_sol = disc.process_symbol(x).entries[:, 0]
+        eqn_sol = disc.process_symbol(t * var + x)
+        n = len(x_sol)
+
+        t_sol_1 = np.linspace(0, 1, 10)
+        y_sol_1 = np.ones(n)[:, np.newaxis] * np.linspace(0, 5, 10)
+        t_sol_2 = np.linspace(1.1, 2, 20)
+        y_sol_2 = np.vstack([np.linspace(0, 3, 20) * x_sol[:, np.newaxis], -t_sol_2])
+        solution = pybamm.Solution(
+            [t_sol_1, t_sol_2],
+            [y_sol_1, y_sol_2],
+            [pybamm.BaseModel(), pybamm.BaseModel()],
+            [{}, {}],
+        )
+        processed_eqn = pybamm.ProcessedVariable(
+            [eqn_sol, eqn_sol],
+            [to_casadi(eqn_sol, y_sol_1), to_casadi(eqn_sol, y_sol_2)],
+            solution,
+            warn=False,
+        )
+        np.testing.assert_array_almost_equal(
+            processed_eqn.entries,
+            np.hstack(
+                [
+                    t_sol_1 * y_sol_1 + x_sol[:, np.newaxis],
+                    t_sol_2 * y_sol_2[:n] + x_sol[:, np.newaxis],
+                ]
+            ),
+        )
+
     def test_processed_variable_1D_unknown_domain(self):
         x = pybamm.SpatialVariable("x", domain="SEI layer", coord_sys="cartesian")
         geometry = pybamm.Geometry(
@@ -848,6 +885,75 @@ class TestProcessedVariable(unittest.TestCase):
         # 2 scalars
         np.testing.assert_array_equal(processed_var(t=None, y=0.2, z=0.2).shape, ())
 
+    def test_at(self):
+        t = pybamm.t
+        var = pybamm.Variable("var", domain=["negative electrode", "separator"])
+        x = pybamm.SpatialVariable("x", domain=["negative electrode", "separator"])
+        disc = tests.get_discretisation_for_testing()
+        disc.set_variable_slices([var])
+        x_sol = disc.process_symbol(x).entries[:, 0]
+        eqn_sol = disc.process_symbol(t * var + x)
+        t_sol = np.linspace(0, 1, 11)
+        y_sol = np.ones_like(x_sol)[:, np.newaxis] * np.linspace(0, 5, 11)
+        eqn_casadi = to_casadi(eqn_sol, y_sol)
+
+        def process():
+            return pybamm.ProcessedVariable(
+                [eqn_sol],
+                [eqn_casadi],
+                pybamm.Solution(t_sol, y_sol, pybamm.BaseModel(), {}),
+                warn=False,
+            )
+
+        expected = process().entries
+
+        # time window, evaluated only at the time points in the window
+        processed_eqn = process()
+        window = processed_eqn.at(slice(0.25, 0.65))
+        self.assertNotIn("entries", processed_eqn.__dict__)
+        np.testing.assert_array_equal(window.t_pts, t_sol[3:7])
+        np.testing.assert_array_almost_equal(window.entries, expected[:, 3:7])
+        self.assertEqual(window.first_dimension, "x")
+        np.testing.assert_array_equal(
+            processed_eqn.at(slice(None, 0.1)).entries, expected[:, :2]
+        )
+        with self.assertRaisesRegex(ValueError, "step"):
+            processed_eqn.at(slice(0, 1, 2))
+        with self.assertRaisesRegex(ValueError, "No time points"):
+            processed_eqn.at(slice(0.31, 0.39))
+
+        # times, interpolated between neighbouring time points
+        np.testing.assert_array_almost_equal(
+            processed_eqn.at(0.15), (expected[:, 1] + expected[:, 2]) / 2
+        )
+        values = processed_eqn.at([0, 0.15, 1, 2])
+        self.assertEqual(values.shape, (len(x_sol), 4))
+        np.testing.assert_array_almost_equal(values[:, [0, 2]], expected[:, [0, -1]])
+        self.assertTrue(np.isnan(values[:, 3]).all())
+        self.assertNotIn("entries", processed_eqn.__dict__)
+
+        # same result once the variable has been evaluated at all time points
+        processed_eqn.entries
+        np.testing.assert_array_almost_equal(processed_eqn.at([0, 0.15, 1, 2]), values)
+
+        # integrals use the values at earlier time points
+        var = pybamm.StateVector(slice(0, 1))
+        var.mesh = None
+        y_sol = np.array([np.linspace(0, 5, 11)])
+        processed_var = pybamm.ProcessedVariable(
+            [var],
+            [to_casadi(var, y_sol)],
+            pybamm.Solution(t_sol, y_sol, pybamm.BaseModel(), {}),
+            cumtrapz_ic=1,
+            warn=False,
+        )
+        np.testing.assert_array_almost_equal(
+            processed_var.at(slice(0.5, None)).entries, processed_var.entries[5:]
+        )
+        np.testing.assert_array_almost_equal(
+            processed_var.at(0.5), processed_var.entries[5]
+        )
+
     def test_call_failure(self):
         # x domain
         var = pybamm.Variable("var x", domain=["negative electrode", "separator"])
@@ -898,6 +1004,73 @@ class TestProcessedVariable(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "t cannot be None"):
             processed_var()
 
+    def test_processed_variable_no_time_points(self):
+        t_sol = np.array([])
+        # 0D
+        var = pybamm.StateVector(slice(0, 1))
+        var.mesh = None
+        y_sol = np.zeros((1, 0))
+        processed_var = pybamm.ProcessedVariable(
+            [var],
+            [to_casadi(var, y_sol)],
+            pybamm.Solution(t_sol, y_sol, pybamm.BaseModel(), {}, check_solution=False),
+            warn=False,
+        )
+        self.assertEqual(processed_var.entries.shape, (0,))
+        with self.assertRaisesRegex(ValueError, "no time points"):
+            processed_var(0)
+
+        # 1D
+        var = pybamm.Variable("var", domain=["negative electrode", "separator"])
+        disc = tests.get_discretisation_for_testing()
+        disc.set_variable_slices([var])
+        var_sol = disc.process_symbol(var)
+        y_sol = np.zeros((var_sol.size, 0))
+        processed_var = pybamm.ProcessedVariable(
+            [var_sol],
+            [to_casadi(var_sol, y_sol)],
+            pybamm.Solution(t_sol, y_sol, pybamm.BaseModel(), {}, check_solution=False),
+            warn=False,
+        )
+        self.assertEqual(processed_var.entries.shape, (var_sol.size, 0))
+
+    def test_initialisation_failure(self):
+        var = pybamm.Variable("var", domain=["negative electrode", "separator"])
+        x = pybamm.SpatialVariable("x", domain=["negative electrode", "separator"])
+        disc = tests.get_discretisation_for_testing()
+        disc.set_variable_slices([var])
+        x_sol = disc.process_symbol(x).entries[:, 0]
+        var_sol = disc.process_symbol(var)
+        t_sol = np.linspace(0, 1)
+        y_sol = x_sol[:, np.newaxis] * np.linspace(0, 5)
+
+        var_casadi = to_casadi(var_sol, y_sol)
+        processed_var = pybamm.ProcessedVariable(
+            [var_sol],
+            [var_casadi],
+            pybamm.Solution(t_sol, y_sol, pybamm.BaseModel(), {}),
+            warn=False,
+        )
+
+        # an AttributeError from inside the initialiser is not mistaken for a
+        # missing attribute
+        def initialise_1D():
+            raise AttributeError("missing mesh")
+
+        processed_var.initialise_1D = initialise_1D
+        with self.assertRaisesRegex(
+            AttributeError, "Failed to initialise .* 'entries': missing mesh"
+        ) as cm:
+            processed_var.entries
+        self.assertEqual(str(cm.exception.__cause__), "missing mesh")
+        # hasattr and getattr with a default still work
+        self.assertFalse(hasattr(processed_var, "entries"))
+        self.assertIsNone(getattr(processed_var, "entries", None))
+
+        # the variable is initialised again on the next access
+        del processed_var.initialise_1D
+        np.testing.assert_array_equal(processed_var.entries, y_sol)
+
     def test_3D_raises_error(self):
         var = pybamm.Variable(
             "var",
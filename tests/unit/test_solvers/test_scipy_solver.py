@@ -3,6 +3,7 @@
 import pybamm
 import unittest
 import numpy as np
+import pickle
 from tests import get_mesh_for_testing, get_discretisation_for_testing
 import warnings
 import sys
@@ -277,6 +278,57 @@ class TestScipySolver(unittest.TestCase):
                         solution.y[0], np.exp(-0.01 * (i + 1) * solution.t)
                     )
 
+    def test_model_solver_multiple_inputs_persistent_pool(self):
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -pybamm.InputParameter("rate") * var}
+        model.initial_conditions = {var: 1}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 10, 100)
+        inputs_list = [{"rate": 0.01 * (i + 1)} for i in range(4)]
+
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        pool = solver._pool
+        self.assertIsNotNone(pool)
+
+        # The pool is reused for the next solve, and solutions hold the model
+        inputs_list = [{"rate": 0.02 * (i + 1)} for i in range(4)]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        self.assertIs(solver._pool, pool)
+        for i, solution in enumerate(solutions):
+            self.assertEqual(solution.all_models, [model])
+            np.testing.assert_allclose(
+                solution.y[0], np.exp(-0.02 * (i + 1) * solution.t), rtol=1e-6
+            )
+
+        # Changing the number of processes creates a new pool
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNot(solver._pool, pool)
+
+        # ... and so does changing the settings of the solver, so that the workers
+        # use the new settings
+        pool = solver._pool
+        solver.rtol = solver.atol = 1e-3
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNot(solver._pool, pool)
+        for inputs, solution in zip(inputs_list, solutions):
+            expected = solver.solve(model, t_eval, inputs=inputs)
+            np.testing.assert_array_equal(solution.y, expected.y)
+        pool = solver._pool
+        solver.extra_options["max_step"] = 1
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNot(solver._pool, pool)
+
+        # Copies and pickles of the solver don't hold the pool
+        self.assertIsNone(solver.copy()._pool)
+        self.assertIsNone(pickle.loads(pickle.dumps(solver))._pool)
+
+        solver.close_pool()
+        self.assertIsNone(solver._pool)
+
     def test_model_solver_multiple_inputs_discontinuity_error(self):
         # Create model
         model = pybamm.BaseModel()
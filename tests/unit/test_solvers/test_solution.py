@@ -2,6 +2,7 @@
 # Tests for the Solution class
 #
 import json
+import pickle
 import pybamm
 import unittest
 import numpy as np
@@ -108,6 +109,63 @@ class TestSolution(unittest.TestCase):
         ):
             2 + sol3
 
+    def test_add_solutions_shared_segments(self):
+        def make_solution(t0, a):
+            t = np.linspace(t0, t0 + 1, 5)
+            sol = pybamm.Solution(t, np.tile(t, (2, 1)), pybamm.BaseModel(), {"a": a})
+            sol.solve_time = sol.integration_time = 0
+            return sol
+
+        sol1 = make_solution(0, 1)
+        sol2 = sol1 + make_solution(1, 2)
+        np.testing.assert_array_equal(sol2.t, np.linspace(0, 2, 9))
+        sol3 = sol2 + make_solution(2, 3)
+        # the segments are shared rather than copied
+        self.assertIs(sol3.all_ts[0], sol1.all_ts[0])
+        self.assertIs(sol3.sub_solutions[1], sol2.sub_solutions[1])
+        np.testing.assert_array_equal(sol3.t, np.linspace(0, 3, 13))
+        np.testing.assert_array_equal(sol3.y, np.tile(np.linspace(0, 3, 13), (2, 1)))
+        self.assertEqual(len(sol3.all_inputs), 3)
+        # the concatenated times are read-only, as they are shared
+        with self.assertRaises(ValueError):
+            sol3.t[0] = 1
+
+        # earlier solutions are unchanged
+        self.assertEqual(len(sol1.all_ts), 1)
+        self.assertEqual(len(sol2.all_ts), 2)
+        self.assertEqual(len(sol2.sub_solutions), 2)
+        np.testing.assert_array_equal(sol2.t, np.linspace(0, 2, 9))
+
+        # adding to an earlier solution does not change later solutions
+        sol4 = sol2 + make_solution(3, 4)
+        np.testing.assert_array_equal(
+            sol4.t, np.concatenate([np.linspace(0, 2, 9), np.linspace(3, 4, 5)])
+        )
+        np.testing.assert_array_equal(sol4.all_inputs[-1]["a"], 4)
+        np.testing.assert_array_equal(sol3.t, np.linspace(0, 3, 13))
+        np.testing.assert_array_equal(sol3.all_inputs[-1]["a"], 3)
+
+        # only the segments of a solution are pickled
+        sol2_loaded = pickle.loads(pickle.dumps(sol2))
+        self.assertEqual(len(sol2_loaded.all_ts), 2)
+        np.testing.assert_array_equal(sol2_loaded.t, sol2.t)
+
+        # segments with a wider dtype are not cast to the dtype of earlier segments
+        def make_int_solution(t):
+            t = np.array(t)
+            sol = pybamm.Solution(t, t[np.newaxis, :], pybamm.BaseModel(), {})
+            sol.solve_time = sol.integration_time = 0
+            return sol
+
+        sol = make_int_solution([0, 1]) + make_int_solution([2, 3])
+        np.testing.assert_array_equal(sol.t, [0, 1, 2, 3])
+        # the buffer now has space for the next segments
+        sol = sol + make_int_solution([4, 5])
+        np.testing.assert_array_equal(sol.t, [0, 1, 2, 3, 4, 5])
+        sol = sol + make_int_solution([6.5])
+        np.testing.assert_array_equal(sol.t, [0, 1, 2, 3, 4, 5, 6.5])
+        np.testing.assert_array_equal(sol.y, [[0, 1, 2, 3, 4, 5, 6.5]])
+
     def test_add_solutions_different_models(self):
         # Set up first solution
         t1 = np.linspace(0, 1)
@@ -221,6 +279,29 @@ class TestSolution(unittest.TestCase):
         np.testing.assert_array_equal(twoc_sol.entries, twoc_sol(solution.t))
         np.testing.assert_array_equal(twoc_sol.entries, 2 * c_sol.entries)
 
+    def test_max_cached_variables(self):
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c")
+        model.rhs = {c: -c}
+        model.initial_conditions = {c: 1}
+        model.variables = {"c": c, "2c": 2 * c, "3c": 3 * c}
+
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+        solution = pybamm.ScipySolver().solve(model, np.linspace(0, 1))
+        solution.max_cached_variables = 2
+
+        c_sol = solution["c"]
+        solution["2c"]
+        # using "c" again makes "2c" the least recently used variable
+        self.assertIs(solution["c"], c_sol)
+        solution["3c"]
+        self.assertEqual(list(solution.data.keys()), ["c", "3c"])
+        np.testing.assert_array_equal(solution.data["3c"], 3 * c_sol.entries)
+
+        # other solutions are not affected
+        self.assertIsNone(pybamm.Solution.max_cached_variables)
+
     def test_plot(self):
         model = pybamm.BaseModel()
         c = pybamm.Variable("c")
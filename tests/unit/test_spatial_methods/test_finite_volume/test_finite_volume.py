@@ -55,6 +55,55 @@ class TestFiniteVolume(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "method"):
             fin_vol.shift(c, "shift key", "bad method")
 
+    def test_operators_are_shared(self):
+        mesh = get_mesh_for_testing()
+        fin_vol = pybamm.FiniteVolume()
+        fin_vol.build(mesh)
+        domains = {"primary": ["negative electrode"]}
+        n = mesh["negative electrode"].npts
+
+        # the same operator is returned for the same domain and mesh
+        grad = fin_vol.gradient_matrix(["negative electrode"], domains)
+        self.assertIs(fin_vol.gradient_matrix(["negative electrode"], domains), grad)
+        self.assertIs(
+            fin_vol.divergence_matrix(domains), fin_vol.divergence_matrix(domains)
+        )
+        self.assertIsNot(
+            fin_vol.gradient_matrix(["separator"], {"primary": ["separator"]}), grad
+        )
+        c = pybamm.StateVector(slice(0, n), domain=["negative electrode"])
+        self.assertIs(
+            fin_vol.definite_integral_matrix(c), fin_vol.definite_integral_matrix(c)
+        )
+        self.assertIsNot(
+            fin_vol.definite_integral_matrix(c, vector_type="column"),
+            fin_vol.definite_integral_matrix(c),
+        )
+        self.assertIs(
+            fin_vol.indefinite_integral_matrix_edges(domains, "forward"),
+            fin_vol.indefinite_integral_matrix_edges(domains, "forward"),
+        )
+        self.assertIsNot(
+            fin_vol.indefinite_integral_matrix_edges(domains, "forward"),
+            fin_vol.indefinite_integral_matrix_edges(domains, "backward"),
+        )
+        d = pybamm.StateVector(slice(n, 2 * n), domain=["negative electrode"])
+        self.assertIs(
+            fin_vol.node_to_edge(c, "arithmetic").children[0],
+            fin_vol.node_to_edge(d, "arithmetic").children[0],
+        )
+        self.assertIs(
+            fin_vol.node_to_edge(c, "harmonic").children[0].children[0],
+            fin_vol.node_to_edge(d, "harmonic").children[0].children[0],
+        )
+
+        # building with the same mesh keeps the operators, but building with a
+        # different mesh does not
+        fin_vol.build(mesh)
+        self.assertIs(fin_vol.gradient_matrix(["negative electrode"], domains), grad)
+        fin_vol.build(get_mesh_for_testing())
+        self.assertIsNot(fin_vol.gradient_matrix(["negative electrode"], domains), grad)
+
     def test_concatenation(self):
         mesh = get_mesh_for_testing()
         fin_vol = pybamm.FiniteVolume()